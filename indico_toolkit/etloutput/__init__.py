@@ -1,36 +1,53 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from ..results import NULL_BOX, NULL_SPAN, Box, Span
 from ..results.utilities import get, has
+from .cache import EtlOutputCache
 from .cell import Cell, CellType
 from .errors import EtlOutputError, TableCellNotFoundError, TokenNotFoundError
 from .etloutput import EtlOutput
+from .jsonstream import close_payload
+from .lazy import LazySequence, MappedSequence
 from .range import Range
 from .table import Table
-from .token import Token
+from .token import NULL_TOKEN, Token
+from .tokencolumns import TokenColumns
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
-    from typing import Any
+    from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Executor
+    from typing import Any, Final
 
 __all__ = (
     "Box",
     "Cell",
     "CellType",
     "EtlOutput",
+    "EtlOutputCache",
     "EtlOutputError",
     "load",
     "load_async",
     "NULL_BOX",
     "NULL_SPAN",
+    "NULL_TOKEN",
     "Range",
     "Span",
     "Table",
     "TableCellNotFoundError",
     "Token",
+    "TokenColumns",
     "TokenNotFoundError",
 )
 
+# Page files read ahead of the page being decoded when reading on an executor.
+# Readers may return open file objects, so this bounds how many are open at once.
+READ_AHEAD: "Final" = 16
+
 
 def load(
     etl_output_uri: str,
@@ -39,12 +56,37 @@ def load(
     text: bool = True,
     tokens: bool = True,
     tables: bool = False,
+    executor: "Executor | None" = None,
+    workers: int = 1,
+    lazy: bool = False,
+    trusted: bool = False,
+    cache: "EtlOutputCache | None" = None,
 ) -> EtlOutput:
     """
     Load `etl_output_uri` as an ETL Output dataclass. A `reader` function must be
     supplied to read JSON files from disk, storage API, or Indico client.
 
     Use `text`, `tokens`, and `tables` to specify what to load.
+    Page files are read one at a time unless an `executor` is supplied or `workers`
+    is greater than 1, in which case they're read on a thread pool.
+
+    If `lazy`, token and table pages are read and parsed the first time they're
+    accessed rather than up front. `token_for()` and `table_cell_for()` only load
+    the pages they touch. (v1 page files contain both text and tokens, so they're
+    still read up front, but tokens are parsed lazily.)
+
+    If `trusted`, token and cell dictionaries are decoded without validating each
+    one. Only use it for ETL output files produced by the Indico platform.
+
+    If a `cache` is supplied, ETL outputs are loaded from it when possible and added
+    to it otherwise. `lazy` is ignored on cache misses because the whole ETL output
+    must be read to cache it.
+
+    `reader` may return v3 token files undecoded (as strings, bytes, or file
+    objects), in which case tokens are decoded incrementally and the list of token
+    dictionaries is never created. This lowers peak memory for dense pages. File
+    objects are owned by `load()`: token files are read as their pages are decoded,
+    and closed once they are.
 
     ```
     result = results.load(submission.result_file, reader=read_uri)
@@ -55,13 +97,75 @@ def load(
     }
     ```
     """
+    if workers < 1:
+        raise ValueError(f"workers must be positive, not {workers!r}")
+
+    if cache is not None:
+        etl_output = cache.get(etl_output_uri, text=text, tokens=tokens, tables=tables)
+
+        if etl_output is None:
+            etl_output = load(
+                etl_output_uri,
+                reader=reader,
+                text=text,
+                tokens=tokens,
+                tables=tables,
+                executor=executor,
+                workers=workers,
+                trusted=trusted,
+            )
+            cache.put(
+                etl_output_uri, etl_output, text=text, tokens=tokens, tables=tables
+            )
+
+        return etl_output
+
+    if executor is None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return load(
+                etl_output_uri,
+                reader=reader,
+                text=text,
+                tokens=tokens,
+                tables=tables,
+                executor=executor,
+                lazy=lazy,
+                trusted=trusted,
+            )
+
+    def read_files(uris: "list[str]") -> "Iterator[Any]":
+        if executor is None:
+            return map(reader, uris)
+        else:
+            return _read_ahead(executor, reader, uris)
+
     etl_output = reader(etl_output_uri)
     tables_uri = etl_output_uri.replace("etl_output.json", "tables.json")
 
     if has(etl_output, str, "pages", 0, "page_info"):
-        return _load_v1(etl_output, tables_uri, reader, text, tokens, tables)
+        return _load_v1(
+            etl_output,
+            tables_uri,
+            reader,
+            read_files,
+            text,
+            tokens,
+            tables,
+            lazy,
+            trusted,
+        )
     else:
-        return _load_v3(etl_output, tables_uri, reader, text, tokens, tables)
+        return _load_v3(
+            etl_output,
+            tables_uri,
+            reader,
+            read_files,
+            text,
+            tokens,
+            tables,
+            lazy,
+            trusted,
+        )
 
 
 async def load_async(
@@ -71,12 +175,33 @@ async def load_async(
     text: bool = True,
     tokens: bool = True,
     tables: bool = False,
+    max_concurrency: int = 8,
+    lazy: bool = False,
+    trusted: bool = False,
+    cache: "EtlOutputCache | None" = None,
 ) -> EtlOutput:
     """
     Load `etl_output_uri` as an ETL Output dataclass. A `reader` coroutine must be
     supplied to read JSON files from disk, storage API, or Indico client.
 
     Use `text`, `tokens`, and `tables` to specify what to load.
+    Page files are read concurrently, with at most `max_concurrency` reads in flight.
+
+    If `lazy`, token and table pages are parsed the first time they're accessed
+    rather than up front. Because `reader` is a coroutine, page files are still read
+    up front.
+
+    If `trusted`, token and cell dictionaries are decoded without validating each
+    one. Only use it for ETL output files produced by the Indico platform.
+
+    If a `cache` is supplied, ETL outputs are loaded from it when possible and added
+    to it otherwise. `lazy` is ignored on cache misses because the whole ETL output
+    must be read to cache it.
+
+    `reader` may return v3 token files undecoded (as strings, bytes, or file
+    objects), in which case tokens are decoded incrementally and the list of token
+    dictionaries is never created. This lowers peak memory for dense pages. File
+    objects are owned by `load_async()` and closed once their pages are decoded.
 
     ```
     result = await results.load_async(submission.result_file, reader=read_uri)
@@ -87,16 +212,53 @@ async def load_async(
     }
     ```
     """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be positive, not {max_concurrency!r}")
+
+    if cache is not None:
+        # Cache reads and writes are blocking file I/O, so they run in the default
+        # executor rather than stalling the event loop.
+        loop = asyncio.get_running_loop()
+        etl_output = await loop.run_in_executor(
+            None,
+            partial(cache.get, etl_output_uri, text=text, tokens=tokens, tables=tables),
+        )
+
+        if etl_output is None:
+            etl_output = await load_async(
+                etl_output_uri,
+                reader=reader,
+                text=text,
+                tokens=tokens,
+                tables=tables,
+                max_concurrency=max_concurrency,
+                trusted=trusted,
+            )
+            await loop.run_in_executor(
+                None,
+                partial(
+                    cache.put,
+                    etl_output_uri,
+                    etl_output,
+                    text=text,
+                    tokens=tokens,
+                    tables=tables,
+                ),
+            )
+
+        return etl_output
+
+    reader = _limit_concurrency(reader, max_concurrency)
     etl_output = await reader(etl_output_uri)
     tables_uri = etl_output_uri.replace("etl_output.json", "tables.json")
 
     if has(etl_output, str, "pages", 0, "page_info"):
         return await _load_v1_async(
-            etl_output, tables_uri, reader, text, tokens, tables
+            etl_output, tables_uri, reader, text, tokens, tables, lazy, trusted
         )
     else:
         return await _load_v3_async(
-            etl_output, tables_uri, reader, text, tokens, tables
+            etl_output, tables_uri, reader, text, tokens, tables, lazy, trusted
         )
 
 
@@ -104,55 +266,115 @@ def _load_v1(
     etl_output: "Any",
     tables_uri: str,
     reader: "Callable[..., Any]",
+    read_files: "Callable[[list[str]], Iterator[Any]]",
     text: bool,
     tokens: bool,
     tables: bool,
+    lazy: bool,
+    trusted: bool,
 ) -> EtlOutput:
-    if text or tokens:
-        pages = tuple(
-            reader(get(page, str, "page_info"))
-            for page in get(etl_output, list, "pages")
-        )
-        text_by_page = map(lambda page: get(page, str, "pages", 0, "text"), pages)
-        tokens_by_page = map(lambda page: get(page, list, "tokens"), pages)
-    else:
-        text_by_page = ()  # type: ignore[assignment]
-        tokens_by_page = ()  # type: ignore[assignment]
-
-    if tables:
-        tables_by_page = reader(tables_uri)
+    pages = get(etl_output, list, "pages")
+    page_uris = (
+        [get(page, str, "page_info") for page in pages] if text or tokens else []
+    )
+    tables_uris = [tables_uri] if tables and not lazy else []
+
+    files = list(read_files(page_uris + tables_uris))
+    page_infos = files[: len(page_uris)]
+    text_by_page = [get(page, str, "pages", 0, "text") for page in page_infos]
+    tokens_by_page = [get(page, list, "tokens") for page in page_infos]
+
+    if not tables:
+        tables_by_page: "Sequence[Any]" = ()
+    elif lazy:
+        tables_by_page = _read_tables_lazily(tables_uri, reader, pages)
     else:
-        tables_by_page = ()
+        tables_by_page = files[-1]
 
-    return EtlOutput.from_pages(text_by_page, tokens_by_page, tables_by_page)
+    return EtlOutput.from_pages(
+        text_by_page, tokens_by_page, tables_by_page, lazy=lazy, trusted=trusted
+    )
 
 
 def _load_v3(
     etl_output: "Any",
     tables_uri: str,
     reader: "Callable[..., Any]",
+    read_files: "Callable[[list[str]], Iterator[Any]]",
     text: bool,
     tokens: bool,
     tables: bool,
+    lazy: bool,
+    trusted: bool,
 ) -> EtlOutput:
     pages = get(etl_output, list, "pages")
-
-    if text or tokens:
-        text_by_page = map(lambda page: reader(get(page, str, "text")), pages)
+    text_uris = [get(page, str, "text") for page in pages] if text or tokens else []
+    token_uris = [get(page, str, "tokens") for page in pages] if tokens else []
+    text_by_page = list(read_files(text_uris))
+
+    if lazy:
+        tokens_by_page: "Iterable[Any]" = MappedSequence(token_uris, reader)
+        tables_by_page: "Sequence[Any]" = (
+            _read_tables_lazily(tables_uri, reader, pages) if tables else ()
+        )
     else:
-        text_by_page = ()  # type: ignore[assignment]
+        # Token files are read as they're decoded, so a reader that returns open
+        # files only has a few open at once.
+        tokens_by_page = read_files(token_uris)
+        tables_by_page = next(read_files([tables_uri])) if tables else ()
 
-    if tokens:
-        tokens_by_page = map(lambda page: reader(get(page, str, "tokens")), pages)
-    else:
-        tokens_by_page = ()  # type: ignore[assignment]
+    return EtlOutput.from_pages(
+        text_by_page, tokens_by_page, tables_by_page, lazy=lazy, trusted=trusted
+    )
 
-    if tables:
-        tables_by_page = reader(tables_uri)
-    else:
-        tables_by_page = ()
 
-    return EtlOutput.from_pages(text_by_page, tokens_by_page, tables_by_page)
+def _read_ahead(
+    executor: "Executor", reader: "Callable[..., Any]", uris: "Iterable[str]"
+) -> "Iterator[Any]":
+    """
+    Yield the result of `reader` for each of `uris` in order, reading at most
+    `READ_AHEAD` files ahead on `executor`. Files that were read but not yielded are
+    closed if iteration stops early.
+    """
+    uris = iter(uris)
+    futures = deque(executor.submit(reader, uri) for uri in islice(uris, READ_AHEAD))
+
+    try:
+        while futures:
+            file = futures.popleft().result()
+            futures.extend(executor.submit(reader, uri) for uri in islice(uris, 1))
+            yield file
+    finally:
+        for future in futures:
+            if not future.cancel() and future.exception() is None:
+                close_payload(future.result())
+
+
+def _read_tables_lazily(
+    tables_uri: str, reader: "Callable[..., Any]", pages: "list[Any]"
+) -> "Sequence[Any]":
+    """
+    Return a sequence of table dictionary lists by page that reads `tables_uri` the
+    first time any page is accessed.
+    """
+    tables_file = LazySequence((tables_uri,), reader)
+    page_nums = [get(page, int, "page_num") for page in pages]
+    return MappedSequence(page_nums, lambda page_num: tables_file[0][page_num])
+
+
+def _limit_concurrency(
+    reader: "Callable[..., Awaitable[Any]]", max_concurrency: int
+) -> "Callable[..., Awaitable[Any]]":
+    """
+    Wrap `reader` so that no more than `max_concurrency` reads are awaited at once.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limited_reader(uri: str) -> "Any":
+        async with semaphore:
+            return await reader(uri)
+
+    return limited_reader
 
 
 async def _load_v1_async(
@@ -162,24 +384,25 @@ async def _load_v1_async(
     text: bool,
     tokens: bool,
     tables: bool,
+    lazy: bool,
+    trusted: bool,
 ) -> EtlOutput:
-    if text or tokens:
-        pages = [
-            await reader(get(page, str, "page_info"))
-            for page in get(etl_output, list, "pages")
-        ]
-        text_by_page = map(lambda page: get(page, str, "pages", 0, "text"), pages)
-        tokens_by_page = map(lambda page: get(page, list, "tokens"), pages)
-    else:
-        text_by_page = ()  # type: ignore[assignment]
-        tokens_by_page = ()  # type: ignore[assignment]
+    pages = get(etl_output, list, "pages")
+    page_uris = (
+        [get(page, str, "page_info") for page in pages] if text or tokens else []
+    )
+    tables_uris = [tables_uri] if tables else []
 
-    if tables:
-        tables_by_page = await reader(tables_uri)
-    else:
-        tables_by_page = ()
+    # `gather()` returns results in argument order regardless of completion order.
+    files = await asyncio.gather(*map(reader, page_uris + tables_uris))
+    page_infos = files[: len(page_uris)]
+    text_by_page = [get(page, str, "pages", 0, "text") for page in page_infos]
+    tokens_by_page = [get(page, list, "tokens") for page in page_infos]
+    tables_by_page = files[-1] if tables else ()
 
-    return EtlOutput.from_pages(text_by_page, tokens_by_page, tables_by_page)
+    return EtlOutput.from_pages(
+        text_by_page, tokens_by_page, tables_by_page, lazy=lazy, trusted=trusted
+    )
 
 
 async def _load_v3_async(
@@ -189,22 +412,20 @@ async def _load_v3_async(
     text: bool,
     tokens: bool,
     tables: bool,
+    lazy: bool,
+    trusted: bool,
 ) -> EtlOutput:
     pages = get(etl_output, list, "pages")
-
-    if text or tokens:
-        text_by_page = [await reader(get(page, str, "text")) for page in pages]
-    else:
-        text_by_page = ()  # type: ignore[assignment]
-
-    if tokens:
-        tokens_by_page = [await reader(get(page, str, "tokens")) for page in pages]
-    else:
-        tokens_by_page = ()  # type: ignore[assignment]
-
-    if tables:
-        tables_by_page = await reader(tables_uri)
-    else:
-        tables_by_page = ()
-
-    return EtlOutput.from_pages(text_by_page, tokens_by_page, tables_by_page)
+    text_uris = [get(page, str, "text") for page in pages] if text or tokens else []
+    token_uris = [get(page, str, "tokens") for page in pages] if tokens else []
+    tables_uris = [tables_uri] if tables else []
+
+    # `gather()` returns results in argument order regardless of completion order.
+    files = await asyncio.gather(*map(reader, text_uris + token_uris + tables_uris))
+    text_by_page = files[: len(text_uris)]
+    tokens_by_page = files[len(text_uris) : len(text_uris) + len(token_uris)]
+    tables_by_page = files[-1] if tables else ()
+
+    return EtlOutput.from_pages(
+        text_by_page, tokens_by_page, tables_by_page, lazy=lazy, trusted=trusted
+    )
@@ -0,0 +1,325 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .. import jsonbackend
+from .etloutput import EtlOutput
+from .lazy import SliceSequence
+from .table import Table
+from .tokencolumns import TYPECODE, TokenColumns
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any
+
+    from ..results import Box
+    from .cell import Cell
+
+# Cache files start with a magic number, the format version, and the length of a JSON
+# header. The header is followed by UTF-8 document text, UTF-8 token text, and then
+# the raw bytes of each token column, which are memory-mapped when the file is loaded.
+MAGIC = b"ETLC"
+VERSION = 1
+PREFIX = struct.Struct("<4sII")
+COLUMNS = (
+    "text_offsets",
+    "pages",
+    "starts",
+    "ends",
+    "tops",
+    "lefts",
+    "rights",
+    "bottoms",
+)
+
+
+class EtlOutputCache:
+    """
+    An on-disk cache of parsed ETL outputs keyed by `etl_output_uri` and the `text`,
+    `tokens`, and `tables` flags they were loaded with.
+
+    Token columns are stored as raw integer arrays and memory-mapped when they're
+    loaded, so cache hits don't parse or copy them. When the cache grows beyond
+    `max_size` bytes, the least recently used entries are removed.
+
+    ```
+    cache = etloutput.EtlOutputCache("~/.cache/etloutput", max_size=2 * 1024**3)
+    etl_output = etloutput.load(uri, reader=read_uri, tables=True, cache=cache)
+    ```
+    """
+
+    def __init__(
+        self, directory: "str | os.PathLike[str]", max_size: int = 1024**3
+    ) -> None:
+        if max_size < 0:
+            raise ValueError(f"max_size must not be negative, not {max_size!r}")
+
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(
+        self, etl_output_uri: str, *, text: bool, tokens: bool, tables: bool
+    ) -> "EtlOutput | None":
+        """
+        Return the cached `EtlOutput` for `etl_output_uri` or `None` if there isn't
+        one. Unreadable cache files are removed.
+        """
+        path = self._path(etl_output_uri, text, tokens, tables)
+
+        try:
+            with path.open("rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        try:
+            etl_output = _decode(memoryview(buffer))
+        except (KeyError, IndexError, TypeError, ValueError, struct.error):
+            path.unlink(missing_ok=True)
+            return None
+
+        _touch(path)
+        return etl_output
+
+    def put(
+        self,
+        etl_output_uri: str,
+        etl_output: EtlOutput,
+        *,
+        text: bool,
+        tokens: bool,
+        tables: bool,
+    ) -> None:
+        """
+        Cache `etl_output` for `etl_output_uri` and evict the least recently used
+        entries if the cache is larger than `max_size`.
+        """
+        path = self._path(etl_output_uri, text, tokens, tables)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.writelines(_encode(etl_output))
+
+            # Replacing the entry atomically means concurrent readers never see a
+            # partially written file.
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        _touch(path)
+        self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove every cached `EtlOutput`.
+        """
+        for path in self.directory.glob("*.etl"):
+            path.unlink(missing_ok=True)
+
+    def _path(
+        self, etl_output_uri: str, text: bool, tokens: bool, tables: bool
+    ) -> Path:
+        # Keys use the standard library so that they don't change with the backend.
+        key = json.dumps([etl_output_uri, text, tokens, tables])
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.etl"
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in `max_size`.
+        """
+        entries = []
+
+        for path in self.directory.glob("*.etl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:  # Mapped files can't be removed on Windows.
+                continue
+
+            size -= entry_size
+
+
+def _touch(path: Path) -> None:
+    """
+    Mark `path` as recently used. Modification times are used to track recency
+    because access times are often disabled. They're set from the system clock
+    because file system timestamps can be too coarse to order entries.
+    """
+    now = time.time_ns()
+
+    try:
+        os.utime(path, ns=(now, now))
+    except OSError:
+        pass
+
+
+def _encode(etl_output: EtlOutput) -> "Iterable[bytes]":
+    """
+    Yield the chunks of a cache file for `etl_output`.
+    """
+    text_bytes = etl_output.text.encode()
+    tokens = _concatenate(etl_output.tokens_on_page)
+    token_text_bytes = tokens.text.encode()
+    header = jsonbackend.dumpb(
+        {
+            "byteorder": sys.byteorder,
+            "itemsize": tokens.pages.itemsize,
+            "text_on_page": list(map(len, etl_output.text_on_page)),
+            "text_bytes": len(text_bytes),
+            "token_text_bytes": len(token_text_bytes),
+            "tokens_on_page": [
+                len(page_tokens) for page_tokens in etl_output.tokens_on_page
+            ],
+            "tables_on_page": [
+                [_table_to_dict(table) for table in page_tables]
+                for page_tables in etl_output.tables_on_page
+            ],
+        }
+    )
+
+    yield PREFIX.pack(MAGIC, VERSION, len(header))
+    yield header
+    yield text_bytes
+    yield token_text_bytes
+    # Align the token columns so that they can be cast without copying.
+    yield bytes(
+        -(PREFIX.size + len(header) + len(text_bytes) + len(token_text_bytes)) % 8
+    )
+
+    for column in COLUMNS:
+        yield getattr(tokens, column).tobytes()
+
+
+def _decode(buffer: "memoryview") -> EtlOutput:
+    """
+    Create an `EtlOutput` from a cache file. Token columns are views of `buffer`.
+    Raise `ValueError` if it isn't a cache file this version can read.
+    """
+    magic, version, header_size = PREFIX.unpack_from(buffer)
+
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a compatible cache file")
+
+    offset = PREFIX.size
+    header = jsonbackend.loads(buffer[offset : offset + header_size])
+    offset += header_size
+
+    if (
+        header["byteorder"] != sys.byteorder
+        or header["itemsize"] != array(TYPECODE).itemsize
+    ):
+        raise ValueError("cache file written on an incompatible platform")
+
+    text = str(buffer[offset : offset + header["text_bytes"]], "utf-8")
+    offset += header["text_bytes"]
+    token_text = str(buffer[offset : offset + header["token_text_bytes"]], "utf-8")
+    offset += header["token_text_bytes"]
+    offset += -offset % 8
+
+    token_count = sum(header["tokens_on_page"])
+    columns = []
+
+    for column in COLUMNS:
+        count = token_count + 1 if column == "text_offsets" else token_count
+        size = count * header["itemsize"]
+        columns.append(buffer[offset : offset + size].cast(TYPECODE))
+        offset += size
+
+    if offset != len(buffer):
+        raise ValueError("cache file is truncated")
+
+    tokens = TokenColumns(token_text, *columns)
+    token_offsets = list(accumulate(header["tokens_on_page"], initial=0))
+    # Each page is followed by a newline separator, except the last.
+    text_offsets = list(
+        accumulate((length + 1 for length in header["text_on_page"]), initial=0)
+    )
+    tables_on_page = tuple(
+        tuple(Table.from_dict(table, trusted=True) for table in page_tables)
+        for page_tables in header["tables_on_page"]
+    )
+
+    return EtlOutput(
+        text=text,
+        text_on_page=SliceSequence(
+            text, text_offsets[:-1], [offset - 1 for offset in text_offsets[1:]]
+        ),
+        tokens=tokens,
+        tokens_on_page=tuple(
+            tokens[first:last] for first, last in zip(token_offsets, token_offsets[1:])
+        ),
+        tables=tuple(table for page_tables in tables_on_page for table in page_tables),
+        tables_on_page=tables_on_page,
+    )
+
+
+def _concatenate(tokens_on_page: "Sequence[TokenColumns]") -> TokenColumns:
+    """
+    Return the tokens from each page as one `TokenColumns`. Pages loaded eagerly are
+    already views of the same columns, but pages loaded lazily aren't.
+    """
+    texts = []
+    text_offsets = [0]
+    columns: "dict[str, array[int]]" = {
+        column: array(TYPECODE) for column in COLUMNS[1:]
+    }
+
+    for page_tokens in tokens_on_page:
+        first, last = page_tokens.text_offsets[0], page_tokens.text_offsets[-1]
+        base = text_offsets[-1] - first
+        texts.append(page_tokens.text[first:last])
+        text_offsets.extend(offset + base for offset in page_tokens.text_offsets[1:])
+
+        for column, values in columns.items():
+            values.frombytes(getattr(page_tokens, column).tobytes())
+
+    return TokenColumns("".join(texts), text_offsets, *columns.values())
+
+
+def _table_to_dict(table: Table) -> "dict[str, Any]":
+    return {
+        "page_num": table.box.page,
+        "position": _box_to_dict(table.box),
+        "num_rows": len(table.rows),
+        "num_columns": len(table.columns),
+        "cells": list(map(_cell_to_dict, table.cells)),
+    }
+
+
+def _cell_to_dict(cell: "Cell") -> "dict[str, Any]":
+    return {
+        "cell_type": cell.type.value,
+        "text": cell.text,
+        "position": _box_to_dict(cell.box),
+        "rows": list(cell.range.rows),
+        "columns": list(cell.range.columns),
+        "doc_offsets": [{"start": span.start, "end": span.end} for span in cell.spans],
+    }
+
+
+def _box_to_dict(box: "Box") -> "dict[str, int]":
+    return {"top": box.top, "left": box.left, "right": box.right, "bottom": box.bottom}
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from ..results import NULL_SPAN, Box, Span
 from ..results.utilities import get
 from .range import Range
 
+if TYPE_CHECKING:
+    from typing import Any
+
 
 class CellType(Enum):
     HEADER = "header"
@@ -29,19 +33,55 @@ class Cell:
         return self.spans[0] if self.spans else NULL_SPAN
 
     @staticmethod
-    def from_dict(cell: object, page: int) -> "Cell":
+    def from_dict(cell: object, page: int, *, trusted: bool = False) -> "Cell":
         """
         Create a `Cell` from a v1 or v3 cell dictionary.
+
+        If `trusted`, keys and value types aren't validated.
         """
-        get(cell, dict, "position")["page_num"] = page
+        if trusted:
+            return _cell_from_trusted_dict(cell, page)
 
-        for doc_offset in get(cell, list, "doc_offsets"):
-            doc_offset["page_num"] = page
+        position = get(cell, dict, "position")
 
         return Cell(
             type=CellType(get(cell, str, "cell_type")),
             text=get(cell, str, "text"),
-            box=Box.from_dict(get(cell, dict, "position")),
+            box=Box(
+                page=page,
+                top=get(position, int, "top"),
+                left=get(position, int, "left"),
+                right=get(position, int, "right"),
+                bottom=get(position, int, "bottom"),
+            ),
             range=Range.from_dict(cell),
-            spans=tuple(map(Span.from_dict, get(cell, list, "doc_offsets"))),
+            spans=tuple(
+                Span(
+                    page=page,
+                    start=get(doc_offset, int, "start"),
+                    end=get(doc_offset, int, "end"),
+                )
+                for doc_offset in get(cell, list, "doc_offsets")
+            ),
         )
+
+
+def _cell_from_trusted_dict(cell: "Any", page: int) -> Cell:
+    position = cell["position"]
+
+    return Cell(
+        type=CellType(cell["cell_type"]),
+        text=cell["text"],
+        box=Box(
+            page=page,
+            top=position["top"],
+            left=position["left"],
+            right=position["right"],
+            bottom=position["bottom"],
+        ),
+        range=Range.from_dict(cell, trusted=True),
+        spans=tuple(
+            Span(page=page, start=doc_offset["start"], end=doc_offset["end"])
+            for doc_offset in cell["doc_offsets"]
+        ),
+    )
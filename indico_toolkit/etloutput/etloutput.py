@@ -1,16 +1,21 @@
 import itertools
+import re
 from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import cached_property, partial
 from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from ..results import Box, Span
 from .errors import TableCellNotFoundError, TokenNotFoundError
+from .gridindex import GridIndex
+from .lazy import ChainSequence, LazySequence, SliceSequence
 from .table import Table
-from .token import Token
+from .token import NULL_TOKEN, Token
+from .tokencolumns import TokenColumns
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from .cell import Cell
 
@@ -18,39 +23,66 @@ if TYPE_CHECKING:
 @dataclass(frozen=True)
 class EtlOutput:
     text: str
-    text_on_page: "tuple[str, ...]"
+    text_on_page: "Sequence[str]"
 
-    tokens: "tuple[Token, ...]"
-    tokens_on_page: "tuple[tuple[Token, ...], ...]"
+    tokens: "Sequence[Token]"
+    tokens_on_page: "Sequence[TokenColumns]"
 
-    tables: "tuple[Table, ...]"
-    tables_on_page: "tuple[tuple[Table, ...], ...]"
+    tables: "Sequence[Table]"
+    tables_on_page: "Sequence[Sequence[Table]]"
 
     @staticmethod
     def from_pages(
         text_by_page: "Iterable[str]",
         token_dicts_by_page: "Iterable[Iterable[object]]",
         table_dicts_by_page: "Iterable[Iterable[object]]",
+        *,
+        lazy: bool = False,
+        trusted: bool = False,
     ) -> "EtlOutput":
         """
         Create an `EtlOutput` from v1 or v3 page lists.
+
+        Tokens are stored as `TokenColumns`, which only create `Token` objects when
+        they're accessed. Page text is stored once, as `text`, and `text_on_page`
+        slices it on access.
+
+        If `lazy`, token and table page lists must be sequences. Each page is only
+        accessed and parsed the first time `tokens_on_page[page]` or
+        `tables_on_page[page]` is, and is memoized afterward.
+
+        If `trusted`, token and table dictionaries are decoded without validating
+        each one. See `TokenColumns.from_pages()` and `Table.from_dict()`.
         """
-        text_by_page = tuple(text_by_page)
-        tokens_by_page = tuple(
-            tuple(sorted(map(Token.from_dict, token_dict_page), key=attrgetter("span")))
-            for token_dict_page in token_dicts_by_page
-        )
-        tables_by_page = tuple(
-            tuple(sorted(map(Table.from_dict, table_dict_page), key=attrgetter("box")))
-            for table_dict_page in table_dicts_by_page
-        )
+        text, text_on_page = _join_pages(text_by_page)
+
+        if lazy:
+            tokens_by_page: "Sequence[TokenColumns]" = LazySequence(
+                token_dicts_by_page,  # type: ignore[arg-type]
+                partial(TokenColumns.from_dicts, trusted=trusted),
+            )
+            tables_by_page: "Sequence[Sequence[Table]]" = LazySequence(
+                table_dicts_by_page,  # type: ignore[arg-type]
+                partial(_tables_from_dicts, trusted=trusted),
+            )
+            tokens: "Sequence[Token]" = ChainSequence(tokens_by_page)
+            tables: "Sequence[Table]" = ChainSequence(tables_by_page)
+        else:
+            tokens, tokens_by_page = TokenColumns.from_pages(
+                token_dicts_by_page, trusted=trusted
+            )
+            tables_by_page = tuple(
+                _tables_from_dicts(table_dicts, trusted=trusted)
+                for table_dicts in table_dicts_by_page
+            )
+            tables = tuple(itertools.chain.from_iterable(tables_by_page))
 
         return EtlOutput(
-            text="\n".join(text_by_page),
-            text_on_page=text_by_page,
-            tokens=tuple(itertools.chain.from_iterable(tokens_by_page)),
+            text=text,
+            text_on_page=text_on_page,
+            tokens=tokens,
             tokens_on_page=tokens_by_page,
-            tables=tuple(itertools.chain.from_iterable(tables_by_page)),
+            tables=tables,
             tables_on_page=tables_by_page,
         )
 
@@ -61,50 +93,321 @@ class EtlOutput:
         """
         try:
             tokens = self.tokens_on_page[span.page]
-            first = bisect_right(tokens, span.start, key=attrgetter("span.end"))
-            last = bisect_left(tokens, span.end, lo=first, key=attrgetter("span.start"))
-            tokens = tokens[first:last]
+            first = bisect_right(tokens.ends, span.start)
+            last = bisect_left(tokens.starts, span.end, lo=first)
 
             return Token(
                 text=self.text[span.slice],
                 span=span,
-                box=Box(
-                    page=min(token.box.page for token in tokens),
-                    top=min(token.box.top for token in tokens),
-                    left=min(token.box.left for token in tokens),
-                    right=max(token.box.right for token in tokens),
-                    bottom=max(token.box.bottom for token in tokens),
-                ),
+                box=tokens.bounding_box(first, last),
             )
         except (IndexError, ValueError) as error:
             raise TokenNotFoundError(f"no token contains {span!r}") from error
 
+    def tokens_for(self, spans: "Iterable[Span]") -> "tuple[Token, ...]":
+        """
+        Return a `Token` for each span in `spans`, like calling `token_for()` on each.
+        Spans that can't be resolved produce `NULL_TOKEN` rather than raising
+        `TokenNotFoundError`, which makes this considerably faster than calling
+        `token_for()` in a loop when many spans are empty or off the page.
+        """
+        text = self.text
+        tokens_on_page = self.tokens_on_page
+        page_count = len(tokens_on_page)
+        tokens_for_spans = []
+
+        for span in spans:
+            if not 0 <= span.page < page_count:
+                tokens_for_spans.append(NULL_TOKEN)
+                continue
+
+            tokens = tokens_on_page[span.page]
+            first = bisect_right(tokens.ends, span.start)
+            last = bisect_left(tokens.starts, span.end, lo=first)
+
+            if first < last:
+                tokens_for_spans.append(
+                    Token(
+                        text=text[span.slice],
+                        span=span,
+                        box=tokens.bounding_box(first, last),
+                    )
+                )
+            else:
+                tokens_for_spans.append(NULL_TOKEN)
+
+        return tuple(tokens_for_spans)
+
+    @cached_property
+    def _page_starts(self) -> "Sequence[int]":
+        """
+        The offset in `text` at which each page starts.
+        """
+        if isinstance(self.text_on_page, SliceSequence):
+            return self.text_on_page.starts
+
+        lengths = (len(page_text) + 1 for page_text in self.text_on_page)
+        return tuple(itertools.accumulate(lengths, initial=0))[:-1]
+
+    def search(self, pattern: "str | re.Pattern[str]") -> "tuple[Token, ...]":
+        """
+        Return a `Token` for each match of `pattern` in `text`, like calling
+        `token_for()` on each match from `re.finditer()`. Empty matches and matches
+        that don't overlap any tokens are skipped.
+        """
+        return self.search_many((pattern,))[pattern]
+
+    def search_many(
+        self, patterns: "Iterable[str | re.Pattern[str]]"
+    ) -> "dict[str | re.Pattern[str], tuple[Token, ...]]":
+        """
+        Return the tokens matched by each pattern in `patterns` like `search()`.
+        Spans for every match of every pattern are resolved to tokens at once with
+        `tokens_for()`.
+        """
+        text = self.text
+        page_starts = self._page_starts
+        spans_by_pattern = {
+            pattern: [
+                Span(
+                    page=bisect_right(page_starts, match.start()) - 1,
+                    start=match.start(),
+                    end=match.end(),
+                )
+                for match in re.finditer(pattern, text)
+                if match.start() != match.end()
+            ]
+            for pattern in patterns
+        }
+        tokens = iter(
+            self.tokens_for(itertools.chain.from_iterable(spans_by_pattern.values()))
+        )
+
+        return {
+            pattern: tuple(filter(None, itertools.islice(tokens, len(spans))))
+            for pattern, spans in spans_by_pattern.items()
+        }
+
+    @cached_property
+    def _token_grids_on_page(self) -> "Sequence[GridIndex]":
+        """
+        Spatial indexes over the tokens on each page, built the first time a page is
+        queried and reused afterward.
+        """
+        return LazySequence(self.tokens_on_page, _token_grid)
+
+    def tokens_in_box(self, box: Box, overlap: float = 0.5) -> "tuple[Token, ...]":
+        """
+        Return the tokens on `box.page` with at least `overlap` of their area inside
+        `box`, in span order. If `overlap` is 0, every token that touches `box` is
+        returned. If it's 1, only tokens completely inside `box` are.
+        """
+        if not 0 <= overlap <= 1:
+            raise ValueError(f"overlap must be between 0 and 1, not {overlap!r}")
+
+        if not 0 <= box.page < len(self.tokens_on_page):
+            return ()
+
+        tokens = self.tokens_on_page[box.page]
+        indexes = self._token_grids_on_page[box.page].overlapping(
+            box.top, box.left, box.right, box.bottom
+        )
+
+        if overlap > 0:
+            indexes = [
+                index for index in indexes if _overlap(tokens, index, box) >= overlap
+            ]
+
+        return tuple(map(tokens.__getitem__, indexes))
+
+    def tokens_in_range(self, start_span: Span, end_span: Span) -> "Sequence[Token]":
+        """
+        Return the tokens that overlap the characters from the start of `start_span`
+        to the end of `end_span`, which may be on different pages, in span order.
+        """
+        tokens_on_page = self.tokens_on_page
+        first_page = max(start_span.page, 0)
+        last_page = min(end_span.page, len(tokens_on_page) - 1)
+        tokens_in_range = []
+
+        for page in range(first_page, last_page + 1):
+            tokens = tokens_on_page[page]
+            first = (
+                bisect_right(tokens.ends, start_span.start)
+                if page == start_span.page
+                else 0
+            )
+            last = (
+                bisect_left(tokens.starts, end_span.end, lo=first)
+                if page == end_span.page
+                else len(tokens)
+            )
+
+            if first < last:
+                tokens_in_range.append(tokens[first:last])
+
+        return ChainSequence(tuple(tokens_in_range))
+
+    @cached_property
+    def _table_cells_on_page(self) -> "Sequence[_TableCellIndex]":
+        """
+        Spatial indexes over the tables and cells on each page, built the first time
+        a page is looked up and reused afterward.
+        """
+        return LazySequence(self.tables_on_page, _TableCellIndex)
+
+    def table_cell_for(self, token: Token) -> "tuple[Table, Cell]":
+        """
+        Return the `Table` and `Cell` that contain the midpoint of `token`.
+        Raise `TableCellNotFoundError` if it's not inside a table cell.
+
+        If the midpoint is inside a table but between its cells, the nearest cell of
+        that table is returned.
+        """
+        try:
+            index = self._table_cells_on_page[token.box.page]
+        except IndexError as error:
+            raise TableCellNotFoundError(f"no table contains {token!r}") from error
+
+        return index.table_cell_for(token)
+
+    def table_cells_for(
+        self, tokens: "Iterable[Token]"
+    ) -> "tuple[tuple[Table, Cell] | None, ...]":
+        """
+        Return the `Table` and `Cell` that contain the midpoint of each token in
+        `tokens`, or `None` for tokens that aren't inside a table cell.
+
+        Each page's spatial index is built once and reused for every token on it,
+        which makes this considerably faster than calling `table_cell_for()` in a
+        loop and catching `TableCellNotFoundError`.
+        """
+        indexes = self._table_cells_on_page
+        page_count = len(indexes)
+        table_cells: "list[tuple[Table, Cell] | None]" = []
+
+        for token in tokens:
+            if 0 <= token.box.page < page_count:
+                table_cells.append(indexes[token.box.page].find(token))
+            else:
+                table_cells.append(None)
+
+        return tuple(table_cells)
+
+
+class _TableCellIndex:
+    """
+    Grid indexes over the tables on a page and over all of their cells.
+
+    Cells are indexed in table order and then cell order, so the first cell that
+    contains a point belongs to the first table that does.
+    """
+
+    def __init__(self, tables: "Sequence[Table]") -> None:
+        self.tables = tables
+        self.table_cells = [(table, cell) for table in tables for cell in table.cells]
+        self.table_index = GridIndex.from_boxes(table.box for table in tables)
+        self.cell_index = GridIndex.from_boxes(cell.box for _, cell in self.table_cells)
+
+    def find(self, token: Token) -> "tuple[Table, Cell] | None":
+        """
+        Return the `Table` and `Cell` that contain the midpoint of `token`, the
+        nearest cell of the table that contains it, or `None` otherwise.
+        """
+        vmid = (token.box.top + token.box.bottom) // 2
+        hmid = (token.box.left + token.box.right) // 2
+
+        cells = self.cell_index.containing(vmid, hmid)
+
+        if cells:
+            return self.table_cells[cells[0]]
+
+        tables = self.table_index.containing(vmid, hmid)
+
+        if not tables or not self.tables[tables[0]].cells:
+            return None
+
+        table = self.tables[tables[0]]
+        cell = min(table.cells, key=partial(_distance, vmid=vmid, hmid=hmid))
+        return table, cell
+
     def table_cell_for(self, token: Token) -> "tuple[Table, Cell]":
         """
         Return the `Table` and `Cell` that contain the midpoint of `token`.
         Raise `TableCellNotFoundError` if it's not inside a table cell.
         """
-        token_vmid = (token.box.top + token.box.bottom) // 2
-        token_hmid = (token.box.left + token.box.right) // 2
+        table_cell = self.find(token)
+
+        if table_cell is not None:
+            return table_cell
+
+        vmid = (token.box.top + token.box.bottom) // 2
+        hmid = (token.box.left + token.box.right) // 2
 
-        for table in self.tables_on_page[token.box.page]:
-            if (
-                (table.box.top  <= token_vmid <= table.box.bottom) and
-                (table.box.left <= token_hmid <= table.box.right)
-            ):  # fmt: skip
-                break
+        if self.table_index.containing(vmid, hmid):
+            raise TableCellNotFoundError(f"no cell contains {token!r}")
         else:
             raise TableCellNotFoundError(f"no table contains {token!r}")
 
-        try:
-            row_index = bisect_left(
-                table.rows, token_vmid, key=lambda row: row[0].box.bottom
-            )
-            row = table.rows[row_index]
 
-            cell_index = bisect_left(row, token_hmid, key=attrgetter("box.right"))
-            cell = row[cell_index]
-        except (IndexError, ValueError) as error:
-            raise TableCellNotFoundError(f"no cell contains {token!r}") from error
+def _distance(cell: "Cell", vmid: int, hmid: int) -> int:
+    """
+    Return the taxicab distance from a point to the edges of `cell`'s box,
+    or 0 if the point is inside it.
+    """
+    return max(cell.box.top - vmid, 0, vmid - cell.box.bottom) + max(
+        cell.box.left - hmid, 0, hmid - cell.box.right
+    )
 
-        return table, cell
+
+def _join_pages(text_by_page: "Iterable[str]") -> "tuple[str, SliceSequence]":
+    """
+    Join page text with newlines. Return it and a view of each page's slice of it.
+    """
+    text_by_page = tuple(text_by_page)
+    text = "\n".join(text_by_page)
+    # Each page is followed by a newline separator, except the last.
+    offsets = tuple(
+        itertools.accumulate(
+            (len(page_text) + 1 for page_text in text_by_page), initial=0
+        )
+    )
+    starts = offsets[:-1]
+    ends = tuple(offset - 1 for offset in offsets[1:])
+    return text, SliceSequence(text, starts, ends)
+
+
+def _token_grid(tokens: TokenColumns) -> GridIndex:
+    return GridIndex(tokens.tops, tokens.lefts, tokens.rights, tokens.bottoms)
+
+
+def _overlap(tokens: TokenColumns, index: int, box: Box) -> float:
+    """
+    Return the fraction of token `index`'s area that's inside `box`. Tokens without
+    area are entirely inside any box they touch.
+    """
+    top, left = tokens.tops[index], tokens.lefts[index]
+    right, bottom = tokens.rights[index], tokens.bottoms[index]
+    area = (right - left) * (bottom - top)
+
+    if area <= 0:
+        return 1
+
+    inside = (min(right, box.right) - max(left, box.left)) * (
+        min(bottom, box.bottom) - max(top, box.top)
+    )
+    return inside / area
+
+
+def _tables_from_dicts(
+    table_dicts: "Iterable[object]", *, trusted: bool = False
+) -> "tuple[Table, ...]":
+    """
+    Create a page of `Table`s from v1 or v3 table dictionaries, sorted by box.
+    """
+    return tuple(
+        sorted(
+            (Table.from_dict(table, trusted=trusted) for table in table_dicts),
+            key=attrgetter("box"),
+        )
+    )
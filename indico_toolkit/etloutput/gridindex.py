@@ -0,0 +1,102 @@
+from math import isqrt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from ..results import Box
+
+
+class GridIndex:
+    """
+    A uniform grid over bounding boxes that finds the boxes containing a point or
+    overlapping a region without scanning all of them.
+
+    Each box is registered in every grid square it touches. Squares are sized so that
+    there's roughly one box per square on average. Results are box indexes in
+    ascending order.
+    """
+
+    def __init__(
+        self,
+        tops: "Sequence[int]",
+        lefts: "Sequence[int]",
+        rights: "Sequence[int]",
+        bottoms: "Sequence[int]",
+    ) -> None:
+        self.tops = tops
+        self.lefts = lefts
+        self.rights = rights
+        self.bottoms = bottoms
+        self._squares: "dict[tuple[int, int], list[int]]" = {}
+
+        count = len(tops)
+
+        if count:
+            self._extent = (min(tops), min(lefts), max(rights), max(bottoms))
+            height = max(1, self._extent[3] - self._extent[0])
+            width = max(1, self._extent[2] - self._extent[1])
+            self._size = max(1, isqrt(height * width // count))
+        else:
+            self._extent = (0, 0, 0, 0)
+            self._size = 1
+
+        size = self._size
+
+        for index in range(count):
+            for row in range(tops[index] // size, bottoms[index] // size + 1):
+                for column in range(lefts[index] // size, rights[index] // size + 1):
+                    self._squares.setdefault((row, column), []).append(index)
+
+    @staticmethod
+    def from_boxes(boxes: "Iterable[Box]") -> "GridIndex":
+        """
+        Create a `GridIndex` over `boxes`.
+        """
+        boxes = tuple(boxes)
+
+        return GridIndex(
+            tops=[box.top for box in boxes],
+            lefts=[box.left for box in boxes],
+            rights=[box.right for box in boxes],
+            bottoms=[box.bottom for box in boxes],
+        )
+
+    def containing(self, vertical: int, horizontal: int) -> "list[int]":
+        """
+        Return the indexes of boxes that contain the point, including their edges.
+        """
+        square = (vertical // self._size, horizontal // self._size)
+
+        return [
+            index
+            for index in self._squares.get(square, ())
+            if self.tops[index] <= vertical <= self.bottoms[index]
+            and self.lefts[index] <= horizontal <= self.rights[index]
+        ]
+
+    def overlapping(self, top: int, left: int, right: int, bottom: int) -> "list[int]":
+        """
+        Return the indexes of boxes that overlap the region, including their edges.
+        """
+        size = self._size
+        candidates: "set[int]" = set()
+        # Don't visit squares outside of the indexed boxes.
+        min_top, min_left, max_right, max_bottom = self._extent
+        first_row = max(top, min_top) // size
+        last_row = min(bottom, max_bottom) // size
+        first_column = max(left, min_left) // size
+        last_column = min(right, max_right) // size
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                candidates.update(self._squares.get((row, column), ()))
+
+        return sorted(
+            index
+            for index in candidates
+            if self.tops[index] <= bottom
+            and self.bottoms[index] >= top
+            and self.lefts[index] <= right
+            and self.rights[index] >= left
+        )
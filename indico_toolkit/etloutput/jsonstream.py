@@ -0,0 +1,144 @@
+import codecs
+import json
+from typing import TYPE_CHECKING
+
+from ..results import ResultError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import IO, Any, Union
+
+    from typing_extensions import TypeAlias, TypeGuard
+
+    Payload: TypeAlias = Union[str, bytes, bytearray, memoryview, IO[Any]]
+
+# Large enough to hold dozens of tokens, small enough not to matter for memory.
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+# Includes "" so that numbers at the end of the buffer are considered incomplete.
+NUMBER_CHARACTERS = ("", *"0123456789+-.eE")
+
+
+def is_payload(value: object) -> "TypeGuard[Payload]":
+    """
+    Check if `value` is an undecoded JSON payload rather than decoded JSON.
+    """
+    return isinstance(value, (str, bytes, bytearray, memoryview)) or hasattr(
+        value, "read"
+    )
+
+
+def close_payload(value: object) -> None:
+    """
+    Close `value` if it's a file object.
+    """
+    close = getattr(value, "close", None)
+
+    if callable(close):
+        close()
+
+
+def iter_json_array(
+    payload: "Payload",
+    chunk_size: int = CHUNK_SIZE,
+) -> "Iterator[Any]":
+    """
+    Yield each element of the JSON array in `payload` as it's decoded. `payload` may
+    be a string, UTF-8 bytes, or a text or binary file object.
+
+    Only the element being decoded and a chunk of the payload are held in memory at a
+    time, so the whole array never exists as a list.
+    """
+    chunks = _chunks(payload, chunk_size)
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    exhausted = False
+
+    def fill() -> bool:
+        """
+        Append the next chunk to the buffer, dropping what's been consumed.
+        Return `False` if the payload is exhausted.
+        """
+        nonlocal buffer, position, exhausted
+        chunk = next(chunks, None)
+
+        if chunk is None:
+            exhausted = True
+            return False
+
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def skip_whitespace() -> str:
+        """
+        Advance past whitespace and return the next character, or "" at the end.
+        """
+        nonlocal position
+
+        while True:
+            while position < len(buffer) and buffer[position] in WHITESPACE:
+                position += 1
+
+            if position < len(buffer) or not fill():
+                return buffer[position : position + 1]
+
+    if skip_whitespace() != "[":
+        raise ResultError("JSON payload is not an array")
+
+    position += 1
+
+    if skip_whitespace() == "]":
+        return
+
+    while True:
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            if exhausted or not fill():
+                raise ResultError(f"invalid JSON payload: {error}") from error
+            continue
+
+        # A number at the end of the buffer may continue in the next chunk.
+        if (
+            isinstance(value, (int, float))
+            and buffer[end : end + 1] in NUMBER_CHARACTERS
+            and not exhausted
+            and fill()
+        ):
+            continue
+
+        position = end
+        yield value
+        separator = skip_whitespace()
+
+        if separator == "]":
+            return
+        elif separator != ",":
+            raise ResultError(f"invalid JSON payload: expected ',' not {separator!r}")
+
+        position += 1
+        skip_whitespace()
+
+
+def _chunks(payload: "Payload", chunk_size: int) -> "Iterator[str]":
+    """
+    Yield `payload` as strings of roughly `chunk_size` characters.
+    """
+    if isinstance(payload, str):
+        yield payload
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        view = memoryview(payload)
+
+        for start in range(0, len(view), chunk_size):
+            yield decoder.decode(view[start : start + chunk_size])
+    else:
+        while chunk := payload.read(chunk_size):
+            yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+
+    yield decoder.decode(b"", final=True)
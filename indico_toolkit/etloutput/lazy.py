@@ -0,0 +1,174 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import cached_property
+from itertools import accumulate, chain
+from typing import TYPE_CHECKING, TypeVar, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any
+
+Item = TypeVar("Item")
+Value = TypeVar("Value")
+
+
+class SequenceView(Sequence[Value]):
+    """
+    Base class for read-only sequence views. Views compare equal to any other sequence
+    with equal items (including tuples) so that eagerly and lazily loaded ETL outputs
+    can be used interchangeably.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            left == right for left, right in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def _index(self, index: int) -> int:
+        """
+        Normalize a negative `index` and raise `IndexError` if it's out of range.
+        """
+        length = len(self)
+
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        return index
+
+
+class MappedSequence(SequenceView[Value]):
+    """
+    A sequence of `function(item)` for each item in `items`, computed every time an
+    index is accessed. Use `LazySequence` to compute each value at most once.
+    """
+
+    def __init__(
+        self, items: "Sequence[Item]", function: "Callable[[Item], Value]"
+    ) -> None:
+        self._items = items
+        self._function = function
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> Value: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "tuple[Value, ...]": ...
+
+    def __getitem__(self, index: "int | slice") -> "Value | tuple[Value, ...]":
+        if isinstance(index, slice):
+            return tuple(map(self.__getitem__, range(len(self))[index]))
+
+        return self._function(self._items[self._index(index)])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} items>)"
+
+
+class LazySequence(MappedSequence[Value]):
+    """
+    A sequence of `function(item)` for each item in `items`, computed the first time
+    an index is accessed and memoized afterward.
+    """
+
+    def __init__(
+        self, items: "Sequence[Item]", function: "Callable[[Item], Value]"
+    ) -> None:
+        super().__init__(items, function)
+        self._loaded: "dict[int, Value]" = {}
+
+    def __getitem__(self, index: "int | slice") -> "Any":
+        if isinstance(index, slice):
+            return tuple(map(self.__getitem__, range(len(self))[index]))
+
+        index = self._index(index)
+
+        try:
+            return self._loaded[index]
+        except KeyError:
+            value = self._loaded[index] = self._function(self._items[index])
+            return value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self._loaded)} of {len(self)} loaded>)"
+
+
+class ChainSequence(SequenceView[Value]):
+    """
+    A flat view over a sequence of sequences, such as tokens over tokens on page.
+    Inner sequences aren't accessed until the view is.
+    """
+
+    def __init__(self, sequences: "Sequence[Sequence[Value]]") -> None:
+        self._sequences = sequences
+
+    @cached_property
+    def _offsets(self) -> "list[int]":
+        return [0, *accumulate(map(len, self._sequences))]
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __iter__(self) -> "Iterator[Value]":
+        return chain.from_iterable(self._sequences)
+
+    @overload
+    def __getitem__(self, index: int) -> Value: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "tuple[Value, ...]": ...
+
+    def __getitem__(self, index: "int | slice") -> "Value | tuple[Value, ...]":
+        if isinstance(index, slice):
+            return tuple(map(self.__getitem__, range(len(self))[index]))
+
+        index = self._index(index)
+        sequence = bisect_right(self._offsets, index) - 1
+        return self._sequences[sequence][index - self._offsets[sequence]]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self._sequences)} sequences>)"
+
+
+class SliceSequence(SequenceView[str]):
+    """
+    A sequence of slices of one string, such as text on page over a document's text.
+    Slices are taken every time an index is accessed, so the text is only stored once.
+    """
+
+    def __init__(
+        self, text: str, starts: "Sequence[int]", ends: "Sequence[int]"
+    ) -> None:
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "tuple[str, ...]": ...
+
+    def __getitem__(self, index: "int | slice") -> "str | tuple[str, ...]":
+        if isinstance(index, slice):
+            return tuple(map(self.__getitem__, range(len(self))[index]))
+
+        index = self._index(index)
+        return self.text[self.starts[index] : self.ends[index]]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} slices>)"
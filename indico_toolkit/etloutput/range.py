@@ -13,12 +13,17 @@ class Range:
     columns: "tuple[int, ...]"
 
     @staticmethod
-    def from_dict(cell: object) -> "Range":
+    def from_dict(cell: object, *, trusted: bool = False) -> "Range":
         """
         Create a `Range` from a v1 or v3 cell dictionary.
+
+        If `trusted`, keys and value types aren't validated.
         """
-        rows = get(cell, list, "rows")
-        columns = get(cell, list, "columns")
+        if trusted:
+            rows, columns = cell["rows"], cell["columns"]  # type: ignore[index]
+        else:
+            rows = get(cell, list, "rows")
+            columns = get(cell, list, "columns")
 
         return Range(
             row=rows[0],
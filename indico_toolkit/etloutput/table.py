@@ -1,44 +1,106 @@
 from dataclasses import dataclass
+from functools import cached_property
 from operator import attrgetter
+from typing import TYPE_CHECKING, overload
 
-from ..results import Box
+from ..results import Box, ResultError
 from ..results.utilities import get
 from .cell import Cell
+from .lazy import SequenceView
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 @dataclass(frozen=True)
 class Table:
     box: Box
     cells: "tuple[Cell, ...]"
-    rows: "tuple[tuple[Cell, ...], ...]"
-    columns: "tuple[tuple[Cell, ...], ...]"
+    rows: "Sequence[tuple[Cell, ...]]"
+    columns: "Sequence[tuple[Cell, ...]]"
 
     @staticmethod
-    def from_dict(table: object) -> "Table":
+    def from_dict(table: object, *, trusted: bool = False) -> "Table":
         """
         Create a `Table` from a v1 or v3 table dictionary.
+
+        If `trusted`, only the table and its first cell are validated. The remaining
+        cells are assumed to have the same schema.
+
+        `rows` and `columns` are grouped from `cells` the first time either of them
+        is accessed.
         """
         page = get(table, int, "page_num")
-        get(table, dict, "position")["page_num"] = page
+        position = get(table, dict, "position")
+        cell_dicts = get(table, list, "cells")
 
-        cells = tuple(
-            sorted(
-                (Cell.from_dict(cell, page) for cell in get(table, list, "cells")),
-                key=attrgetter("range"),
-            )
-        )
-        rows = tuple(
-            tuple(cell for cell in cells if row in cell.range.rows)
-            for row in range(get(table, int, "num_rows"))
-        )
-        columns = tuple(
-            tuple(cell for cell in cells if column in cell.range.columns)
-            for column in range(get(table, int, "num_columns"))
-        )
+        if trusted and cell_dicts:
+            Cell.from_dict(cell_dicts[0], page)
+
+            try:
+                unsorted_cells = [
+                    Cell.from_dict(cell, page, trusted=True) for cell in cell_dicts
+                ]
+            except (KeyError, IndexError, TypeError, ValueError) as error:
+                raise ResultError(
+                    f"invalid trusted cell dictionary: {error!r}"
+                ) from error
+        else:
+            unsorted_cells = [Cell.from_dict(cell, page) for cell in cell_dicts]
+
+        cells = tuple(sorted(unsorted_cells, key=attrgetter("range")))
 
         return Table(
-            box=Box.from_dict(get(table, dict, "position")),
+            box=Box(
+                page=page,
+                top=get(position, int, "top"),
+                left=get(position, int, "left"),
+                right=get(position, int, "right"),
+                bottom=get(position, int, "bottom"),
+            ),
             cells=cells,
-            rows=rows,
-            columns=columns,
+            rows=_CellGroups(cells, get(table, int, "num_rows"), "rows"),
+            columns=_CellGroups(cells, get(table, int, "num_columns"), "columns"),
         )
+
+
+class _CellGroups(SequenceView["tuple[Cell, ...]"]):
+    """
+    The cells in each row or column of a table, grouped in a single pass over
+    `cells` the first time any group is accessed. Cells that span several rows or
+    columns are included in each of them.
+    """
+
+    def __init__(self, cells: "Sequence[Cell]", count: int, attribute: str) -> None:
+        self._cells = cells
+        self._count = count
+        self._attribute = attribute
+
+    @cached_property
+    def _groups(self) -> "tuple[tuple[Cell, ...], ...]":
+        groups: "list[list[Cell]]" = [[] for _ in range(self._count)]
+        indexes = attrgetter(f"range.{self._attribute}")
+
+        for cell in self._cells:
+            for index in indexes(cell):
+                if 0 <= index < self._count:
+                    groups[index].append(cell)
+
+        return tuple(map(tuple, groups))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> "tuple[Cell, ...]": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "tuple[tuple[Cell, ...], ...]": ...
+
+    def __getitem__(
+        self, index: "int | slice"
+    ) -> "tuple[Cell, ...] | tuple[tuple[Cell, ...], ...]":
+        return self._groups[index]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{self._count} {self._attribute}>)"
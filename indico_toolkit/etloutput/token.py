@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from ..results import Box, Span
+from ..results import NULL_BOX, NULL_SPAN, Box, Span
 from ..results.utilities import get
 
+if TYPE_CHECKING:
+    from typing import Any, Final
+
 
 @dataclass(frozen=True)
 class Token:
@@ -10,16 +14,60 @@ class Token:
     box: Box
     span: Span
 
+    def __bool__(self) -> bool:
+        return self != NULL_TOKEN
+
     @staticmethod
-    def from_dict(token: object) -> "Token":
+    def from_dict(token: object, *, trusted: bool = False) -> "Token":
         """
         Create a `Token` from a v1 or v3 token dictionary.
+
+        If `trusted`, keys and value types aren't validated.
         """
-        get(token, dict, "position")["page_num"] = get(token, int, "page_num")
-        get(token, dict, "doc_offset")["page_num"] = get(token, int, "page_num")
+        if trusted:
+            return _token_from_trusted_dict(token)
+
+        page = get(token, int, "page_num")
+        position = get(token, dict, "position")
+        doc_offset = get(token, dict, "doc_offset")
 
         return Token(
             text=get(token, str, "text"),
-            box=Box.from_dict(get(token, dict, "position")),
-            span=Span.from_dict(get(token, dict, "doc_offset")),
+            box=Box(
+                page=page,
+                top=get(position, int, "top"),
+                left=get(position, int, "left"),
+                right=get(position, int, "right"),
+                bottom=get(position, int, "bottom"),
+            ),
+            span=Span(
+                page=page,
+                start=get(doc_offset, int, "start"),
+                end=get(doc_offset, int, "end"),
+            ),
         )
+
+
+def _token_from_trusted_dict(token: "Any") -> Token:
+    page = token["page_num"]
+    position = token["position"]
+    doc_offset = token["doc_offset"]
+
+    return Token(
+        text=token["text"],
+        box=Box(
+            page=page,
+            top=position["top"],
+            left=position["left"],
+            right=position["right"],
+            bottom=position["bottom"],
+        ),
+        span=Span(page=page, start=doc_offset["start"], end=doc_offset["end"]),
+    )
+
+
+# It's more ergonomic to represent the lack of a token with a special null token object
+# rather than using `None` or raising an error. This lets bulk lookups like
+# `EtlOutput.tokens_for()` report spans they couldn't resolve without raising, while
+# still allowing you do a "None check" with `token == NULL_TOKEN` or `bool(token)`.
+NULL_TOKEN: "Final" = Token(text="", box=NULL_BOX, span=NULL_SPAN)
@@ -0,0 +1,296 @@
+from array import array
+from itertools import accumulate
+from operator import itemgetter
+from typing import TYPE_CHECKING, overload
+
+from ..results import Box, ResultError, Span
+from ..results.utilities import get
+from .jsonstream import close_payload, is_payload, iter_json_array
+from .lazy import SequenceView
+from .token import Token
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any, Final, Literal
+
+# Character offsets and pixel coordinates comfortably fit in 32-bit signed ints.
+TYPECODE: "Final[Literal['i']]" = "i"
+
+
+class TokenColumns(SequenceView[Token]):
+    """
+    A sequence of tokens stored as parallel integer columns rather than as `Token`
+    objects. Token text is stored in a single string with offsets.
+
+    `Token` objects are only created when tokens are indexed or iterated. Slicing
+    returns a `TokenColumns` view that shares the underlying columns. Lookups like
+    `EtlOutput.token_for()` operate on the columns directly.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        text_offsets: "Iterable[int]",
+        pages: "Iterable[int]",
+        starts: "Iterable[int]",
+        ends: "Iterable[int]",
+        tops: "Iterable[int]",
+        lefts: "Iterable[int]",
+        rights: "Iterable[int]",
+        bottoms: "Iterable[int]",
+    ) -> None:
+        self.text = text
+        self.text_offsets = _column(text_offsets)
+        self.pages = _column(pages)
+        self.starts = _column(starts)
+        self.ends = _column(ends)
+        self.tops = _column(tops)
+        self.lefts = _column(lefts)
+        self.rights = _column(rights)
+        self.bottoms = _column(bottoms)
+
+    @staticmethod
+    def from_dicts(
+        token_dicts: "Iterable[object]", *, trusted: bool = False
+    ) -> "TokenColumns":
+        """
+        Create `TokenColumns` for a page from v1 or v3 token dictionaries,
+        sorted by span. See `from_pages()` for `trusted`.
+        """
+        return TokenColumns.from_pages((token_dicts,), trusted=trusted)[0]
+
+    @staticmethod
+    def from_pages(
+        token_dicts_by_page: "Iterable[Iterable[object]]",
+        *,
+        trusted: bool = False,
+    ) -> "tuple[TokenColumns, tuple[TokenColumns, ...]]":
+        """
+        Create `TokenColumns` for a document from v1 or v3 token dictionaries by page.
+        Return the document's tokens and views of the same columns for each page.
+        Tokens are sorted by span within each page.
+
+        If `trusted`, only the first token on each page is validated. The remaining
+        tokens are assumed to have the same schema and are read a column at a time.
+
+        Pages may also be undecoded JSON payloads (strings, UTF-8 bytes, or file
+        objects), in which case tokens are decoded and added to the columns one at a
+        time without creating a list of token dictionaries. Each one is validated.
+        File objects are closed once their page is decoded, and pages are consumed
+        one at a time, so `token_dicts_by_page` can open each file as it's needed.
+        """
+        texts: "list[str]" = []
+        columns = tuple(array(TYPECODE) for _ in range(7))
+        page_offsets = [0]
+
+        for token_dicts in token_dicts_by_page:
+            first = len(texts)
+
+            if is_payload(token_dicts):
+                try:
+                    _extend(texts, columns, iter_json_array(token_dicts))
+                finally:
+                    close_payload(token_dicts)
+            elif trusted:
+                _extend_trusted(texts, columns, token_dicts)
+            else:
+                _extend(texts, columns, token_dicts)
+
+            _sort_page(texts, columns, first)
+            page_offsets.append(len(texts))
+
+        tokens = TokenColumns(
+            "".join(texts),
+            accumulate(map(len, texts), initial=0),
+            *columns,
+        )
+        tokens_on_page = tuple(
+            tokens[first:last]
+            for first, last in zip(page_offsets, page_offsets[1:])  # fmt: skip
+        )
+        return tokens, tokens_on_page
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    @overload
+    def __getitem__(self, index: int) -> Token: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TokenColumns": ...
+
+    def __getitem__(self, index: "int | slice") -> "Token | TokenColumns":
+        if isinstance(index, slice):
+            first, last, step = index.indices(len(self))
+
+            if step != 1:
+                raise ValueError("token columns can't be sliced with a step")
+
+            last = max(first, last)
+            return TokenColumns(
+                self.text,
+                self.text_offsets[first : last + 1],
+                self.pages[first:last],
+                self.starts[first:last],
+                self.ends[first:last],
+                self.tops[first:last],
+                self.lefts[first:last],
+                self.rights[first:last],
+                self.bottoms[first:last],
+            )
+
+        return self._token(self._index(index))
+
+    def __iter__(self) -> "Iterator[Token]":
+        return map(self._token, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} tokens>)"
+
+    def __reduce__(self) -> "tuple[Any, ...]":
+        """
+        Pickle and copy columns as arrays, because memoryviews can't be pickled.
+        Views that shared columns get their own copies.
+        """
+        return TokenColumns, (
+            self.text,
+            *(
+                array(TYPECODE, column)
+                for column in (
+                    self.text_offsets,
+                    self.pages,
+                    self.starts,
+                    self.ends,
+                    self.tops,
+                    self.lefts,
+                    self.rights,
+                    self.bottoms,
+                )
+            ),
+        )
+
+    def _token(self, index: int) -> Token:
+        page = self.pages[index]
+
+        return Token(
+            text=self.text[self.text_offsets[index] : self.text_offsets[index + 1]],
+            box=Box(
+                page=page,
+                top=self.tops[index],
+                left=self.lefts[index],
+                right=self.rights[index],
+                bottom=self.bottoms[index],
+            ),
+            span=Span(
+                page=page,
+                start=self.starts[index],
+                end=self.ends[index],
+            ),
+        )
+
+    def bounding_box(self, first: int, last: int) -> Box:
+        """
+        Return the `Box` that bounds tokens `first` through `last` (exclusive).
+        Raise `ValueError` if the range is empty.
+        """
+        if last - first == 1:
+            return Box(
+                page=self.pages[first],
+                top=self.tops[first],
+                left=self.lefts[first],
+                right=self.rights[first],
+                bottom=self.bottoms[first],
+            )
+
+        return Box(
+            page=min(self.pages[first:last]),
+            top=min(self.tops[first:last]),
+            left=min(self.lefts[first:last]),
+            right=max(self.rights[first:last]),
+            bottom=max(self.bottoms[first:last]),
+        )
+
+
+def _column(values: "Iterable[int]") -> "memoryview":
+    """
+    Return `values` as a memoryview of ints, which can be sliced without copying.
+    """
+    if isinstance(values, memoryview):
+        return values
+    elif isinstance(values, array):
+        return memoryview(values)
+    else:
+        return memoryview(array(TYPECODE, values))
+
+
+def _extend(
+    texts: "list[str]",
+    columns: "tuple[array[int], ...]",
+    token_dicts: "Iterable[object]",
+) -> None:
+    """
+    Append a page of token dictionaries to `texts` and `columns`, validating each.
+    """
+    pages, starts, ends, tops, lefts, rights, bottoms = columns
+
+    for token in token_dicts:
+        position = get(token, dict, "position")
+        doc_offset = get(token, dict, "doc_offset")
+        texts.append(get(token, str, "text"))
+        pages.append(get(token, int, "page_num"))
+        starts.append(get(doc_offset, int, "start"))
+        ends.append(get(doc_offset, int, "end"))
+        tops.append(get(position, int, "top"))
+        lefts.append(get(position, int, "left"))
+        rights.append(get(position, int, "right"))
+        bottoms.append(get(position, int, "bottom"))
+
+
+def _extend_trusted(
+    texts: "list[str]",
+    columns: "tuple[array[int], ...]",
+    token_dicts: "Iterable[Any]",
+) -> None:
+    """
+    Append a page of token dictionaries to `texts` and `columns` after validating
+    only the first one.
+    """
+    pages, starts, ends, tops, lefts, rights, bottoms = columns
+    token_dicts = list(token_dicts)
+
+    if token_dicts:
+        Token.from_dict(token_dicts[0])
+
+    try:
+        positions = list(map(itemgetter("position"), token_dicts))
+        doc_offsets = list(map(itemgetter("doc_offset"), token_dicts))
+        texts.extend(map(itemgetter("text"), token_dicts))
+        pages.extend(map(itemgetter("page_num"), token_dicts))
+        starts.extend(map(itemgetter("start"), doc_offsets))
+        ends.extend(map(itemgetter("end"), doc_offsets))
+        tops.extend(map(itemgetter("top"), positions))
+        lefts.extend(map(itemgetter("left"), positions))
+        rights.extend(map(itemgetter("right"), positions))
+        bottoms.extend(map(itemgetter("bottom"), positions))
+    except (KeyError, TypeError) as error:
+        raise ResultError(f"invalid trusted token dictionary: {error!r}") from error
+
+
+def _sort_page(
+    texts: "list[str]", columns: "tuple[array[int], ...]", first: int
+) -> None:
+    """
+    Sort the tokens from `first` onward by span in place. OCR tokens are almost
+    always in span order already, so only reorder the columns if they aren't.
+    """
+    pages, starts, ends = columns[:3]
+    spans = list(zip(pages[first:], starts[first:], ends[first:]))
+
+    if all(spans[index] <= spans[index + 1] for index in range(len(spans) - 1)):
+        return
+
+    order = sorted(range(len(spans)), key=spans.__getitem__)
+    texts[first:] = [texts[first + index] for index in order]
+
+    for column in columns:
+        column[first:] = array(TYPECODE, [column[first + index] for index in order])
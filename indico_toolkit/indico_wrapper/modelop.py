@@ -1,9 +1,10 @@
 from indico import IndicoClient
 from indico.queries import GraphQLRequest
-import json
 import string
 from typing import Iterator
 
+from indico_toolkit import jsonbackend
+
 # valid model option parameters
 TEXT_EXTRACTION_PARAMS = {
     "max_empty_chunk_ratio": lambda value: 0 <= value <= 1.0e5,
@@ -93,7 +94,7 @@ class ModelOp:
         )
 
         for model in response["modelGroup"]["models"]:
-            model_options = json.loads(model["modelOptions"])
+            model_options = jsonbackend.loads(model["modelOptions"])
             model_options["id"] = model["id"]
             yield model_options
 
@@ -161,13 +162,13 @@ class ModelOp:
                 """,
                 {
                     "modelGroupId": model_group_id,
-                    "modelTrainingOptions": json.dumps(
+                    "modelTrainingOptions": jsonbackend.dumps(
                         self._parameter_check(model_type, **model_training_options)
                     ),
                 },
             )
         )
-        options = json.loads(
+        options = jsonbackend.loads(
             model["updateModelGroupSettings"]["modelOptions"]["modelTrainingOptions"]
         )
         options["id"] = model["updateModelGroupSettings"]["modelOptions"]["id"]
@@ -1,6 +1,6 @@
-import json
 import time
 from indico import IndicoClient
+from indico_toolkit import jsonbackend
 from indico_toolkit.indico_wrapper import Workflow
 
 
@@ -29,7 +29,7 @@ class Reviewer(Workflow):
             {
                 "rejected": False,
                 "submissionId": submission_id,
-                "changes": json.dumps(changes),
+                "changes": jsonbackend.dumps(changes),
             },
         )
 
@@ -0,0 +1,177 @@
+"""
+A JSON facade that uses orjson or ujson when either is installed and falls back to
+the standard library otherwise. Values load and dump as they do with the standard
+library on every backend, though whitespace in serialized output differs: documents
+with `NaN` or `Infinity`, integers wider than 64 bits, and values the fast backend
+rejects are handled by the standard library instead.
+"""
+
+import json
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import IO, Any, Callable
+
+BACKENDS = ("orjson", "ujson", "json")
+
+# Integers of 19 or more digits may be too wide for 64 bits, which fast backends load
+# as lossy floats or reject. Documents that may have one are loaded with the standard
+# library. To find them with `find()`, digits are mapped to "0" and the characters
+# that can come before a number are mapped to " ". Digits after a decimal point,
+# such as long confidence fractions, aren't preceded by " " and are skipped.
+WIDE_INTEGER_DIGITS = 19
+NUMBER_START = b":[,- \t\n\r"
+NUMBER_TRANSLATION = bytes.maketrans(
+    b"0123456789" + NUMBER_START, b"0" * 10 + b" " * len(NUMBER_START)
+)
+# Characters that can follow a number after translation. Long digit runs in strings,
+# such as IDs, are usually followed by a quote or more text instead.
+NUMBER_END = frozenset(b" ]}")
+
+_loads: "Callable[[Any], Any]"
+_dumpb: "Callable[[Any], bytes]"
+backend: str
+
+
+def loads(data: "str | bytes | bytearray | memoryview") -> "Any":
+    """
+    Deserialize a JSON document from a string or UTF-8 bytes.
+    """
+    if backend == "json":
+        return _stdlib_loads(data)
+
+    if not _may_have_wide_integer(data):
+        try:
+            return _loads(data)
+        except ValueError:  # Possibly `NaN` or `Infinity`, which only stdlib accepts.
+            pass
+
+    return _stdlib_loads(data)
+
+
+def load(file: "IO[Any]") -> "Any":
+    """
+    Deserialize a JSON document from a text or binary file object.
+    """
+    return loads(file.read())
+
+
+def dumps(value: object) -> str:
+    """
+    Serialize `value` to a JSON string.
+    """
+    return _dumpb(value).decode()
+
+
+def dumpb(value: object) -> bytes:
+    """
+    Serialize `value` to UTF-8 JSON bytes, which avoids decoding with orjson.
+    """
+    return _dumpb(value)
+
+
+def use(name: str) -> None:
+    """
+    Switch to the `name` backend, which must be one of `BACKENDS`.
+    Raise `ImportError` if it isn't installed.
+    """
+    global _loads, _dumpb, backend
+
+    if name == "orjson":
+        import orjson
+
+        def orjson_dumpb(value: object) -> bytes:
+            try:
+                data = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:  # Unsupported types, such as integers over 64 bits.
+                return _stdlib_dumpb(value)
+
+            # orjson writes non-finite floats as `null`, so only look for them if
+            # there's a `null` they could be hiding in.
+            if b"null" in data and _has_non_finite_float(value):
+                return _stdlib_dumpb(value)
+
+            return data
+
+        _loads, _dumpb = orjson.loads, orjson_dumpb
+    elif name == "ujson":
+        import ujson  # type: ignore[import]
+
+        def ujson_loads(data: "str | bytes | bytearray | memoryview") -> "Any":
+            return ujson.loads(data if isinstance(data, (str, bytes)) else bytes(data))
+
+        def ujson_dumpb(value: object) -> bytes:
+            try:
+                return ujson.dumps(value, escape_forward_slashes=False).encode()
+            except (TypeError, OverflowError):
+                return _stdlib_dumpb(value)
+
+        _loads, _dumpb = ujson_loads, ujson_dumpb
+    elif name == "json":
+        _loads, _dumpb = _stdlib_loads, _stdlib_dumpb
+    else:
+        raise ValueError(f"unsupported JSON backend {name!r}, use one of {BACKENDS}")
+
+    backend = name
+
+
+def _stdlib_loads(data: "str | bytes | bytearray | memoryview") -> "Any":
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _stdlib_dumpb(value: object) -> bytes:
+    return json.dumps(value).encode()
+
+
+def _may_have_wide_integer(data: "str | bytes | bytearray | memoryview") -> bool:
+    """
+    Check if `data` may have an integer too wide for 64 bits.
+    """
+    # A leading " " lets a number at the start of `data` be found too.
+    payload = data.encode() if isinstance(data, str) else data
+    translated = (b" " + payload).translate(NUMBER_TRANSLATION)
+
+    run = b" " + b"0" * WIDE_INTEGER_DIGITS
+    position = translated.find(run)
+
+    while position != -1:
+        end = position + len(run)
+
+        while end < len(translated) and translated[end] == ord("0"):
+            end += 1
+
+        if end == len(translated) or translated[end] in NUMBER_END:
+            return True
+
+        position = translated.find(run, end)
+
+    return False
+
+
+def _has_non_finite_float(value: object) -> bool:
+    """
+    Check if `value` is or contains `NaN`, `Infinity`, or `-Infinity`.
+    """
+    values = [value]
+
+    while values:
+        value = values.pop()
+
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            values.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            values.extend(value)
+
+    return False
+
+
+for _name in BACKENDS:
+    try:
+        use(_name)
+        break
+    except ImportError:
+        continue
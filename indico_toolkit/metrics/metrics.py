@@ -1,10 +1,9 @@
-import json
 import pandas as pd
 from typing import List, Dict
 from indico import IndicoClient
 
 from indico_toolkit.indico_wrapper import IndicoWrapper
-from indico_toolkit import ToolkitInputError
+from indico_toolkit import ToolkitInputError, jsonbackend
 from .plotting import Plotting
 
 
@@ -49,7 +48,7 @@ class ExtractionMetrics(IndicoWrapper):
         ]
         self.included_models = [model["id"] for model in self.raw_metrics]
         self.number_of_samples = {
-            model["id"]: int(json.loads(model["modelInfo"])["number_of_examples"])
+            model["id"]: int(jsonbackend.loads(model["modelInfo"])["number_of_examples"])
             for model in self.raw_metrics
         }
 
@@ -215,7 +214,7 @@ class UnbundlingMetrics(ExtractionMetrics):
         included_models = []
         labeled_samples = []
         for r in results:
-            model_info = json.loads(r["modelInfo"])
+            model_info = jsonbackend.loads(r["modelInfo"])
             if "total_number_of_examples" not in model_info or "metrics" not in model_info:
                 # some dictionaries don't come back with required fields... 
                 continue
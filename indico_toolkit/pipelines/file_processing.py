@@ -1,11 +1,12 @@
 import os
-import json
 from os.path import isfile, isdir
 from pathlib import Path
 from typing import List, Tuple, Union, Iterable
 import shutil
 import tempfile
 
+from indico_toolkit import jsonbackend
+
 class FileProcessing:
     """
     Class to support common file processing operations
@@ -88,8 +89,8 @@ class FileProcessing:
 
     @staticmethod
     def read_json(path_to_json: str) -> Union[dict, list]:
-        with open(path_to_json, "r") as f:
-            return json.load(f)
+        with open(path_to_json, "rb") as f:
+            return jsonbackend.load(f)
 
     @staticmethod
     def file_exists(path_to_file: str) -> bool:
@@ -11,7 +11,7 @@ from indico.queries import (  # type: ignore[import-untyped]
     SubmitReview,
 )
 
-from .. import etloutput, results
+from .. import etloutput, jsonbackend, results
 from ..etloutput import EtlOutput
 from ..results import Document, Result
 from ..retry import retry
@@ -30,7 +30,8 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class AutoReviewed:
-    changes: "dict[str, Any] | list[dict[str, Any]]"
+    # May be serialized with `PredictionList.to_changes(result, serialize=True)`.
+    changes: "dict[str, Any] | list[dict[str, Any]] | str"
     reject: bool = False
     stp: bool = False
 
@@ -168,10 +169,17 @@ class AutoReviewPoller:
         auto_reviewed = await self._auto_review(result, etl_outputs)
 
         logger.info(f"Submitting auto review for {submission_id=}")
+        changes = auto_reviewed.changes
         job = await self._client_call(
             SubmitReview(
                 submission_id,
-                changes=auto_reviewed.changes,
+                # Serialize with the fastest available JSON backend rather than
+                # letting `SubmitReview` use the standard library.
+                changes=(
+                    jsonbackend.dumps(changes)
+                    if changes and not isinstance(changes, str)
+                    else changes
+                ),
                 rejected=auto_reviewed.reject,
                 force_complete=auto_reviewed.stp,
             )
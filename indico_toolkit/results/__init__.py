@@ -1,6 +1,18 @@
-import json
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
+from .. import jsonbackend
+from . import frames
+from .diff import (
+    PredictionDiff,
+    review_diff_counts,
+    review_key,
+    review_location,
+    review_value,
+)
 from .document import Document
 from .errors import ResultError
 from .model import ModelGroup, ModelGroupType
@@ -26,7 +38,15 @@ from .review import Review, ReviewType
 from .utilities import get
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterable,
+        Iterator,
+    )
+    from concurrent.futures import Executor, Future
+    from typing import Any
 
 
 __all__ = (
@@ -40,19 +60,28 @@ __all__ = (
     "Group",
     "load",
     "load_async",
+    "load_many",
+    "load_many_async",
     "ModelGroup",
     "ModelGroupType",
     "NULL_BOX",
     "NULL_CITATION",
     "NULL_SPAN",
     "Prediction",
+    "PredictionDiff",
     "PredictionList",
     "Result",
     "ResultError",
+    "review_diff_counts",
+    "review_key",
+    "review_location",
+    "review_value",
     "Review",
     "ReviewType",
     "Span",
     "Summarization",
+    "to_arrow",
+    "to_frame",
     "Unbundling",
 )
 
@@ -90,9 +119,231 @@ async def load_async(
     return _load(result)
 
 
+def load_many(
+    results: "Iterable[object]",
+    *,
+    reader: "Callable[..., object] | None" = None,
+    executor: "Executor | None" = None,
+    workers: int = 1,
+    ordered: bool = True,
+) -> "Iterator[tuple[object, Result | Exception]]":
+    """
+    Load each of `results` as a Result dataclass and yield `(result, loaded)` pairs,
+    where `loaded` is the `Result` or the exception raised while reading or loading
+    it. A failure doesn't stop the remaining results from loading.
+
+    Results are loaded one at a time unless an `executor` is supplied or `workers`
+    is greater than 1, in which case they're read and loaded on a process pool.
+    `reader` must be picklable to use a process pool, such as a module-level function
+    or `Path.read_text`. At most `2 * workers` results are in flight at once, so
+    `results` is consumed lazily. Pass the size of a supplied `executor` as `workers`
+    to keep it busy.
+
+    Pairs are yielded in the order of `results`, or in the order they finish loading
+    if not `ordered`.
+
+    ```
+    for result_file, result in results.load_many(
+        result_folder.glob("*.json"), reader=Path.read_text, workers=8
+    ):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to load {result_file}: {result!r}")
+    ```
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be positive, not {workers!r}")
+
+    return _load_many(
+        results, reader=reader, executor=executor, workers=workers, ordered=ordered
+    )
+
+
+async def load_many_async(
+    results: "Iterable[object]",
+    *,
+    reader: "Callable[..., Awaitable[object]] | None" = None,
+    executor: "Executor | None" = None,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> "AsyncIterator[tuple[object, Result | Exception]]":
+    """
+    Load each of `results` as a Result dataclass and yield `(result, loaded)` pairs,
+    where `loaded` is the `Result` or the exception raised while reading or loading
+    it. A failure doesn't stop the remaining results from loading.
+
+    Results are read concurrently, with at most `max_concurrency` in flight. They're
+    loaded on the event loop unless an `executor` is supplied, such as a
+    `ProcessPoolExecutor`, which keeps parsing from blocking other reads.
+
+    Pairs are yielded in the order of `results`, or in the order they finish loading
+    if not `ordered`.
+
+    ```
+    async for submission, result in results.load_many_async(
+        submissions, reader=read_result_file, max_concurrency=16
+    ):
+        ...
+    ```
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be positive, not {max_concurrency!r}")
+
+    loop = asyncio.get_running_loop()
+    sources = iter(results)
+    # Dictionaries preserve insertion order, so the first pending task is the
+    # earliest result that hasn't been yielded.
+    pending: "dict[asyncio.Future[Result], object]" = {}
+
+    async def load_one(result: object) -> Result:
+        if reader:
+            result = await reader(result)
+
+        if executor is None:
+            return _load(result)
+        else:
+            return await loop.run_in_executor(executor, _load, result)
+
+    def start(count: int) -> None:
+        for result in islice(sources, count):
+            pending[asyncio.ensure_future(load_one(result))] = result
+
+    start(max_concurrency)
+
+    try:
+        while pending:
+            if ordered:
+                done: "Iterable[asyncio.Future[Result]]" = (next(iter(pending)),)
+                await asyncio.wait(done)
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+            for task in done:
+                yield pending.pop(task), _outcome(task)
+
+            start(max_concurrency - len(pending))
+    finally:
+        for task in pending:
+            task.cancel()
+
+        # Wait for cancelled tasks to finish so none outlive the generator.
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def to_frame(
+    results: "Iterable[Result]",
+    *,
+    predictions: "Callable[[Result], Iterable[Prediction]]" = attrgetter("predictions"),
+) -> "Any":
+    """
+    Create a pandas `DataFrame` with a row for each prediction of `results`, starting
+    with a `submission_id` column. It has the same columns as
+    `PredictionList.to_frame()` otherwise. Results are added to the same columns
+    rather than creating and concatenating a frame per result.
+
+    Use `predictions` to select which predictions of each result to include.
+    Raise `ImportError` if pandas isn't installed.
+
+    ```
+    frame = results.to_frame(
+        (result for _, result in results.load_many(result_files, reader=Path.read_text)),
+        predictions=attrgetter("final"),
+    )
+    ```
+    """
+    return frames.to_pandas(frames.result_columns(results, predictions))
+
+
+def to_arrow(
+    results: "Iterable[Result]",
+    *,
+    predictions: "Callable[[Result], Iterable[Prediction]]" = attrgetter("predictions"),
+) -> "Any":
+    """
+    Create a pyarrow `Table` with the same columns as `to_frame()`.
+    Raise `ImportError` if pyarrow isn't installed.
+    """
+    return frames.to_arrow(frames.result_columns(results, predictions))
+
+
+def _load_many(
+    results: "Iterable[object]",
+    *,
+    reader: "Callable[..., object] | None",
+    executor: "Executor | None",
+    workers: int,
+    ordered: bool,
+) -> "Iterator[tuple[object, Result | Exception]]":
+    """
+    Yield `(result, loaded)` pairs for `load_many()` once its arguments are checked.
+    """
+    if executor is None and workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            yield from _load_many(
+                results,
+                reader=reader,
+                executor=executor,
+                workers=workers,
+                ordered=ordered,
+            )
+        finally:
+            # Don't start loads that won't be consumed if iteration stops early.
+            executor.shutdown(cancel_futures=True)
+
+        return
+
+    if executor is None:
+        for result in results:
+            loaded: "Result | Exception"
+
+            try:
+                loaded = load(result, reader=reader)
+            except Exception as error:
+                loaded = error
+
+            yield result, loaded
+
+        return
+
+    sources = iter(results)
+    # Dictionaries preserve insertion order, so the first pending future is the
+    # earliest result that hasn't been yielded.
+    pending: "dict[Future[Result], object]" = {}
+
+    def submit(count: int) -> None:
+        for result in islice(sources, count):
+            pending[executor.submit(load, result, reader=reader)] = result
+
+    submit(2 * workers)
+
+    while pending:
+        if ordered:
+            done: "Iterable[Future[Result]]" = (next(iter(pending)),)
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            yield pending.pop(future), _outcome(future)
+
+        submit(2 * workers - len(pending))
+
+
+def _outcome(future: "Future[Result] | asyncio.Future[Result]") -> "Result | Exception":
+    """
+    Return the result of a finished `future` or the exception it raised.
+    """
+    try:
+        return future.result()
+    except Exception as error:
+        return error
+
+
 def _load(result: object) -> Result:
     if isinstance(result, str) and result.strip().startswith("{"):
-        result = json.loads(result)
+        result = jsonbackend.loads(result)
 
     file_version = get(result, int, "file_version")
 
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .predictions import (
+    DocumentExtraction,
+    Extraction,
+    FormExtraction,
+    Summarization,
+    Unbundling,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+    from typing import Final
+
+    from .predictionlist import PredictionList
+    from .predictions import Prediction
+    from .result import Result
+
+CATEGORIES: "Final" = ("added", "removed", "changed", "unchanged")
+
+
+@dataclass
+class PredictionDiff:
+    """
+    The differences between two prediction lists, such as predictions before and
+    after review. Matched predictions are changed if their values differ.
+    """
+
+    added: "PredictionList[Prediction]"
+    removed: "PredictionList[Prediction]"
+    changed: "list[tuple[Prediction, Prediction]]"
+    unchanged: "list[tuple[Prediction, Prediction]]"
+
+    def counts(self) -> "dict[str, dict[str, int]]":
+        """
+        Return the number of added, removed, changed, and unchanged predictions by
+        label. Matched predictions are counted under the label they had before.
+        """
+        counts: "dict[str, dict[str, int]]" = {}
+        categories = (
+            ("added", self.added),
+            ("removed", self.removed),
+            ("changed", (before for before, _ in self.changed)),
+            ("unchanged", (before for before, _ in self.unchanged)),
+        )
+
+        for category, predictions in categories:
+            for prediction in predictions:
+                label_counts = counts.get(prediction.label)
+
+                if label_counts is None:
+                    label_counts = counts[prediction.label] = dict.fromkeys(
+                        CATEGORIES, 0
+                    )
+
+                label_counts[category] += 1
+
+        return counts
+
+
+def review_key(prediction: "Prediction") -> "Hashable":
+    """
+    Identify `prediction` by its document, model, and label.
+    """
+    return prediction.document, prediction.model, prediction.label
+
+
+def review_location(prediction: "Prediction") -> "Hashable":
+    """
+    Locate `prediction` in its document. Document extractions and summarizations are
+    located by their spans, or by their text if they have none, as is often the case
+    after review. Form extractions are located by their box and unbundlings by their
+    pages.
+    """
+    if isinstance(prediction, FormExtraction):
+        return prediction.box
+    elif isinstance(prediction, DocumentExtraction):
+        return tuple(prediction.spans) or prediction.text
+    elif isinstance(prediction, Summarization):
+        return (
+            tuple(citation.span for citation in prediction.citations) or prediction.text
+        )
+    elif isinstance(prediction, Unbundling):
+        return tuple(prediction.pages)
+    else:
+        return None
+
+
+def review_value(prediction: "Prediction") -> "Hashable":
+    """
+    Return the part of `prediction` that review can change: the text of extractions
+    and whether form extractions are checked or signed.
+    """
+    if isinstance(prediction, FormExtraction):
+        return prediction.text, prediction.checked, prediction.signed
+    elif isinstance(prediction, Extraction):
+        return prediction.text
+    else:
+        return None
+
+
+def review_diff_counts(
+    results: "Iterable[Result]",
+    *,
+    key: "Callable[[Prediction], Hashable]" = review_key,
+    location: "Callable[[Prediction], Hashable]" = review_location,
+    value: "Callable[[Prediction], Hashable]" = review_value,
+) -> "dict[str, dict[str, int]]":
+    """
+    Return the number of added, removed, changed, and unchanged predictions by label
+    for the review of every result in `results`. Results are diffed one at a time, so
+    `results` can be a generator that loads them without holding every result in
+    memory.
+    """
+    totals: "dict[str, dict[str, int]]" = {}
+
+    for result in results:
+        for label, counts in (
+            result.review_diff(key=key, location=location, value=value).counts().items()
+        ):
+            label_totals = totals.get(label)
+
+            if label_totals is None:
+                totals[label] = counts
+            else:
+                for category, count in counts.items():
+                    label_totals[category] += count
+
+    return totals
@@ -0,0 +1,215 @@
+from typing import TYPE_CHECKING
+
+from .predictions import (
+    NULL_BOX,
+    DocumentExtraction,
+    Extraction,
+    FormExtraction,
+    Prediction,
+    Summarization,
+    Unbundling,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any, Final
+
+    from .result import Result
+
+# Columns of prediction tables with their pandas dtype and Arrow type, in the order
+# that `_row()` returns their values.
+COLUMNS: "Final[dict[str, tuple[str, str]]]" = {
+    "document_id": ("Int64", "int64"),
+    "document_name": ("string", "string"),
+    "model_id": ("Int64", "int64"),
+    "model_name": ("string", "string"),
+    "model_type": ("string", "string"),
+    "review_id": ("Int64", "int64"),
+    "review_type": ("string", "string"),
+    "prediction_type": ("string", "string"),
+    "label": ("string", "string"),
+    "confidence": ("float64", "double"),
+    "text": ("string", "string"),
+    "accepted": ("boolean", "bool"),
+    "rejected": ("boolean", "bool"),
+    "page": ("Int64", "int64"),
+    "pages": ("object", "list<int64>"),
+    "start": ("Int64", "int64"),
+    "end": ("Int64", "int64"),
+    "top": ("Int64", "int64"),
+    "left": ("Int64", "int64"),
+    "right": ("Int64", "int64"),
+    "bottom": ("Int64", "int64"),
+    "form_type": ("string", "string"),
+    "checked": ("boolean", "bool"),
+    "signed": ("boolean", "bool"),
+}
+
+# Tables of results start with the submission ID of each prediction's result.
+SUBMISSION_ID_COLUMN: "Final[dict[str, tuple[str, str]]]" = {
+    "submission_id": ("Int64", "int64")
+}
+
+
+def prediction_columns(predictions: "Iterable[Prediction]") -> "dict[str, list[Any]]":
+    """
+    Return the values of each of `COLUMNS` for `predictions`.
+    """
+    rows = list(map(_row, predictions))
+    return _transpose(COLUMNS, rows)
+
+
+def result_columns(
+    results: "Iterable[Result]",
+    predictions: "Callable[[Result], Iterable[Prediction]]",
+) -> "dict[str, list[Any]]":
+    """
+    Return the submission ID and the values of each of `COLUMNS` for the predictions
+    of `results` selected by `predictions`.
+    """
+    rows: "list[tuple[Any, ...]]" = []
+    submission_ids: "list[int]" = []
+
+    for result in results:
+        rows_before = len(rows)
+        rows.extend(map(_row, predictions(result)))
+        submission_ids.extend([result.submission_id] * (len(rows) - rows_before))
+
+    return {"submission_id": submission_ids, **_transpose(COLUMNS, rows)}
+
+
+def to_pandas(columns: "dict[str, list[Any]]") -> "Any":
+    """
+    Create a pandas `DataFrame` from `columns`. Raise `ImportError` if pandas isn't
+    installed.
+    """
+    import pandas  # type: ignore[import]
+
+    dtypes = {**SUBMISSION_ID_COLUMN, **COLUMNS}
+    return pandas.DataFrame(
+        {
+            name: _pandas_array(pandas, values, dtypes[name][0])
+            for name, values in columns.items()
+        },
+        copy=False,
+    )
+
+
+def to_arrow(columns: "dict[str, list[Any]]") -> "Any":
+    """
+    Create a pyarrow `Table` from `columns`. Raise `ImportError` if pyarrow isn't
+    installed.
+    """
+    import pyarrow  # type: ignore[import]
+
+    types = {**SUBMISSION_ID_COLUMN, **COLUMNS}
+    return pyarrow.table(
+        {
+            name: pyarrow.array(values, type=_arrow_type(pyarrow, types[name][1]))
+            for name, values in columns.items()
+        }
+    )
+
+
+def _row(prediction: Prediction) -> "tuple[Any, ...]":
+    """
+    Return the values of `COLUMNS` for `prediction`. Values that don't apply to its
+    type are `None`.
+    """
+    review = prediction.review
+    return (
+        prediction.document.id,
+        prediction.document.name,
+        prediction.model.id,
+        prediction.model.name,
+        prediction.model.type.value,
+        review and review.id,
+        review and review.type.value,
+        type(prediction).__name__,
+        prediction.label,
+        prediction.confidences[prediction.label],
+        *_extraction_values(prediction),
+        *_location_values(prediction),
+        *_form_values(prediction),
+    )
+
+
+def _extraction_values(prediction: Prediction) -> "tuple[Any, ...]":
+    """
+    Return the values of `text`, `accepted`, and `rejected` for `prediction`.
+    """
+    if isinstance(prediction, Extraction):
+        return prediction.text, prediction.accepted, prediction.rejected
+    else:
+        return None, None, None
+
+
+def _location_values(prediction: Prediction) -> "tuple[Any, ...]":
+    """
+    Return the values of `page`, `pages`, `start`, `end`, `top`, `left`, `right`,
+    and `bottom` for `prediction`. They're all `None` if its span or box is null.
+    """
+    if isinstance(prediction, FormExtraction):
+        box = prediction.box
+
+        if box != NULL_BOX:
+            return box.page, None, None, None, box.top, box.left, box.right, box.bottom
+    elif isinstance(prediction, (DocumentExtraction, Summarization)):
+        span = prediction.span
+
+        if span:
+            return span.page, None, span.start, span.end, None, None, None, None
+    elif isinstance(prediction, Unbundling):
+        return None, [*prediction.pages], None, None, None, None, None, None
+
+    return None, None, None, None, None, None, None, None
+
+
+def _form_values(prediction: Prediction) -> "tuple[Any, ...]":
+    """
+    Return the values of `form_type`, `checked`, and `signed` for `prediction`.
+    """
+    if isinstance(prediction, FormExtraction):
+        return prediction.type.value, prediction.checked, prediction.signed
+    else:
+        return None, None, None
+
+
+def _transpose(
+    columns: "Iterable[str]", rows: "list[tuple[Any, ...]]"
+) -> "dict[str, list[Any]]":
+    """
+    Return `rows` as lists of values by column name.
+    """
+    if not rows:
+        return {name: [] for name in columns}
+
+    return dict(zip(columns, map(list, zip(*rows))))
+
+
+def _pandas_array(pandas: "Any", values: "list[Any]", dtype: str) -> "Any":
+    """
+    Create a pandas array of `dtype` from `values`. Nullable integer and boolean
+    arrays are created from a NumPy array and mask, which is several times faster
+    than letting pandas check each value.
+    """
+    if dtype not in ("Int64", "boolean"):
+        return pandas.array(values, dtype=dtype)
+
+    import numpy
+
+    array = numpy.array(values, dtype=object)
+    mask = array == None  # noqa: E711
+    array[mask] = 0
+
+    if dtype == "Int64":
+        return pandas.arrays.IntegerArray(array.astype(numpy.int64), mask)
+    else:
+        return pandas.arrays.BooleanArray(array.astype(bool), mask)
+
+
+def _arrow_type(pyarrow: "Any", alias: str) -> "Any":
+    if alias.startswith("list<"):
+        return pyarrow.list_(_arrow_type(pyarrow, alias[5:-1]))
+
+    return pyarrow.type_for_alias(alias)
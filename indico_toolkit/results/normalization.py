@@ -1,159 +1,209 @@
 import re
 from typing import TYPE_CHECKING
 
+from .model import ModelGroupType
 from .utilities import get, has
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
     from typing import Any
 
+# Result files are never modified. Inconsistencies in their structure are fixed by
+# returning copies of only the dictionaries that need fixing. Inconsistencies in
+# predictions are fixed as each prediction is parsed, so that fixing and parsing
+# happen in a single pass over the predictions.
 
-def normalize_v1_result(result: "Any") -> None:
+
+def normalize_v1_result(result: "Any") -> "Any":
     """
-    Fix inconsistencies observed in v1 result files.
+    Return `result` with inconsistencies observed in v1 result files fixed.
+    Predictions are fixed separately by `normalize_v1_prediction()`.
     """
     submission_results = get(result, dict, "results", "document", "results")
+    normalized_results = {}
 
-    for model_name, model_results in tuple(submission_results.items()):
+    for model_name, model_results in submission_results.items():
         # Incomplete and unreviewed submissions don't have review sections.
         if not has(model_results, list, "post_reviews"):
-            submission_results[model_name] = model_results = {
+            model_results = {
                 "pre_review": model_results,
                 "post_reviews": [],
             }
 
         # Classifications aren't wrapped in lists like other prediction types.
         if has(model_results, dict, "pre_review"):
-            model_results["pre_review"] = [model_results["pre_review"]]
-            model_results["post_reviews"] = [
-                [prediction] for prediction in model_results["post_reviews"]
-            ]
-
-        predictions: "Any" = (
-            prediction
-            for review in (
-                [get(model_results, list, "pre_review")]
-                + get(model_results, list, "post_reviews")
-            )
-            if review is not None
-            for prediction in review
-            if prediction is not None
-        )
-
-        for prediction in predictions:
-            # Predictions added in review lack a `confidence` section.
-            if "confidence" not in prediction:
-                prediction["confidence"] = {prediction["label"]: 0}
-
-            # Form Extractions added in review may lack bounding boxes.
-            # Set values that will equal `NULL_BOX`.
-            if "type" in prediction and "top" not in prediction:
-                prediction["page_num"] = 0
-                prediction["top"] = 0
-                prediction["left"] = 0
-                prediction["right"] = 0
-                prediction["bottom"] = 0
-
-            # Prior to 6.11, some Extractions lack a `normalized` section after review.
-            if "text" in prediction and "normalized" not in prediction:
-                prediction["normalized"] = {"formatted": prediction["text"]}
-
-            # Document Extractions that didn't go through a linked labels transformer
-            # lack a `groupings` section.
-            if (
-                "text" in prediction
-                and "type" not in prediction
-                and "groupings" not in prediction
-            ):
-                prediction["groupings"] = []
+            model_results = {
+                **model_results,
+                "pre_review": [model_results["pre_review"]],
+                "post_reviews": [
+                    [prediction] for prediction in model_results["post_reviews"]
+                ],
+            }
 
-    # Incomplete and unreviewed submissions don't include a `reviews_meta` section.
-    if not has(result, list, "reviews_meta"):
-        result["reviews_meta"] = []
+        normalized_results[model_name] = model_results
 
+    # Incomplete and unreviewed submissions don't include a `reviews_meta` section.
     # Incomplete and unreviewed submissions retrieved with `SubmissionResult()` have a
     # single `{"review_id": None}` review.
-    if not has(result, int, "reviews_meta", 0, "review_id"):
-        result["reviews_meta"] = []
+    if has(result, int, "reviews_meta", 0, "review_id"):
+        reviews_meta = list(map(_normalize_review, get(result, list, "reviews_meta")))
+    else:
+        reviews_meta = []
+
+    return {
+        **_replace(result, ("results", "document", "results"), normalized_results),
+        "reviews_meta": reviews_meta,
+    }
 
-    # Review notes are `None` unless the reviewer enters a reason for rejection.
-    for review_dict in get(result, list, "reviews_meta"):
-        if not has(review_dict, str, "review_notes"):
-            review_dict["review_notes"] = ""
 
+def normalize_v1_prediction(prediction: "Any") -> "Any":
+    """
+    Return `prediction` with inconsistencies observed in v1 predictions fixed.
+    `prediction` is returned as is if it doesn't need fixing.
+    """
+    if not isinstance(prediction, dict):
+        return prediction
+
+    fixes: "dict[str, Any]" = {}
+
+    # Predictions added in review lack a `confidence` section.
+    if "confidence" not in prediction:
+        fixes["confidence"] = {get(prediction, str, "label"): 0}
+
+    # Form Extractions added in review may lack bounding boxes.
+    # Set values that will equal `NULL_BOX`.
+    if "type" in prediction and "top" not in prediction:
+        fixes["page_num"] = 0
+        fixes["top"] = 0
+        fixes["left"] = 0
+        fixes["right"] = 0
+        fixes["bottom"] = 0
+
+    # Prior to 6.11, some Extractions lack a `normalized` section after review.
+    if "text" in prediction and "normalized" not in prediction:
+        fixes["normalized"] = {"formatted": prediction["text"]}
 
-def normalize_v3_result(result: "Any") -> None:
+    # Document Extractions that didn't go through a linked labels transformer
+    # lack a `groupings` section.
+    if (
+        "text" in prediction
+        and "type" not in prediction
+        and "groupings" not in prediction
+    ):
+        fixes["groupings"] = []
+
+    return {**prediction, **fixes} if fixes else prediction
+
+
+def normalize_v3_result(result: "Any") -> "Any":
     """
-    Fix inconsistencies observed in v3 result files.
+    Return `result` with inconsistencies observed in v3 result files fixed.
+    Predictions are fixed separately by `normalize_v3_prediction()`.
     """
-    task_type_by_model_group_id = {
-        model_group_id: model_group["task_type"]
-        for model_group_id, model_group in result["modelgroup_metadata"].items()
-    }
-    predictions_with_task_type: "Iterator[tuple[Any, str]]" = (
-        (prediction, task_type_by_model_group_id[model_group_id])
-        for submission_result in get(result, list, "submission_results")
-        for review_result in get(submission_result, dict, "model_results").values()
-        for model_group_id, model_results in review_result.items()
-        for prediction in model_results
+    # Prior to 6.8, v3 result files don't include a `reviews` section.
+    if has(result, dict, "reviews"):
+        reviews = {
+            review_id: _normalize_review(review_dict)
+            for review_id, review_dict in get(result, dict, "reviews").items()
+        }
+    else:
+        reviews = {}
+
+    # Prior to 7.0, v3 result files don't include an `errored_files` section.
+    if has(result, dict, "errored_files"):
+        errored_files = {
+            file_id: _normalize_errored_file(file)
+            for file_id, file in get(result, dict, "errored_files").items()
+        }
+    else:
+        errored_files = {}
+
+    return {**result, "reviews": reviews, "errored_files": errored_files}
+
+
+def normalize_v3_prediction(prediction: "Any", type: ModelGroupType) -> "Any":
+    """
+    Return `prediction` from a model of `type` with inconsistencies observed in v3
+    predictions fixed. `prediction` is returned as is if it doesn't need fixing.
+    """
+    if not isinstance(prediction, dict):
+        return prediction
+
+    fixes: "dict[str, Any]" = {}
+    is_document_extraction = type in (
+        ModelGroupType.DOCUMENT_EXTRACTION,
+        ModelGroupType.GENAI_EXTRACTION,
     )
 
-    for prediction, task_type in predictions_with_task_type:
-        # Predictions added in review may lack a `confidence` section.
-        if "confidence" not in prediction:
-            prediction["confidence"] = {prediction["label"]: 0}
-
-        # Document Extractions added in review may lack spans.
-        if (
-            task_type in ("annotation", "genai_annotation")
-            and "spans" not in prediction
-        ):
-            prediction["spans"] = []
-
-        # Form Extractions added in review may lack bounding boxes.
-        # Set values that will equal `NULL_BOX`.
-        if task_type == "form_extraction" and "top" not in prediction:
-            prediction["page_num"] = 0
-            prediction["top"] = 0
-            prediction["left"] = 0
-            prediction["right"] = 0
-            prediction["bottom"] = 0
-
-        # Prior to 6.11, some Extractions lack a `normalized` section after
-        # review.
-        if (
-            task_type in ("annotation", "form_extraction", "genai_annotation")
-            and "normalized" not in prediction
-        ):
-            prediction["normalized"] = {"formatted": prediction["text"]}
-
-        # Document Extractions that didn't go through a linked labels
-        # transformer lack a `groupings` section.
-        if (
-            task_type in ("annotation", "genai_annotation")
-            and "groupings" not in prediction
-        ):
-            prediction["groupings"] = []
-
-        # Summarizations may lack citations after review.
-        if task_type == "summarization" and "citations" not in prediction:
-            prediction["citations"] = []
+    # Predictions added in review may lack a `confidence` section.
+    if "confidence" not in prediction:
+        fixes["confidence"] = {get(prediction, str, "label"): 0}
 
-    # Prior to 6.8, v3 result files don't include a `reviews` section.
-    if not has(result, dict, "reviews"):
-        result["reviews"] = {}
+    # Document Extractions added in review may lack spans.
+    if is_document_extraction and "spans" not in prediction:
+        fixes["spans"] = []
+
+    # Form Extractions added in review may lack bounding boxes.
+    # Set values that will equal `NULL_BOX`.
+    if type == ModelGroupType.FORM_EXTRACTION and "top" not in prediction:
+        fixes["page_num"] = 0
+        fixes["top"] = 0
+        fixes["left"] = 0
+        fixes["right"] = 0
+        fixes["bottom"] = 0
+
+    # Prior to 6.11, some Extractions lack a `normalized` section after review.
+    if (
+        is_document_extraction or type == ModelGroupType.FORM_EXTRACTION
+    ) and "normalized" not in prediction:
+        fixes["normalized"] = {"formatted": get(prediction, str, "text")}
+
+    # Document Extractions that didn't go through a linked labels transformer lack a
+    # `groupings` section.
+    if is_document_extraction and "groupings" not in prediction:
+        fixes["groupings"] = []
 
+    # Summarizations may lack citations after review.
+    if type == ModelGroupType.GENAI_SUMMARIZATION and "citations" not in prediction:
+        fixes["citations"] = []
+
+    return {**prediction, **fixes} if fixes else prediction
+
+
+def _normalize_review(review_dict: "Any") -> "Any":
+    """
+    Return `review_dict` with inconsistencies observed in review metadata fixed.
+    """
     # Review notes are `None` unless the reviewer enters a reason for rejection.
-    for review_dict in get(result, dict, "reviews").values():
-        if not has(review_dict, str, "review_notes"):
-            review_dict["review_notes"] = ""
+    if isinstance(review_dict, dict) and not has(review_dict, str, "review_notes"):
+        return {**review_dict, "review_notes": ""}
+
+    return review_dict
 
-    # Prior to 7.0, v3 result files don't include an `errored_files` section.
-    if not has(result, dict, "errored_files"):
-        result["errored_files"] = {}
 
+def _normalize_errored_file(file: "Any") -> "Any":
+    """
+    Return `file` with inconsistencies observed in errored files fixed.
+    """
     # Prior to 7.X, errored files may lack filenames.
-    for file in get(result, dict, "errored_files").values():
-        if not has(file, str, "input_filename") and has(file, str, "reason"):
-            match = re.search(r"file '([^']*)' with id", get(file, str, "reason"))
-            file["input_filename"] = match.group(1) if match else ""
+    if (
+        isinstance(file, dict)
+        and not has(file, str, "input_filename")
+        and has(file, str, "reason")
+    ):
+        match = re.search(r"file '([^']*)' with id", get(file, str, "reason"))
+        return {**file, "input_filename": match.group(1) if match else ""}
+
+    return file
+
+
+def _replace(dictionary: "Any", keys: "tuple[str, ...]", value: object) -> "Any":
+    """
+    Return a copy of `dictionary` with the value at the path `keys` replaced by
+    `value`. Only the dictionaries along the path are copied.
+    """
+    key, *rest = keys
+
+    return {
+        **dictionary,
+        key: _replace(dictionary[key], tuple(rest), value) if rest else value,
+    }
@@ -0,0 +1,220 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .model import ModelGroup, ModelGroupType
+from .predictions import (
+    DocumentExtraction,
+    Extraction,
+    FormExtraction,
+    Summarization,
+    Unbundling,
+)
+from .review import Review, ReviewType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any, Final
+
+# `PredictionList.where()` filters are turned into conditions specialized for the types
+# of prediction being filtered. Each filter maps its value to a condition on
+# predictions. Filters whose values can be of several types have variants named
+# `filter:variant` that only make the comparison that type of value could match.
+CONDITIONS: "Final" = {
+    "predicate": lambda predicate: predicate,
+    "document": lambda document: lambda prediction: prediction.document == document,
+    "document_in": lambda document_in: lambda prediction: (
+        prediction.document in document_in
+    ),
+    "model": lambda model: lambda prediction: (
+        prediction.model == model
+        or prediction.model.type == model
+        or prediction.model.name == model
+    ),
+    "model:group": lambda model: lambda prediction: prediction.model == model,
+    "model:type": lambda model: lambda prediction: prediction.model.type == model,
+    "model:name": lambda model: lambda prediction: prediction.model.name == model,
+    "model_in": lambda model_in: lambda prediction: (
+        prediction.model in model_in
+        or prediction.model.type in model_in
+        or prediction.model.name in model_in
+    ),
+    "review": lambda review: lambda prediction: (
+        prediction.review == review
+        or (prediction.review is not None and prediction.review.type == review)
+    ),
+    "review:none": lambda review: lambda prediction: prediction.review is None,
+    "review:review": lambda review: lambda prediction: prediction.review == review,
+    "review:type": lambda review: lambda prediction: (
+        prediction.review is not None and prediction.review.type == review
+    ),
+    "review_in": lambda review_in: lambda prediction: (
+        prediction.review in review_in
+        or (prediction.review is not None and prediction.review.type in review_in)
+    ),
+    "label": lambda label: lambda prediction: prediction.label == label,
+    "label_in": lambda label_in: lambda prediction: prediction.label in label_in,
+    "min_confidence": lambda min_confidence: lambda prediction: (
+        prediction.confidence >= min_confidence
+    ),
+    "max_confidence": lambda max_confidence: lambda prediction: (
+        prediction.confidence <= max_confidence
+    ),
+}
+
+# Conditions for filters that only apply to some prediction types. Predictions of
+# other types never match, so they're rejected without evaluating any conditions.
+# The first condition for a superclass of the prediction's type is used, which lets
+# `page` skip `Extraction.page` checking which subclass it is.
+TYPE_CONDITIONS: "Final" = {
+    "page": (
+        (FormExtraction, lambda page: lambda prediction: prediction.box.page == page),
+        (
+            (DocumentExtraction, Summarization),
+            lambda page: lambda prediction: prediction.span.page == page,
+        ),
+        (Extraction, lambda page: lambda prediction: prediction.page == page),
+        (Unbundling, lambda page: lambda prediction: page in prediction.pages),
+    ),
+    "page_in": (
+        (
+            FormExtraction,
+            lambda page_in: lambda prediction: prediction.box.page in page_in,
+        ),
+        (
+            (DocumentExtraction, Summarization),
+            lambda page_in: lambda prediction: prediction.span.page in page_in,
+        ),
+        (Extraction, lambda page_in: lambda prediction: prediction.page in page_in),
+        (
+            Unbundling,
+            lambda page_in: lambda prediction: not page_in.isdisjoint(prediction.pages),
+        ),
+    ),
+    "accepted": (
+        (
+            Extraction,
+            lambda accepted: lambda prediction: prediction.accepted == accepted,
+        ),
+    ),
+    "rejected": (
+        (
+            Extraction,
+            lambda rejected: lambda prediction: prediction.rejected == rejected,
+        ),
+    ),
+    "checked": (
+        (
+            FormExtraction,
+            lambda checked: lambda prediction: prediction.checked == checked,
+        ),
+    ),
+    "signed": (
+        (FormExtraction, lambda signed: lambda prediction: prediction.signed == signed),
+    ),
+}
+
+
+def combine_filters(
+    filters: "dict[str, Any]", prediction_types: "Iterable[type]"
+) -> "tuple[set[type], list[Callable[[Any], bool]]]":
+    """
+    Return which of `prediction_types` can match all of `filters`, and one condition
+    per filter for predictions of those types. The conditions are meant to be chained
+    with `filter()`, so each prediction costs one call per filter that it gets to.
+    """
+    variants = tuple(_variant(name, value) for name, value in filters.items())
+    factories_by_type = {
+        prediction_type: type_factories
+        for prediction_type in prediction_types
+        if (type_factories := _factories(prediction_type, variants)) is not None
+    }
+    conditions = []
+
+    for position, value in enumerate(filters.values()):
+        factories = {
+            prediction_type: type_factories[position]
+            for prediction_type, type_factories in factories_by_type.items()
+        }
+        conditions_by_factory = {
+            factory: factory(value) for factory in set(factories.values())
+        }
+
+        if len(conditions_by_factory) == 1:
+            (condition,) = conditions_by_factory.values()
+        else:
+            condition = _dispatch(
+                {
+                    prediction_type: conditions_by_factory[factory]
+                    for prediction_type, factory in factories.items()
+                }
+            )
+
+        conditions.append(condition)
+
+    return set(factories_by_type), conditions
+
+
+def applies_to_all_types(filters: "dict[str, Any]") -> bool:
+    """
+    Check if none of `filters` depend on the type of prediction.
+    """
+    return TYPE_CONDITIONS.keys().isdisjoint(filters)
+
+
+def _dispatch(
+    conditions: "dict[type, Callable[[Any], bool]]",
+) -> "Callable[[Any], bool]":
+    """
+    Return a condition that checks predictions with the condition for their type.
+    """
+    condition_for = conditions.__getitem__
+    return lambda prediction: condition_for(type(prediction))(prediction)
+
+
+def _variant(name: str, value: object) -> str:
+    """
+    Return the condition variant of filter `name` for `value`.
+    """
+    if name == "model":
+        if isinstance(value, ModelGroup):
+            return "model:group"
+        elif isinstance(value, ModelGroupType):
+            return "model:type"
+        elif isinstance(value, str):
+            return "model:name"
+    elif name == "review":
+        if value is None:
+            return "review:none"
+        elif isinstance(value, Review):
+            return "review:review"
+        elif isinstance(value, ReviewType):
+            return "review:type"
+
+    return name
+
+
+@lru_cache(maxsize=None)
+def _factories(
+    prediction_type: type, variants: "tuple[str, ...]"
+) -> "tuple[Callable[[Any], Callable[[Any], bool]], ...] | None":
+    """
+    Return the functions that create a condition from the value of each filter in
+    `variants` for predictions of `prediction_type`, or `None` if predictions of that
+    type can't match. They're cached, so conditions for each type are only looked up
+    once per combination of filters.
+    """
+    factories = []
+
+    for variant in variants:
+        if variant in CONDITIONS:
+            factories.append(CONDITIONS[variant])
+            continue
+
+        for condition_type, factory in TYPE_CONDITIONS[variant]:
+            if issubclass(prediction_type, condition_type):
+                factories.append(factory)
+                break
+        else:
+            return None
+
+    return tuple(factories)
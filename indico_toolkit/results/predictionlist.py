@@ -1,8 +1,15 @@
 from collections import defaultdict
+from itertools import chain, compress
+from math import inf
 from operator import attrgetter
 from typing import TYPE_CHECKING, List, TypeVar, overload
 
-from .model import ModelGroupType
+from .. import jsonbackend
+from .diff import PredictionDiff, review_key, review_location, review_value
+from .document import Document
+from .frames import prediction_columns, to_arrow, to_pandas
+from .model import ModelGroup, ModelGroupType
+from .predicates import applies_to_all_types, combine_filters
 from .predictions import (
     Classification,
     DocumentExtraction,
@@ -16,13 +23,19 @@ from .review import Review, ReviewType
 from .utilities import nfilter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Container, Iterable
-    from typing import Any, Final, SupportsIndex
+    from collections.abc import (
+        Callable,
+        Collection,
+        Container,
+        Hashable,
+        Iterable,
+        Iterator,
+        Mapping,
+    )
+    from typing import Any, Final, Literal, SupportsIndex
 
     from typing_extensions import Self
 
-    from .document import Document
-    from .model import ModelGroup
     from .result import Result
 
 PredictionType = TypeVar("PredictionType", bound=Prediction)
@@ -34,8 +47,34 @@ REVIEW_UNSPECIFIED: "Final" = Review(
     id=None, reviewer_id=None, notes=None, rejected=None, type=None  # type: ignore[arg-type]
 )
 
+# Attributes that `where()`, `oftype()`, and `groupby()` can look up by index rather
+# than by filtering every prediction. They're set when predictions are parsed and
+# aren't changed by auto review, unlike labels, pages, or confidences.
+INDEXED_ATTRIBUTES: "Final" = ("document", "model", "review", "__class__")
+
+# `groupby()` keys that get an indexed attribute. Attribute getters don't compare
+# equal to one another, so they're recognized by their representation instead.
+INDEXED_GETTERS: "Final" = {repr(attrgetter(name)): name for name in INDEXED_ATTRIBUTES}
+
 
 class PredictionList(List[PredictionType]):
+    """
+    A list of predictions with methods to filter, group, and sort them.
+
+    Filtering by document, model, review, or type uses indexes of prediction positions
+    by those attributes. An index is built the second time it's needed, so lists
+    that are only filtered once don't pay for it, and it's discarded whenever the list
+    is modified. Predictions are assumed not to move to another document, model, or
+    review once they're in a list that's been filtered.
+    """
+
+    # Positions of predictions by indexed attribute value. `None` marks an index
+    # that's been needed once but not built yet.
+    _indexes: "dict[str, dict[Any, list[int]] | None] | None" = None
+
+    # Predictions by review, as returned by `Result.pre_review`, `Result.final`, etc.
+    _reviewed: "dict[Review | ReviewType | None, Self] | None" = None
+
     @property
     def classifications(self) -> "PredictionList[Classification]":
         return self.oftype(Classification)
@@ -74,6 +113,56 @@ class PredictionList(List[PredictionType]):
         else:
             return super().__getitem__(index)
 
+    def __setitem__(self, index: "Any", value: "Any", /) -> None:
+        self._invalidate()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: "SupportsIndex | slice", /) -> None:
+        self._invalidate()
+        super().__delitem__(index)
+
+    def __iadd__(  # type: ignore[override, misc]
+        self, values: "Iterable[PredictionType]", /
+    ) -> "Self":
+        self._invalidate()
+        return super().__iadd__(values)
+
+    def __imul__(self, count: "SupportsIndex", /) -> "Self":
+        self._invalidate()
+        return super().__imul__(count)
+
+    def append(self, value: PredictionType, /) -> None:
+        self._invalidate()
+        super().append(value)
+
+    def extend(self, values: "Iterable[PredictionType]", /) -> None:
+        self._invalidate()
+        super().extend(values)
+
+    def insert(self, index: "SupportsIndex", value: PredictionType, /) -> None:
+        self._invalidate()
+        super().insert(index, value)
+
+    def remove(self, value: PredictionType, /) -> None:
+        self._invalidate()
+        super().remove(value)
+
+    def pop(self, index: "SupportsIndex" = -1, /) -> PredictionType:
+        self._invalidate()
+        return super().pop(index)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def reverse(self) -> None:
+        self._invalidate()
+        super().reverse()
+
+    def sort(self, *, key: "Any" = None, reverse: bool = False) -> None:
+        self._invalidate()
+        super().sort(key=key, reverse=reverse)
+
     def apply(self, function: "Callable[[PredictionType], None]") -> "Self":
         """
         Apply `function` to all predictions.
@@ -96,6 +185,13 @@ class PredictionList(List[PredictionType]):
         """
         grouped = defaultdict(type(self))  # type: ignore[var-annotated]
 
+        if type(key) is attrgetter and (attribute := INDEXED_GETTERS.get(repr(key))):
+            if (index := self._index(attribute)) is not None:
+                for value, positions in index.items():
+                    grouped[value] = self._at(positions)
+
+                return grouped
+
         for prediction in self:
             derived_key = key(prediction)
 
@@ -130,6 +226,17 @@ class PredictionList(List[PredictionType]):
         """
         Return a new prediction list containing predictions of type `type`.
         """
+        index = self._index("__class__")
+
+        if index is not None:
+            return self._at(  # type: ignore[return-value]
+                _union(
+                    positions
+                    for prediction_type, positions in index.items()
+                    if issubclass(prediction_type, type)
+                )
+            )
+
         return self.where(lambda prediction: isinstance(prediction, type))  # type: ignore[return-value]
 
     def orderby(
@@ -186,118 +293,219 @@ class PredictionList(List[PredictionType]):
         checked: form extractions that are or aren't checked,
         signed: form extractions that are or aren't signed.
         """
-        predicates = []
+        # Filters that weren't specified are left out of the conditions.
+        filters = {
+            name: value
+            for name, value, unspecified in (
+                ("predicate", predicate, None),
+                ("document", document, None),
+                ("document_in", document_in, None),
+                ("model", model, None),
+                ("model_in", model_in, None),
+                ("review", review, REVIEW_UNSPECIFIED),
+                (
+                    "review_in",
+                    None if review_in == {REVIEW_UNSPECIFIED} else review_in,
+                    None,
+                ),
+                ("label", label, None),
+                ("label_in", label_in, None),
+                ("min_confidence", min_confidence, None),
+                ("max_confidence", max_confidence, None),
+                ("page", page, None),
+                ("page_in", None if page_in is None else set(page_in), None),
+                ("accepted", accepted, None),
+                ("rejected", rejected, None),
+                ("checked", checked, None),
+                ("signed", signed, None),
+            )
+            if value is not unspecified
+        }
+        candidates = self._candidates(
+            document, document_in, model, model_in, review, review_in
+        )
+
+        if not filters:
+            return type(self)(candidates)
+
+        if applies_to_all_types(filters):
+            _, conditions = combine_filters(filters, (Prediction,))
+            return type(self)(nfilter(conditions, candidates))
+
+        # Predictions of types that can't match are skipped without evaluating any
+        # conditions.
+        if candidates is self and (index := self._index("__class__")) is not None:
+            matching_types, conditions = combine_filters(filters, index)
+            candidates = self._at(
+                _union(index[prediction_type] for prediction_type in matching_types)
+            )
+        else:
+            candidates = list(candidates)
+            candidate_types = set(map(type, candidates))
+            matching_types, conditions = combine_filters(filters, candidate_types)
+
+            if matching_types != candidate_types:
+                candidates = compress(
+                    candidates, map(matching_types.__contains__, map(type, candidates))
+                )
+
+        return type(self)(nfilter(conditions, candidates))
+
+    def _index(self, attribute: str) -> "dict[Any, list[int]] | None":
+        """
+        Return the positions of predictions by the value of `attribute` if it's
+        indexed. Return `None` if it isn't indexed or if this is the first time its
+        index has been needed.
+        """
+        if attribute not in INDEXED_ATTRIBUTES:
+            return None
 
-        if predicate is not None:
-            predicates.append(predicate)
+        if self._indexes is None:
+            self._indexes = {}
 
-        if document is not None:
-            predicates.append(lambda prediction: prediction.document == document)
+        if attribute not in self._indexes:
+            self._indexes[attribute] = None
+            return None
 
-        if document_in is not None:
-            predicates.append(lambda prediction: prediction.document in document_in)
+        index = self._indexes[attribute]
 
-        if model is not None:
-            predicates.append(
-                lambda prediction: (
-                    prediction.model == model
-                    or prediction.model.type == model
-                    or prediction.model.name == model
-                )
-            )
+        if index is None:
+            grouped = defaultdict(list)
 
-        if model_in is not None:
-            predicates.append(
-                lambda prediction: (
-                    prediction.model in model_in
-                    or prediction.model.type in model_in
-                    or prediction.model.name in model_in
-                )
-            )
+            for position, value in enumerate(map(attrgetter(attribute), self)):
+                grouped[value].append(position)
 
-        if review is not REVIEW_UNSPECIFIED:
-            predicates.append(
-                lambda prediction: (
-                    prediction.review == review
-                    or (
-                        prediction.review is not None
-                        and prediction.review.type == review
-                    )
-                )
-            )
+            index = self._indexes[attribute] = dict(grouped)
 
-        if review_in != {REVIEW_UNSPECIFIED}:
-            predicates.append(
-                lambda prediction: (
-                    prediction.review in review_in
-                    or (
-                        prediction.review is not None
-                        and prediction.review.type in review_in
-                    )
-                )
-            )
+        return index
+
+    def _reviewed_by(self, review: "Review | ReviewType | None") -> "Self":
+        """
+        Return a new prediction list containing predictions from `review`.
 
-        if label is not None:
-            predicates.append(lambda prediction: prediction.label == label)
+        The filtered list is kept until this list is modified, and each call returns
+        a copy of it that shares its indexes. Filtering the copies by document, model,
+        or type builds those indexes once rather than once per copy.
+        """
+        if self._reviewed is None:
+            self._reviewed = {}
 
-        if label_in is not None:
-            predicates.append(lambda prediction: prediction.label in label_in)
+        if review not in self._reviewed:
+            self._reviewed[review] = self.where(review=review)
 
-        if min_confidence is not None:
-            predicates.append(
-                lambda prediction: prediction.confidence >= min_confidence
-            )
+        reviewed = self._reviewed[review]
 
-        if max_confidence is not None:
-            predicates.append(
-                lambda prediction: prediction.confidence <= max_confidence
-            )
+        if reviewed._indexes is None:
+            reviewed._indexes = {}
 
-        if page is not None:
-            predicates.append(
-                lambda prediction: (
-                    (isinstance(prediction, Extraction) and prediction.page == page)
-                    or (isinstance(prediction, Unbundling) and page in prediction.pages)
-                )
-            )
+        shared = type(self)(reviewed)
+        shared._indexes = reviewed._indexes
+        return shared
+
+    def _invalidate(self) -> None:
+        """
+        Discard indexes and filtered lists before this list is modified.
+        """
+        self._indexes = None
+        self._reviewed = None
+
+    def _at(self, positions: "Iterable[int]") -> "Self":
+        """
+        Return a new prediction list containing the predictions at `positions`.
+        """
+        return type(self)(map(super().__getitem__, positions))
+
+    def _candidates(
+        self,
+        document: "Document | None",
+        document_in: "Container[Document] | None",
+        model: "ModelGroup | ModelGroupType | str | None",
+        model_in: "Container[ModelGroup | ModelGroupType | str] | None",
+        review: "Review | ReviewType | None",
+        review_in: "Container[Review | ReviewType | None]",
+    ) -> "Iterable[PredictionType]":
+        """
+        Return the predictions that could match the document, model, and review
+        filters of `where()`, using the most selective index available. Candidates
+        must still be checked against every filter.
+        """
+        matches: "list[list[int]]" = []
 
-        if page_in is not None:
-            page_in = set(page_in)
-            predicates.append(
-                lambda prediction: (
-                    (isinstance(prediction, Extraction) and prediction.page in page_in)
-                    or (
-                        isinstance(prediction, Unbundling)
-                        and bool(page_in & set(prediction.pages))
+        if document is not None and (index := self._index("document")) is not None:
+            matches.append(index.get(document, []))
+
+        if document_in is not None and (index := self._index("document")) is not None:
+            matches.append(_union(_matching(index, document_in.__contains__)))
+
+        if model is not None and (index := self._index("model")) is not None:
+            if isinstance(model, ModelGroup):
+                matches.append(index.get(model, []))
+            else:
+                matches.append(
+                    _union(
+                        _matching(
+                            index,
+                            lambda key: (
+                                key == model or key.type == model or key.name == model
+                            ),
+                        )
                     )
                 )
-            )
 
-        if accepted is not None:
-            predicates.append(
-                lambda prediction: isinstance(prediction, Extraction)
-                and prediction.accepted == accepted
+        if model_in is not None and (index := self._index("model")) is not None:
+            matches.append(
+                _union(
+                    _matching(
+                        index,
+                        lambda key: (
+                            key in model_in
+                            or key.type in model_in
+                            or key.name in model_in
+                        ),
+                    )
+                )
             )
 
-        if rejected is not None:
-            predicates.append(
-                lambda prediction: isinstance(prediction, Extraction)
-                and prediction.rejected == rejected
-            )
+        if (
+            review is not REVIEW_UNSPECIFIED
+            and (index := self._index("review")) is not None
+        ):
+            if review is None or isinstance(review, Review):
+                matches.append(index.get(review, []))
+            else:
+                matches.append(
+                    _union(
+                        _matching(
+                            index,
+                            lambda key: (
+                                key == review
+                                or (key is not None and key.type == review)
+                            ),
+                        )
+                    )
+                )
 
-        if checked is not None:
-            predicates.append(
-                lambda prediction: isinstance(prediction, FormExtraction)
-                and prediction.checked == checked
+        if (
+            review_in != {REVIEW_UNSPECIFIED}
+            and (index := self._index("review")) is not None
+        ):
+            matches.append(
+                _union(
+                    _matching(
+                        index,
+                        lambda key: (
+                            key in review_in
+                            or (key is not None and key.type in review_in)
+                        ),
+                    )
+                )
             )
 
-        if signed is not None:
-            predicates.append(
-                lambda prediction: isinstance(prediction, FormExtraction)
-                and prediction.signed == signed
-            )
+        if not matches:
+            return self
 
-        return type(self)(nfilter(predicates, self))
+        positions = min(matches, key=len)
+        return map(super().__getitem__, positions)
 
     def accept(self) -> "Self":
         """
@@ -327,15 +535,136 @@ class PredictionList(List[PredictionType]):
         self.oftype(Extraction).apply(Extraction.unreject)
         return self
 
-    def to_changes(self, result: "Result") -> "Any":
+    def diff(
+        self,
+        other: "PredictionList[Prediction]",
+        *,
+        key: "Callable[[Prediction], Hashable]" = review_key,
+        location: "Callable[[Prediction], Hashable]" = review_location,
+        value: "Callable[[Prediction], Hashable]" = review_value,
+    ) -> PredictionDiff:
+        """
+        Compare this prediction list to `other`, such as predictions before review to
+        predictions after it.
+
+        Predictions are matched if they have the same `key`, preferring predictions at
+        the same `location`, then predictions with the same `value`. Other predictions
+        with the same key are matched in order, so an extraction whose location or
+        text was corrected in review is changed rather than removed and added.
+        Matched predictions are changed if their `value` differs.
+
+        Predictions are matched with dicts of keys rather than compared pairwise, so
+        diffing takes linear time.
+        """
+        before_keys = list(map(key, self))
+        after_keys = list(map(key, other))
+        matches: "list[Prediction | None]" = [None] * len(other)
+        matched: "set[int]" = set()
+        stages: "tuple[Callable[[Prediction, Hashable], Hashable], ...]" = (
+            lambda prediction, prediction_key: (prediction_key, location(prediction)),
+            lambda prediction, prediction_key: (prediction_key, value(prediction)),
+            lambda prediction, prediction_key: prediction_key,
+        )
+
+        for stage_key in stages:
+            # Lists of predictions are reversed so that `pop()` returns the first.
+            unmatched: "dict[Hashable, list[Prediction]]" = {}
+
+            for before, before_key in zip(reversed(self), reversed(before_keys)):
+                if id(before) not in matched:
+                    unmatched.setdefault(stage_key(before, before_key), []).append(
+                        before
+                    )
+
+            for position, (after, after_key) in enumerate(zip(other, after_keys)):
+                if matches[position] is None:
+                    candidates = unmatched.get(stage_key(after, after_key))
+
+                    if candidates:
+                        matches[position] = candidates.pop()
+                        matched.add(id(matches[position]))
+
+        added: "PredictionList[Prediction]" = PredictionList()
+        changed: "list[tuple[Prediction, Prediction]]" = []
+        unchanged: "list[tuple[Prediction, Prediction]]" = []
+
+        for after, match in zip(other, matches):
+            if match is None:
+                added.append(after)
+            elif value(match) == value(after):
+                unchanged.append((match, after))
+            else:
+                changed.append((match, after))
+
+        removed: "PredictionList[Prediction]" = PredictionList(
+            before for before in self if id(before) not in matched
+        )
+        return PredictionDiff(added, removed, changed, unchanged)
+
+    def apply_thresholds(
+        self,
+        *,
+        accept: "Mapping[str, float] | None" = None,
+        reject: "Mapping[str, float] | None" = None,
+    ) -> "dict[str, dict[str, int]]":
+        """
+        Mark extractions as accepted if their confidence is at least the `accept`
+        threshold for their label, or as rejected if it's below the `reject`
+        threshold for their label. Extractions with other labels or confidences
+        between the thresholds are left as they are.
+
+        Return the number of extractions accepted and rejected by label for logging.
+
+        ```
+        counts = result.pre_review.apply_thresholds(
+            accept={"First Name": 0.9, "Last Name": 0.9},
+            reject={"First Name": 0.2},
+        )
+        ```
+        """
+        accept = accept or {}
+        reject = reject or {}
+        counts = {
+            label: {"accepted": 0, "rejected": 0} for label in chain(accept, reject)
+        }
+        # Thresholds are looked up once per extraction in a single pass rather than
+        # filtering the list once per label and threshold.
+        thresholds = {
+            label: (accept.get(label, inf), reject.get(label, -inf), label_counts)
+            for label, label_counts in counts.items()
+        }
+
+        for extraction in self.oftype(Extraction):
+            label = extraction.label
+
+            if label not in thresholds:
+                continue
+
+            accept_threshold, reject_threshold, label_counts = thresholds[label]
+            confidence = extraction.confidences[label]
+
+            if confidence >= accept_threshold:
+                extraction.accept()
+                label_counts["accepted"] += 1
+            elif confidence < reject_threshold:
+                extraction.reject()
+                label_counts["rejected"] += 1
+
+        return counts
+
+    def to_changes(self, result: "Result", *, serialize: bool = False) -> "Any":
         """
         Create a dict or list for the `changes` argument of `SubmitReview` based on the
         predictions in this prediction list and the documents and version of `result`.
+
+        If `serialize` is true, return it as a JSON string instead, which `SubmitReview`
+        passes through without serializing it again.
         """
         if result.version == 1:
-            return self.to_v1_changes(result.documents[0])
+            changes = self.to_v1_changes(result.documents[0])
+            return jsonbackend.dumps(changes) if serialize else changes
         elif result.version == 3:
-            return self.to_v3_changes(result.documents)
+            return self.to_v3_changes(result.documents, serialize=serialize)
         else:
             raise ValueError(f"unsupported file version `{result.version!r}`")
 
@@ -359,37 +688,114 @@ class PredictionList(List[PredictionType]):
 
         return changes
 
-    def to_v3_changes(self, documents: "Iterable[Document]") -> "list[dict[str, Any]]":
+    @overload
+    def to_v3_changes(
+        self,
+        documents: "Iterable[Document]",
+        *,
+        serialize: "Literal[False]" = False,
+    ) -> "list[dict[str, Any]]": ...
+
+    @overload
+    def to_v3_changes(
+        self, documents: "Iterable[Document]", *, serialize: "Literal[True]"
+    ) -> str: ...
+
+    @overload
+    def to_v3_changes(
+        self, documents: "Iterable[Document]", *, serialize: bool
+    ) -> "list[dict[str, Any]] | str": ...
+
+    def to_v3_changes(
+        self, documents: "Iterable[Document]", *, serialize: bool = False
+    ) -> "list[dict[str, Any]] | str":
         """
         Create a v3 list for the `changes` argument of `SubmitReview`.
+
+        If `serialize` is true, return it as a JSON string instead. Each document's
+        changes are serialized as soon as they're created, so the changes for the
+        whole bundle never exist as dicts at once.
         """
-        changes: "list[dict[str, Any]]" = []
+        documents = [document for document in documents if not document.failed]
+        predictions_by_document: "dict[Document, dict[ModelGroup, list[Any]]]" = {
+            document: {} for document in documents
+        }
 
-        for document in documents:
-            if document.failed:
-                continue
+        # Group predictions by document and model in a single pass rather than
+        # filtering every prediction for each document.
+        for prediction in self:
+            predictions_by_model = predictions_by_document.get(prediction.document)
 
-            model_results: "dict[str, Any]" = {}
-            changes.append(
-                {
-                    "submissionfile_id": document.id,
-                    "model_results": model_results,
-                    "component_results": {},
-                }
-            )
-            predictions_by_model = self.where(
-                document=document,
-            ).groupby(
-                attrgetter("model"),
-            )
+            if predictions_by_model is not None:
+                predictions_by_model.setdefault(prediction.model, []).append(prediction)
 
-            for model, predictions in predictions_by_model.items():
-                model_results[str(model.id)] = [
-                    prediction.to_v3_dict() for prediction in predictions
-                ]
+        changes = (
+            _document_changes(document, predictions_by_document.pop(document))
+            for document in documents
+        )
 
-            for model_id in document._model_sections:
-                if model_id not in model_results:
-                    model_results[model_id] = []
+        if serialize:
+            return (b"[" + b",".join(map(jsonbackend.dumpb, changes)) + b"]").decode()
+        else:
+            return list(changes)
 
-        return changes
+    def to_frame(self) -> "Any":
+        """
+        Create a pandas `DataFrame` with a row for each prediction. Span and box
+        columns are flattened, and columns that don't apply to a prediction's type are
+        null. Columns are built in a single pass over the predictions.
+
+        Raise `ImportError` if pandas isn't installed.
+        """
+        return to_pandas(prediction_columns(self))
+
+    def to_arrow(self) -> "Any":
+        """
+        Create a pyarrow `Table` with the same columns as `to_frame()`.
+
+        Raise `ImportError` if pyarrow isn't installed.
+        """
+        return to_arrow(prediction_columns(self))
+
+
+def _document_changes(
+    document: "Document", predictions_by_model: "dict[ModelGroup, list[Any]]"
+) -> "dict[str, Any]":
+    """
+    Create the v3 changes for `document` from its predictions grouped by model.
+    """
+    model_results = {
+        str(model.id): [prediction.to_v3_dict() for prediction in predictions]
+        for model, predictions in predictions_by_model.items()
+    }
+
+    for model_id in document._model_sections:
+        if model_id not in model_results:
+            model_results[model_id] = []
+
+    return {
+        "submissionfile_id": document.id,
+        "model_results": model_results,
+        "component_results": {},
+    }
+
+
+def _matching(
+    index: "dict[Any, list[int]]", predicate: "Callable[[Any], bool]"
+) -> "Iterator[list[int]]":
+    """
+    Yield the positions of each indexed value that matches `predicate`.
+    """
+    return (positions for value, positions in index.items() if predicate(value))
+
+
+def _union(positions: "Iterable[list[int]]") -> "list[int]":
+    """
+    Return the sorted union of disjoint lists of sorted positions.
+    """
+    positions = list(positions)
+
+    if len(positions) == 1:
+        return positions[0]
+    else:
+        return sorted(chain.from_iterable(positions))
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 
+from ..errors import ResultError
 from ..model import ModelGroupType
+from ..normalization import normalize_v1_prediction, normalize_v3_prediction
 from .box import NULL_BOX, Box
 from .citation import NULL_CITATION, Citation
 from .classification import Classification
@@ -15,7 +17,6 @@ from .unbundling import Unbundling
 
 if TYPE_CHECKING:
     from ..document import Document
-    from ..errors import ResultError
     from ..model import ModelGroup
     from ..review import Review
 
@@ -55,6 +56,8 @@ def from_v1_dict(
     """
     Create a `Prediction` subclass from a v1 prediction dictionary.
     """
+    prediction = normalize_v1_prediction(prediction)
+
     if model.type == CLASSIFICATION:
         return Classification.from_v1_dict(document, model, review, prediction)
     elif model.type == DOCUMENT_EXTRACTION:
@@ -74,6 +77,8 @@ def from_v3_dict(
     """
     Create a `Prediction` subclass from a v3 prediction dictionary.
     """
+    prediction = normalize_v3_prediction(prediction, model.type)
+
     if model.type in (CLASSIFICATION, GENAI_CLASSIFICATION):
         return Classification.from_v3_dict(document, model, review, prediction)
     elif model.type in (DOCUMENT_EXTRACTION, GENAI_EXTRACTION):
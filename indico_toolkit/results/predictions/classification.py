@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from sys import intern
 from typing import TYPE_CHECKING
 
 from ..review import Review
-from ..utilities import get, omit
+from ..utilities import get, intern_keys, omit
 from .prediction import Prediction
 
 if TYPE_CHECKING:
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
 
 @dataclass
 class Classification(Prediction):
+    __slots__ = ()
+
     @staticmethod
     def _from_dict(
         document: "Document",
@@ -28,8 +31,8 @@ class Classification(Prediction):
             document=document,
             model=model,
             review=review,
-            label=get(prediction, str, "label"),
-            confidences=get(prediction, dict, "confidence"),
+            label=intern(get(prediction, str, "label")),
+            confidences=intern_keys(get(prediction, dict, "confidence")),
             extras=omit(prediction, "label", "confidence"),
         )
 
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from sys import intern
 from typing import TYPE_CHECKING
 
 from ..review import Review
-from ..utilities import get, has, omit
+from ..utilities import get, has, intern_keys, omit
 from .extraction import Extraction
 from .group import Group
 from .span import NULL_SPAN, Span
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 
 @dataclass
 class DocumentExtraction(Extraction):
+    __slots__ = ("groups", "spans")
+
     groups: "set[Group]"
     spans: "list[Span]"
 
@@ -53,8 +56,8 @@ class DocumentExtraction(Extraction):
             document=document,
             model=model,
             review=review,
-            label=get(prediction, str, "label"),
-            confidences=get(prediction, dict, "confidence"),
+            label=intern(get(prediction, str, "label")),
+            confidences=intern_keys(get(prediction, dict, "confidence")),
             text=get(prediction, str, "normalized", "formatted"),
             accepted=(
                 has(prediction, bool, "accepted") and get(prediction, bool, "accepted")
@@ -91,8 +94,8 @@ class DocumentExtraction(Extraction):
             document=document,
             model=model,
             review=review,
-            label=get(prediction, str, "label"),
-            confidences=get(prediction, dict, "confidence"),
+            label=intern(get(prediction, str, "label")),
+            confidences=intern_keys(get(prediction, dict, "confidence")),
             text=get(prediction, str, "normalized", "formatted"),
             accepted=(
                 has(prediction, bool, "accepted") and get(prediction, bool, "accepted")
@@ -127,7 +130,7 @@ class DocumentExtraction(Extraction):
             "end": self.span.end,
         }
 
-        prediction["normalized"]["formatted"] = self.text
+        prediction["normalized"] = {**prediction["normalized"], "formatted": self.text}
         prediction["text"] = self.text  # 6.10 sometimes reverts to raw text in review.
 
         if self.accepted:
@@ -149,7 +152,7 @@ class DocumentExtraction(Extraction):
             "spans": [span.to_dict() for span in self.spans],
         }
 
-        prediction["normalized"]["formatted"] = self.text
+        prediction["normalized"] = {**prediction["normalized"], "formatted": self.text}
         prediction["text"] = self.text  # 6.10 sometimes reverts to raw text in review.
 
         if self.accepted:
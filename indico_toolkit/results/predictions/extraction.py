@@ -5,6 +5,8 @@ from .prediction import Prediction
 
 @dataclass
 class Extraction(Prediction):
+    __slots__ = ("text", "accepted", "rejected")
+
     text: str
     accepted: bool
     rejected: bool
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from enum import Enum
+from sys import intern
 from typing import TYPE_CHECKING
 
 from ..review import Review
-from ..utilities import get, has, omit
+from ..utilities import get, has, intern_keys, omit
 from .box import Box
 from .extraction import Extraction
 
@@ -22,6 +23,8 @@ class FormExtractionType(Enum):
 
 @dataclass
 class FormExtraction(Extraction):
+    __slots__ = ("type", "box", "checked", "signed")
+
     type: FormExtractionType
     box: Box
     checked: bool
@@ -41,8 +44,8 @@ class FormExtraction(Extraction):
             document=document,
             model=model,
             review=review,
-            label=get(prediction, str, "label"),
-            confidences=get(prediction, dict, "confidence"),
+            label=intern(get(prediction, str, "label")),
+            confidences=intern_keys(get(prediction, dict, "confidence")),
             text=get(prediction, str, "normalized", "formatted"),
             accepted=(
                 has(prediction, bool, "accepted") and get(prediction, bool, "accepted")
@@ -96,18 +99,22 @@ class FormExtraction(Extraction):
             "bottom": self.box.bottom,
         }
 
+        normalized = prediction["normalized"] = {**prediction["normalized"]}
+
         if self.type == FormExtractionType.CHECKBOX:
-            prediction["normalized"]["structured"]["checked"] = self.checked
-            prediction["normalized"]["formatted"] = (
-                "Checked" if self.checked else "Unchecked"
-            )
+            normalized["structured"] = {
+                **normalized["structured"],
+                "checked": self.checked,
+            }
+            normalized["formatted"] = "Checked" if self.checked else "Unchecked"
         elif self.type == FormExtractionType.SIGNATURE:
-            prediction["normalized"]["structured"]["signed"] = self.signed
-            prediction["normalized"]["formatted"] = (
-                "Signed" if self.signed else "Unsigned"
-            )
+            normalized["structured"] = {
+                **normalized["structured"],
+                "signed": self.signed,
+            }
+            normalized["formatted"] = "Signed" if self.signed else "Unsigned"
         elif self.type == FormExtractionType.TEXT:
-            prediction["normalized"]["formatted"] = self.text
+            normalized["formatted"] = self.text
             prediction["text"] = self.text  # 6.10 sometimes reverts to text in review.
 
         if self.accepted:
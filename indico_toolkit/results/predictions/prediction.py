@@ -12,12 +12,17 @@ if TYPE_CHECKING:
 
 @dataclass
 class Prediction:
+    __slots__ = ("document", "model", "review", "label", "confidences", "extras")
+
     document: "Document"
     model: "ModelGroup"
     review: "Review | None"
 
     label: str
     confidences: "dict[str, float]"
+    # Unparsed sections of the prediction dictionary. Nested sections are shared with
+    # the result file they came from, so `to_v1_dict()` and `to_v3_dict()` copy them
+    # before updating them.
     extras: "dict[str, Any]"
 
     @property
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from sys import intern
 from typing import TYPE_CHECKING
 
 from ..review import Review
-from ..utilities import get, has, omit
+from ..utilities import get, has, intern_keys, omit
 from .citation import NULL_CITATION, Citation
 from .extraction import Extraction
 
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 
 @dataclass
 class Summarization(Extraction):
+    __slots__ = ("citations",)
+
     citations: "list[Citation]"
 
     @property
@@ -60,8 +63,8 @@ class Summarization(Extraction):
             document=document,
             model=model,
             review=review,
-            label=get(prediction, str, "label"),
-            confidences=get(prediction, dict, "confidence"),
+            label=intern(get(prediction, str, "label")),
+            confidences=intern_keys(get(prediction, dict, "confidence")),
             text=get(prediction, str, "text"),
             accepted=(
                 has(prediction, bool, "accepted") and get(prediction, bool, "accepted")
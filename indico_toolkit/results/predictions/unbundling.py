@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from sys import intern
 from typing import TYPE_CHECKING
 
 from ..review import Review
-from ..utilities import get, omit
+from ..utilities import get, intern_keys, omit
 from .prediction import Prediction
 
 if TYPE_CHECKING:
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
 
 @dataclass
 class Unbundling(Prediction):
+    __slots__ = ("pages",)
+
     pages: "list[int]"
 
     @staticmethod
@@ -30,8 +33,8 @@ class Unbundling(Prediction):
             document=document,
             model=model,
             review=review,
-            label=get(prediction, str, "label"),
-            confidences=get(prediction, dict, "confidence"),
+            label=intern(get(prediction, str, "label")),
+            confidences=intern_keys(get(prediction, dict, "confidence")),
             pages=[
                 get(span, int, "page_num")
                 for span in get(prediction, list, "spans")  # fmt: skip
@@ -4,6 +4,7 @@ from itertools import chain
 from typing import TYPE_CHECKING
 
 from . import predictions as prediction
+from .diff import PredictionDiff, review_key, review_location, review_value
 from .document import Document
 from .model import ModelGroup
 from .normalization import normalize_v1_result, normalize_v3_result
@@ -13,6 +14,7 @@ from .review import Review, ReviewType
 from .utilities import get
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
     from typing import Any
 
 
@@ -31,30 +33,43 @@ class Result:
 
     @property
     def pre_review(self) -> "PredictionList[Prediction]":
-        return self.predictions.where(review=None)
+        return self.predictions._reviewed_by(None)
 
     @property
     def auto_review(self) -> "PredictionList[Prediction]":
-        return self.predictions.where(review=ReviewType.AUTO)
+        return self.predictions._reviewed_by(ReviewType.AUTO)
 
     @property
     def manual_review(self) -> "PredictionList[Prediction]":
-        return self.predictions.where(review=ReviewType.MANUAL)
+        return self.predictions._reviewed_by(ReviewType.MANUAL)
 
     @property
     def admin_review(self) -> "PredictionList[Prediction]":
-        return self.predictions.where(review=ReviewType.ADMIN)
+        return self.predictions._reviewed_by(ReviewType.ADMIN)
 
     @property
     def final(self) -> "PredictionList[Prediction]":
-        return self.predictions.where(review=self.reviews[-1] if self.reviews else None)
+        return self.predictions._reviewed_by(self.reviews[-1] if self.reviews else None)
+
+    def review_diff(
+        self,
+        *,
+        key: "Callable[[Prediction], Hashable]" = review_key,
+        location: "Callable[[Prediction], Hashable]" = review_location,
+        value: "Callable[[Prediction], Hashable]" = review_value,
+    ) -> PredictionDiff:
+        """
+        Compare predictions before review to the final predictions to find the ones
+        reviewers added, removed, and changed. See `PredictionList.diff()`.
+        """
+        return self.pre_review.diff(self.final, key=key, location=location, value=value)
 
     @staticmethod
     def from_v1_dict(result: object) -> "Result":
         """
         Create a `Result` from a v1 result file dictionary.
         """
-        normalize_v1_result(result)
+        result = normalize_v1_result(result)
 
         version = get(result, int, "file_version")
         submission_id = get(result, int, "submission_id")
@@ -67,9 +82,11 @@ class Result:
         # Reviews must be sorted after parsing predictions, as they match positionally
         # with prediction lists in `post_reviews`.
         reviews = list(map(Review.from_dict, review_metadata))
+        # Iterate in reverse so that the first model with each name takes precedence.
+        models_by_name = {model.name: model for model in reversed(models)}
 
         for model_name, model_predictions in submission_results.items():
-            model = next(filter(lambda model: model.name == model_name, models))
+            model = models_by_name[model_name]
             reviewed_model_predictions: "list[tuple[Review | None, Any]]" = [
                 (None, get(model_predictions, list, "pre_review")),
                 *filter(
@@ -100,7 +117,7 @@ class Result:
         """
         Create a `Result` from a v3 result file dictionary.
         """
-        normalize_v3_result(result)
+        result = normalize_v3_result(result)
 
         version = get(result, int, "file_version")
         submission_id = get(result, int, "submission_id")
@@ -115,12 +132,13 @@ class Result:
         models = sorted(map(ModelGroup.from_v3_dict, modelgroup_metadata.values()))
         predictions: "PredictionList[Prediction]" = PredictionList()
         reviews = sorted(map(Review.from_dict, review_metadata.values()))
+        # Iterate in reverse so that the first document or model with each ID takes
+        # precedence.
+        documents_by_id = {document.id: document for document in reversed(documents)}
+        models_by_id = {model.id: model for model in reversed(models)}
 
         for document_dict in submission_results:
-            document_id = get(document_dict, int, "submissionfile_id")
-            document = next(
-                filter(lambda document: document.id == document_id, documents)
-            )
+            document = documents_by_id[get(document_dict, int, "submissionfile_id")]
             reviewed_model_predictions: "list[tuple[Review | None, Any]]" = [
                 (None, get(document_dict, dict, "model_results", "ORIGINAL"))
             ]
@@ -132,9 +150,7 @@ class Result:
 
             for review, model_section in reviewed_model_predictions:
                 for model_id, model_predictions in model_section.items():
-                    model = next(
-                        filter(lambda model: model.id == int(model_id), models)
-                    )
+                    model = models_by_id[int(model_id)]
                     predictions.extend(
                         map(
                             partial(prediction.from_v3_dict, document, model, review),
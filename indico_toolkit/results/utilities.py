@@ -1,4 +1,5 @@
 from collections.abc import Iterable, Iterator
+from sys import intern
 from typing import Callable, TypeVar
 
 from .errors import ResultError
@@ -60,6 +61,17 @@ def nfilter(
     yield from values
 
 
+def intern_keys(dictionary: "dict[str, Value]") -> "dict[str, Value]":
+    """
+    Return `dictionary` with interned keys, so that keys repeated across many
+    dictionaries share the same strings. It's only copied if a key isn't interned.
+    """
+    if all(intern(key) is key for key in dictionary):
+        return dictionary
+
+    return {intern(key): value for key, value in dictionary.items()}
+
+
 def omit(dictionary: object, *keys: str) -> "dict[str, Value]":
     """
     Return a shallow copy of `dictionary` with `keys` omitted.
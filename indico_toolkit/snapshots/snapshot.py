@@ -4,9 +4,7 @@ from __future__ import (
 from typing import List, Union, Tuple
 import pandas as pd
 import os
-import json
-from json import JSONDecodeError
-from indico_toolkit import ToolkitInstantiationError, ToolkitInputError
+from indico_toolkit import ToolkitInstantiationError, ToolkitInputError, jsonbackend
 
 # TODO: add functionality for classification snapshots
 
@@ -257,8 +255,8 @@ class Snapshot:
 
     def _convert_col_from_json(self):
         try:
-            self.df[self.label_col] = self.df[self.label_col].apply(json.loads)
-        except (TypeError, JSONDecodeError):
+            self.df[self.label_col] = self.df[self.label_col].apply(jsonbackend.loads)
+        except (TypeError, ValueError):
             if isinstance(self.df[self.label_col].iloc[0], list):
                 return  # json column already converted
             raise ToolkitInputError(
@@ -274,7 +272,7 @@ class Snapshot:
             )
 
     def _convert_col_to_json(self, column: str):
-        self.df[column] = self.df[column].apply(json.dumps)
+        self.df[column] = self.df[column].apply(jsonbackend.dumps)
 
     def _infer_text_col(self):
         if "text" in self.df.columns:
@@ -1,5 +1,4 @@
 import tempfile
-import json
 import shutil
 import os
 from typing import List
@@ -19,6 +18,7 @@ from indico.types import (
     TableReadOrder,
 )
 from indico.types import Workflow
+from indico_toolkit import jsonbackend
 from indico_toolkit.errors import ToolkitInputError
 
 from .queries import *
@@ -202,7 +202,7 @@ class Structure:
                 source_column_id=column_id,
                 after_component_id=prev_comp_id,
                 new_labelset_args=new_labelset,
-                model_training_options=json.dumps(kwargs),
+                model_training_options=jsonbackend.dumps(kwargs),
             )
         )
         print(
@@ -0,0 +1,300 @@
+import bisect
+import copy
+import itertools
+import json
+import random
+import re
+import time
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import (
+    NULL_TOKEN,
+    EtlOutput,
+    Span,
+    Table,
+    TokenColumns,
+    TokenNotFoundError,
+)
+
+from .test_files import data_folder, read_url
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def etl_output() -> EtlOutput:
+    etl_output_file = data_folder / "4288" / "107456" / "101155" / "etl_output.json"
+    return etloutput.load(str(etl_output_file), reader=read_url)
+
+
+def test_tokens_for(etl_output: EtlOutput) -> None:
+    """
+    Compare `tokens_for()` against calling `token_for()` once per span on a mix of
+    single-token, multi-token, and unresolvable spans.
+    """
+    randomizer = random.Random(0)
+    spans = []
+
+    for token in randomizer.choices(etl_output.tokens, k=5000):
+        if randomizer.random() < 0.2:
+            spans.append(Span(token.span.page, token.span.end, token.span.end))
+        else:
+            extend = randomizer.randint(0, 3) * 7
+            spans.append(
+                Span(token.span.page, token.span.start, token.span.end + extend)
+            )
+
+    def token_for_loop() -> "tuple[etloutput.Token, ...]":
+        tokens = []
+
+        for span in spans:
+            try:
+                tokens.append(etl_output.token_for(span))
+            except TokenNotFoundError:
+                tokens.append(NULL_TOKEN)
+
+        return tuple(tokens)
+
+    assert etl_output.tokens_for(spans) == token_for_loop()
+
+    loop_time = min(timeit.repeat(token_for_loop, number=1, repeat=5))
+    bulk_time = min(
+        timeit.repeat(lambda: etl_output.tokens_for(spans), number=1, repeat=5)
+    )
+    print(f"token_for loop: {loop_time:.4f}s, tokens_for: {bulk_time:.4f}s")
+
+
+def _table_dict(num_rows: int, num_columns: int) -> dict:
+    """
+    Create a table dictionary with a header cell that spans every column.
+    """
+    cells = [
+        {
+            "cell_type": "header",
+            "text": "Header",
+            "rows": [0],
+            "columns": list(range(num_columns)),
+            "position": {"top": 0, "left": 0, "right": num_columns * 10, "bottom": 9},
+            "doc_offsets": [],
+        }
+    ]
+
+    for row in range(1, num_rows):
+        for column in range(num_columns):
+            cells.append(
+                {
+                    "cell_type": "content",
+                    "text": f"{row}, {column}",
+                    "rows": [row],
+                    "columns": [column],
+                    "position": {
+                        "top": row * 10,
+                        "left": column * 10,
+                        "right": column * 10 + 9,
+                        "bottom": row * 10 + 9,
+                    },
+                    "doc_offsets": [
+                        {"start": row * 100 + column, "end": row * 100 + column + 1}
+                    ],
+                }
+            )
+
+    return {
+        "page_num": 0,
+        "num_rows": num_rows,
+        "num_columns": num_columns,
+        "position": {"top": 0, "left": 0, "right": num_columns * 10, "bottom": 9999},
+        "cells": cells,
+    }
+
+
+def test_table_from_dict() -> None:
+    """
+    Load tables with 5k and 50k cells (200 and 2,000 rows) and check that grouping
+    their cells into rows and columns scales linearly. The previous implementation
+    scanned every cell once per row and column, which took ~9s at 50k cells.
+    """
+    small_table = Table.from_dict(_table_dict(num_rows=201, num_columns=25))
+    large_dict = _table_dict(num_rows=2001, num_columns=25)
+
+    start = time.perf_counter()
+    large_table = Table.from_dict(large_dict)
+    load_time = time.perf_counter() - start
+
+    def quadratic_groups(table: Table) -> "tuple[tuple, tuple]":
+        rows = tuple(
+            tuple(cell for cell in table.cells if row in cell.range.rows)
+            for row in range(len(table.rows))
+        )
+        columns = tuple(
+            tuple(cell for cell in table.cells if column in cell.range.columns)
+            for column in range(len(table.columns))
+        )
+        return rows, columns
+
+    assert (small_table.rows, small_table.columns) == quadratic_groups(small_table)
+
+    def group_time(table_dict: dict) -> float:
+        times = []
+
+        for _ in range(3):
+            table = Table.from_dict(copy.deepcopy(table_dict))
+            start = time.perf_counter()
+            table.rows[0], table.columns[0]
+            times.append(time.perf_counter() - start)
+
+        return min(times)
+
+    quadratic_time = min(
+        timeit.repeat(lambda: quadratic_groups(small_table), number=1, repeat=3)
+    )
+    small_time = group_time(_table_dict(num_rows=201, num_columns=25))
+    large_time = group_time(large_dict)
+    print(
+        f"50k cell load: {load_time:.4f}s, "
+        f"5k cell grouping: {small_time:.4f}s (quadratic {quadratic_time:.4f}s), "
+        f"50k cell grouping: {large_time:.4f}s"
+    )
+
+    assert len(large_table.rows) == 2001
+    assert len(large_table.cells) == 50001
+
+
+def test_trusted_decode() -> None:
+    """
+    Compare decoding token and cell dictionaries with and without `trusted`.
+    """
+    page_folder = data_folder / "4288" / "107456" / "101155"
+    token_dicts_by_page = [
+        read_url(str(page_folder / f"page_{page}_tokens.json")) for page in range(6)
+    ] * 20
+    table_dict = _table_dict(num_rows=401, num_columns=25)
+
+    def decode(trusted: bool) -> "tuple[object, Table]":
+        tokens, _ = etloutput.TokenColumns.from_pages(
+            token_dicts_by_page, trusted=trusted
+        )
+        return tokens, Table.from_dict(table_dict, trusted=trusted)
+
+    assert decode(trusted=True) == decode(trusted=False)
+
+    validated_time = min(
+        timeit.repeat(lambda: decode(trusted=False), number=1, repeat=5)
+    )
+    trusted_time = min(timeit.repeat(lambda: decode(trusted=True), number=1, repeat=5))
+    print(f"validated: {validated_time:.4f}s, trusted: {trusted_time:.4f}s")
+
+
+def test_streamed_tokens() -> None:
+    """
+    Compare peak memory and time for decoding a 20k token page from bytes with and
+    without decoding the whole JSON payload first.
+    """
+    payload = json.dumps(
+        [
+            {
+                "text": f"token{index}",
+                "page_num": 0,
+                "doc_offset": {"start": index * 11, "end": index * 11 + 10},
+                "position": {
+                    "top": index // 10 * 20,
+                    "left": index % 10 * 100,
+                    "right": index % 10 * 100 + 90,
+                    "bottom": index // 10 * 20 + 15,
+                },
+            }
+            for index in range(20_000)
+        ]
+    ).encode()
+
+    def decoded() -> TokenColumns:
+        return TokenColumns.from_dicts(json.loads(payload))
+
+    def streamed() -> TokenColumns:
+        return TokenColumns.from_dicts(payload)
+
+    def peak_memory(function: "Callable[[], object]") -> int:
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    assert streamed() == decoded()
+
+    decoded_peak = peak_memory(decoded)
+    streamed_peak = peak_memory(streamed)
+    decoded_time = min(timeit.repeat(decoded, number=1, repeat=3))
+    streamed_time = min(timeit.repeat(streamed, number=1, repeat=3))
+    print(
+        f"decoded: {decoded_peak / 2**20:.1f}MiB {decoded_time:.4f}s, "
+        f"streamed: {streamed_peak / 2**20:.1f}MiB {streamed_time:.4f}s"
+    )
+
+    assert streamed_peak < decoded_peak / 2
+
+
+def test_text_memory() -> None:
+    """
+    Compare the memory used to hold the text of a 1,000 page document.
+    """
+    text_by_page = [
+        f"Page {page}. " + "Lorem ipsum dolor. " * 150 for page in range(1000)
+    ]
+
+    tracemalloc.start()
+    etl_output = EtlOutput.from_pages(text_by_page, [], [])
+    text_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    text_size = len(etl_output.text)
+    print(f"text: {text_size / 2**20:.1f}MiB, EtlOutput: {text_memory / 2**20:.1f}MiB")
+
+    assert etl_output.text_on_page == tuple(text_by_page)
+    assert text_memory < text_size * 1.2
+
+
+def test_search_many(etl_output: EtlOutput) -> None:
+    """
+    Compare `search_many()` against `re.finditer()` and `token_for()` per pattern.
+    """
+    words = [
+        *sorted(set(re.findall(r"[A-Za-z]{6,}", etl_output.text)))[:50],
+        r"\w+",
+        r"\d+",
+    ]
+    page_ends = list(
+        itertools.accumulate(
+            len(page_text) + 1 for page_text in etl_output.text_on_page
+        )
+    )
+
+    def finditer_loop() -> "dict[str, tuple[etloutput.Token, ...]]":
+        matches = {}
+
+        for word in words:
+            tokens = []
+
+            for match in re.finditer(word, etl_output.text):
+                page = bisect.bisect_right(page_ends, match.start())
+                span = Span(page, *match.span())
+                tokens.append(etl_output.token_for(span))
+
+            matches[word] = tuple(tokens)
+
+        return matches
+
+    assert etl_output.search_many(words) == finditer_loop()
+
+    loop_time = min(timeit.repeat(finditer_loop, number=1, repeat=5))
+    search_time = min(
+        timeit.repeat(lambda: etl_output.search_many(words), number=1, repeat=5)
+    )
+    print(f"finditer loop: {loop_time:.4f}s, search_many: {search_time:.4f}s")
@@ -1,9 +1,19 @@
+import asyncio
+import copy
+import io
+import itertools
 import json
+import pickle
+import random
+import re
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
 
 from indico_toolkit import etloutput
+from indico_toolkit.etloutput.jsonstream import iter_json_array
+from indico_toolkit.results import ResultError
 
 data_folder = Path(__file__).parent.parent / "data" / "etloutput"
 
@@ -34,3 +44,435 @@ def test_file_load(etl_output_file: Path) -> None:
     assert char_count in (6466, 6494)
     assert token_count in (948, 978)
     assert table_count in (0, 6)
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_workers(etl_output_file: Path) -> None:
+    tables = (etl_output_file.parent / "tables.json").exists()
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url, tables=tables)
+    etl_output_threaded = etloutput.load(
+        str(etl_output_file), reader=read_url, tables=tables, workers=4
+    )
+
+    assert etl_output_threaded == etl_output
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_lazy(etl_output_file: Path) -> None:
+    read_urls = []
+
+    def read_url_logged(url: str) -> object:
+        read_urls.append(url)
+        return read_url(url)
+
+    tables = (etl_output_file.parent / "tables.json").exists()
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url, tables=tables)
+    lazy_etl_output = etloutput.load(
+        str(etl_output_file), reader=read_url_logged, tables=tables, lazy=True
+    )
+    read_count = len(read_urls)
+
+    token = lazy_etl_output.tokens_on_page[2][0]
+    assert token == etl_output.tokens_on_page[2][0]
+    assert lazy_etl_output.token_for(token.span) == etl_output.token_for(token.span)
+
+    if tables:
+        table = lazy_etl_output.tables_on_page[2][0]
+        cell = table.cells[0]
+        token = lazy_etl_output.token_for(cell.span)
+        assert lazy_etl_output.table_cell_for(token) == (table, cell)
+
+    # v1 page files contain text, so they're read up front.
+    if "page_info" not in str(read_urls):
+        assert len(read_urls) <= read_count + 2
+
+    assert lazy_etl_output == etl_output
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+async def test_file_load_async(etl_output_file: Path) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def read_url_async(url: str) -> object:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return read_url(url)
+
+    tables = (etl_output_file.parent / "tables.json").exists()
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url, tables=tables)
+    etl_output_async = await etloutput.load_async(
+        str(etl_output_file), reader=read_url_async, tables=tables, max_concurrency=3
+    )
+
+    assert etl_output_async == etl_output
+    assert max_in_flight == 3
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_pickle(etl_output_file: Path) -> None:
+    tables = (etl_output_file.parent / "tables.json").exists()
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url, tables=tables)
+
+    assert pickle.loads(pickle.dumps(etl_output)) == etl_output
+    assert copy.deepcopy(etl_output) == etl_output
+
+
+def test_token_columns() -> None:
+    page_folder = data_folder / "4288" / "107456" / "101155"
+    token_dicts_by_page = [
+        read_url(str(page_folder / f"page_{page}_tokens.json")) for page in range(6)
+    ]
+    tokens, tokens_on_page = etloutput.TokenColumns.from_pages(token_dicts_by_page)
+
+    for token_dicts, page_tokens in zip(token_dicts_by_page, tokens_on_page):
+        expected = sorted(
+            map(etloutput.Token.from_dict, token_dicts), key=attrgetter("span")
+        )
+        assert page_tokens == tuple(expected)
+        assert page_tokens[1:3] == tuple(expected[1:3])
+        assert page_tokens[-1] == expected[-1]
+
+    assert tokens == tuple(itertools.chain.from_iterable(tokens_on_page))
+    assert etloutput.TokenColumns.from_dicts(reversed(token_dicts_by_page[0])) == (
+        tokens_on_page[0]
+    )
+
+
+@pytest.mark.parametrize("tables_file", list(data_folder.rglob("tables.json")))
+def test_table_cells_for(tables_file: Path) -> None:
+    etl_output = etloutput.load(
+        str(tables_file.parent / "etl_output.json"), reader=read_url, tables=True
+    )
+    table_cells = etl_output.table_cells_for(etl_output.tokens)
+
+    for token, table_cell in zip(etl_output.tokens, table_cells):
+        if table_cell is None:
+            with pytest.raises(etloutput.TableCellNotFoundError):
+                etl_output.table_cell_for(token)
+        else:
+            assert etl_output.table_cell_for(token) == table_cell
+
+    assert any(table_cells)
+
+
+def test_table_cell_for_row_span() -> None:
+    def cell(rows: list, columns: list, top: int, left: int, bottom: int) -> dict:
+        return {
+            "cell_type": "content",
+            "text": f"{rows} {columns}",
+            "rows": rows,
+            "columns": columns,
+            "position": {
+                "top": top,
+                "left": left,
+                "right": left + 99,
+                "bottom": bottom,
+            },
+            "doc_offsets": [],
+        }
+
+    # The first column's only cell spans both rows.
+    table_dict = {
+        "page_num": 0,
+        "num_rows": 2,
+        "num_columns": 2,
+        "position": {"top": 0, "left": 0, "right": 199, "bottom": 199},
+        "cells": [
+            cell([0, 1], [0], 0, 0, 199),
+            cell([0], [1], 0, 100, 99),
+            cell([1], [1], 100, 100, 199),
+        ],
+    }
+    etl_output = etloutput.EtlOutput.from_pages([""], [[]], [[table_dict]])
+    table = etl_output.tables[0]
+
+    def token(top: int, left: int) -> etloutput.Token:
+        box = etloutput.Box(page=0, top=top, left=left, right=left + 2, bottom=top + 2)
+        return etloutput.Token(text="", box=box, span=etloutput.NULL_SPAN)
+
+    assert etl_output.table_cell_for(token(150, 50)) == (table, table.cells[0])
+    assert etl_output.table_cell_for(token(50, 150)) == (table, table.cells[1])
+    assert etl_output.table_cell_for(token(150, 150)) == (table, table.cells[2])
+    assert etl_output.table_cells_for([token(150, 150), token(300, 300)]) == (
+        (table, table.cells[2]),
+        None,
+    )
+
+    with pytest.raises(etloutput.TableCellNotFoundError):
+        etl_output.table_cell_for(token(300, 300))
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_trusted(etl_output_file: Path) -> None:
+    files: "dict[str, object]" = {}
+    unmodified_files: "dict[str, object]" = {}
+
+    def read_url_cached(url: str) -> object:
+        if url not in files:
+            files[url] = read_url(url)
+            unmodified_files[url] = copy.deepcopy(files[url])
+        return files[url]
+
+    tables = (etl_output_file.parent / "tables.json").exists()
+    etl_output = etloutput.load(
+        str(etl_output_file), reader=read_url_cached, tables=tables
+    )
+    trusted_etl_output = etloutput.load(
+        str(etl_output_file), reader=read_url_cached, tables=tables, trusted=True
+    )
+
+    assert trusted_etl_output == etl_output
+    assert files == unmodified_files
+
+
+def test_trusted_errors() -> None:
+    token_dicts = read_url(
+        str(data_folder / "4288" / "107456" / "101155" / "page_0_tokens.json")
+    )
+    del token_dicts[1]["position"]
+
+    with pytest.raises(ResultError):
+        etloutput.TokenColumns.from_dicts(token_dicts, trusted=True)
+
+    token_dicts[0]["position"] = None
+
+    with pytest.raises(ResultError):
+        etloutput.TokenColumns.from_dicts(token_dicts, trusted=True)
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_cache(etl_output_file: Path, tmp_path: Path) -> None:
+    read_urls = []
+
+    def read_url_logged(url: str) -> object:
+        read_urls.append(url)
+        return read_url(url)
+
+    cache = etloutput.EtlOutputCache(tmp_path)
+    tables = (etl_output_file.parent / "tables.json").exists()
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url, tables=tables)
+    missed_etl_output = etloutput.load(
+        str(etl_output_file), reader=read_url_logged, tables=tables, cache=cache
+    )
+    read_count = len(read_urls)
+    cached_etl_output = etloutput.load(
+        str(etl_output_file), reader=read_url_logged, tables=tables, cache=cache
+    )
+
+    assert missed_etl_output == etl_output
+    assert cached_etl_output == etl_output
+    assert len(read_urls) == read_count
+    assert cached_etl_output.tokens_on_page[2] == etl_output.tokens_on_page[2]
+    assert (
+        cache.get(str(etl_output_file), text=True, tokens=False, tables=tables) is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_load_async_cache(tmp_path: Path) -> None:
+    etl_output_file = data_folder / "4288" / "107456" / "101155" / "etl_output.json"
+    read_urls = []
+
+    async def read_url_async(url: str) -> object:
+        read_urls.append(url)
+        return read_url(url)
+
+    cache = etloutput.EtlOutputCache(tmp_path)
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url)
+    missed_etl_output = await etloutput.load_async(
+        str(etl_output_file), reader=read_url_async, cache=cache
+    )
+    read_count = len(read_urls)
+    cached_etl_output = await etloutput.load_async(
+        str(etl_output_file), reader=read_url_async, cache=cache
+    )
+
+    assert missed_etl_output == etl_output
+    assert cached_etl_output == etl_output
+    assert len(read_urls) == read_count
+
+
+def test_cache_eviction(tmp_path: Path) -> None:
+    etl_output_file = data_folder / "4288" / "107456" / "101155" / "etl_output.json"
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url)
+    cache = etloutput.EtlOutputCache(tmp_path)
+    cache.put("first", etl_output, text=True, tokens=True, tables=False)
+    entry_size = sum(path.stat().st_size for path in tmp_path.iterdir())
+
+    cache.max_size = entry_size * 2
+    cache.put("second", etl_output, text=True, tokens=True, tables=False)
+    cache.get("first", text=True, tokens=True, tables=False)
+    cache.put("third", etl_output, text=True, tokens=True, tables=False)
+
+    assert cache.get("first", text=True, tokens=True, tables=False) == etl_output
+    assert cache.get("second", text=True, tokens=True, tables=False) is None
+    assert cache.get("third", text=True, tokens=True, tables=False) == etl_output
+
+    for path in tmp_path.iterdir():
+        path.write_bytes(path.read_bytes()[:-4])
+
+    assert cache.get("first", text=True, tokens=True, tables=False) is None
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_undecoded_tokens(etl_output_file: Path) -> None:
+    opened: "list[io.BufferedReader]" = []
+    max_open = 0
+
+    def read_url_undecoded(url: str) -> object:
+        nonlocal max_open
+
+        if url.endswith("_tokens.json"):
+            storage_folder_path = url.split("/storage/submission/")[-1]
+            opened.append((data_folder / storage_folder_path).open("rb"))
+            max_open = max(max_open, sum(not file.closed for file in opened))
+            return opened[-1]
+        else:
+            return read_url(url)
+
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url)
+    streamed_etl_output = etloutput.load(
+        str(etl_output_file), reader=read_url_undecoded
+    )
+
+    assert streamed_etl_output == etl_output
+    assert all(file.closed for file in opened)
+    assert max_open <= 1
+
+    etloutput.load(str(etl_output_file), reader=read_url_undecoded, workers=4)
+    assert all(file.closed for file in opened)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64 * 1024])
+def test_iter_json_array(chunk_size: int) -> None:
+    values = [{"text": "naïve €", "page_num": 12345}, [], 67890, -1.5e3, "", None]
+    payload = " \n[ " + ",\n ".join(map(json.dumps, values)) + " ]\n"
+
+    for undecoded in (
+        payload,
+        payload.encode(),
+        io.BytesIO(payload.encode("utf-8-sig")),
+        io.StringIO(payload),
+    ):
+        assert list(iter_json_array(undecoded, chunk_size)) == values
+
+    assert list(iter_json_array(b" [ ] ", chunk_size)) == []
+
+    for invalid in ('{"text": ""}', "[1, 2", "[1 2]", '[{"text": }]'):
+        with pytest.raises(ResultError):
+            list(iter_json_array(invalid, chunk_size))
+
+
+def test_tokens_in_box_and_range() -> None:
+    etl_output_file = data_folder / "4288" / "107456" / "101155" / "etl_output.json"
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url)
+    randomizer = random.Random(0)
+
+    def area_inside(token: etloutput.Token, box: etloutput.Box) -> float:
+        area = (token.box.right - token.box.left) * (token.box.bottom - token.box.top)
+        inside = max(
+            0, min(token.box.right, box.right) - max(token.box.left, box.left)
+        ) * max(0, min(token.box.bottom, box.bottom) - max(token.box.top, box.top))
+        return inside / area if area > 0 else 1
+
+    def touches(token: etloutput.Token, box: etloutput.Box) -> bool:
+        return (
+            token.box.page == box.page
+            and token.box.top <= box.bottom
+            and token.box.bottom >= box.top
+            and token.box.left <= box.right
+            and token.box.right >= box.left
+        )
+
+    for _ in range(50):
+        top, left = randomizer.randint(0, 2000), randomizer.randint(0, 2000)
+        box = etloutput.Box(
+            page=randomizer.randint(0, 5),
+            top=top,
+            left=left,
+            right=left + randomizer.randint(0, 1000),
+            bottom=top + randomizer.randint(0, 1000),
+        )
+
+        for overlap in (0, 0.5, 1):
+            assert etl_output.tokens_in_box(box, overlap) == tuple(
+                token
+                for token in etl_output.tokens
+                if touches(token, box) and area_inside(token, box) >= overlap
+            )
+
+    for _ in range(50):
+        start, end = sorted(
+            randomizer.sample(etl_output.tokens, 2), key=attrgetter("span")
+        )
+        start_span = etloutput.Span(
+            start.span.page, start.span.start + 1, start.span.end
+        )
+        end_span = etloutput.Span(end.span.page, end.span.start, end.span.end - 1)
+
+        assert etl_output.tokens_in_range(start_span, end_span) == tuple(
+            token
+            for token in etl_output.tokens
+            if (token.span.page, token.span.end) > (start_span.page, start_span.start)
+            and (token.span.page, token.span.start) < (end_span.page, end_span.end)
+        )
+
+    assert etl_output.tokens_in_box(etloutput.Box(9, 0, 0, 9, 9)) == ()
+    assert (
+        etl_output.tokens_in_range(etloutput.Span(9, 0, 0), etloutput.Span(9, 9, 9))
+        == ()
+    )
+
+
+def test_text_on_page() -> None:
+    text_by_page = ["first page", "", "third\npage", "last"]
+    etl_output = etloutput.EtlOutput.from_pages(text_by_page, [], [])
+
+    assert etl_output.text == "\n".join(text_by_page)
+    assert etl_output.text_on_page == tuple(text_by_page)
+    assert etl_output.text_on_page[-2] == "third\npage"
+    assert etl_output.text_on_page[1:3] == ("", "third\npage")
+
+    with pytest.raises(IndexError):
+        etl_output.text_on_page[4]
+
+
+def test_search() -> None:
+    etl_output_file = data_folder / "4288" / "107456" / "101155" / "etl_output.json"
+    etl_output = etloutput.load(str(etl_output_file), reader=read_url)
+    patterns = [
+        "Metrics",
+        re.compile(r"(\d+)\.(\d+)"),
+        re.compile(r"graph(?P<suffix>ql)", re.IGNORECASE),
+        re.compile(r"  \b submission  # comment", re.VERBOSE),
+    ]
+
+    def token_for_matches(pattern: "str | re.Pattern[str]") -> tuple:
+        page_ends = list(
+            itertools.accumulate(
+                len(page_text) + 1 for page_text in etl_output.text_on_page
+            )
+        )
+        tokens = []
+
+        for match in re.finditer(pattern, etl_output.text):
+            page = next(
+                page for page, end in enumerate(page_ends) if match.start() < end
+            )
+            span = etloutput.Span(page, *match.span())
+            tokens.append(etl_output.token_for(span))
+
+        return tuple(tokens)
+
+    matches = etl_output.search_many(patterns)
+
+    for pattern in patterns:
+        assert etl_output.search(pattern) == token_for_matches(pattern)
+        assert matches[pattern] == token_for_matches(pattern)
+        assert matches[pattern]
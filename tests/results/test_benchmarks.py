@@ -0,0 +1,601 @@
+import copy
+import gc
+import json
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+from operator import attrgetter
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import jsonbackend, results
+from indico_toolkit.results.utilities import nfilter
+
+pytestmark = pytest.mark.benchmark
+
+data_folder = Path(__file__).parent.parent / "data" / "results"
+
+
+def _bundle(document_count: int) -> "dict[str, object]":
+    """
+    Create a v3 result for a bundle of `document_count` copies of a reviewed document.
+    """
+    result = json.loads((data_folder / "2914_v3_accepted.json").read_text())
+    (document,) = result["submission_results"]
+    result["submission_results"] = [
+        {**copy.deepcopy(document), "submissionfile_id": document_id}
+        for document_id in range(document_count)
+    ]
+    return result
+
+
+def test_from_v3_dict_scaling() -> None:
+    """
+    Load bundles of 10 to 1,000 documents and check that the time per document stays
+    roughly constant.
+    """
+    times_per_document = {}
+
+    for document_count in (10, 100, 1000):
+        bundles = [_bundle(document_count) for _ in range(3)]
+        times = []
+
+        for bundle in bundles:
+            # Garbage collection pauses grow with the heap and would obscure scaling.
+            gc.collect()
+            gc.disable()
+
+            try:
+                start = time.perf_counter()
+                result = results.Result.from_v3_dict(bundle)
+                times.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+
+        assert len(result.documents) == document_count
+        assert {prediction.document.id for prediction in result.predictions} == set(
+            range(document_count)
+        )
+        times_per_document[document_count] = min(times) / document_count
+
+    print(
+        ", ".join(
+            f"{document_count} documents: {time_per_document * 1e6:.0f}µs/document"
+            for document_count, time_per_document in times_per_document.items()
+        )
+    )
+
+    assert times_per_document[1000] < times_per_document[100] * 3
+
+
+def test_where_indexes() -> None:
+    """
+    Filter a bundle with about 10,000 predictions by document, review, and label, as
+    auto review does for each document, and compare against filtering without
+    indexes.
+    """
+    result = results.Result.from_v3_dict(_bundle(440))
+    predictions = result.predictions
+    review = result.reviews[-1]
+    labels = sorted({prediction.label for prediction in predictions})
+    queries = [
+        (document, label) for document in result.documents[::44] for label in labels
+    ]
+    assert len(predictions) > 10_000
+
+    def linear() -> "list[list[results.Prediction]]":
+        return [
+            [
+                prediction
+                for prediction in predictions
+                if prediction.document == document
+                and prediction.review == review
+                and prediction.label == label
+            ]
+            for document, label in queries
+        ]
+
+    def indexed() -> "list[results.PredictionList[results.Prediction]]":
+        return [
+            predictions.where(document=document, review=review, label=label)
+            for document, label in queries
+        ]
+
+    assert indexed() == linear()
+    linear_time = min(timeit.repeat(linear, number=1, repeat=1)) / len(queries)
+    indexed_time = min(timeit.repeat(indexed, number=1, repeat=3)) / len(queries)
+    print(
+        f"{len(predictions)} predictions: linear {linear_time * 1e6:.0f}µs/query, "
+        f"indexed {indexed_time * 1e6:.0f}µs/query"
+    )
+
+    final = result.final
+    final.where(document=result.documents[0])
+    grouped = final.groupby(attrgetter("document"))
+    assert grouped == final.groupby(lambda prediction: prediction.document)
+    assert len(grouped) == len(result.documents)
+    assert all(
+        prediction.document == document
+        for document, document_predictions in grouped.items()
+        for prediction in document_predictions
+    )
+
+
+def test_final_per_document() -> None:
+    """
+    Filter `Result.final` by each document of a 1,000 document bundle, as auto review
+    does, and check that it stays within a small factor of filtering a list that's
+    hoisted out of the loop.
+    """
+    result = results.Result.from_v3_dict(_bundle(1000))
+
+    def per_document() -> "list[results.PredictionList[results.Prediction]]":
+        return [result.final.where(document=document) for document in result.documents]
+
+    def hoisted() -> "list[results.PredictionList[results.Prediction]]":
+        final = result.final
+        return [final.where(document=document) for document in result.documents]
+
+    assert per_document() == hoisted()
+    per_document_time = min(timeit.repeat(per_document, number=1, repeat=3))
+    hoisted_time = min(timeit.repeat(hoisted, number=1, repeat=3))
+    print(
+        f"{len(result.documents)} documents: per document {per_document_time:.3f}s, "
+        f"hoisted {hoisted_time:.3f}s"
+    )
+
+    assert per_document_time < hoisted_time * 25
+
+
+@pytest.fixture(scope="module")
+def mixed_predictions() -> "results.PredictionList[results.Prediction]":
+    """
+    About 50,000 predictions of every type from all of the result files.
+    """
+    predictions: "results.PredictionList[results.Prediction]" = results.PredictionList()
+
+    for result_file in sorted(data_folder.glob("*.json")):
+        predictions.extend(results.load(result_file, reader=Path.read_text).predictions)
+
+    return results.PredictionList(predictions * (50_000 // len(predictions)))
+
+
+WHERE_CASES = {
+    "label": (
+        {"label": "Last Name"},
+        [lambda prediction: prediction.label == "Last Name"],
+    ),
+    "label_in, min_confidence": (
+        {"label_in": {"First Name", "Last Name"}, "min_confidence": 0.5},
+        [
+            lambda prediction: prediction.label in {"First Name", "Last Name"},
+            lambda prediction: prediction.confidence >= 0.5,
+        ],
+    ),
+    "min_confidence, max_confidence": (
+        {"min_confidence": 0.2, "max_confidence": 0.8},
+        [
+            lambda prediction: prediction.confidence >= 0.2,
+            lambda prediction: prediction.confidence <= 0.8,
+        ],
+    ),
+    "page_in": (
+        {"page_in": (0, 1)},
+        [
+            lambda prediction: (
+                isinstance(prediction, results.Extraction) and prediction.page in {0, 1}
+            )
+            or (
+                isinstance(prediction, results.Unbundling)
+                and bool({0, 1} & set(prediction.pages))
+            )
+        ],
+    ),
+    "accepted, rejected": (
+        {"accepted": False, "rejected": False},
+        [
+            lambda prediction: isinstance(prediction, results.Extraction)
+            and not prediction.accepted,
+            lambda prediction: isinstance(prediction, results.Extraction)
+            and not prediction.rejected,
+        ],
+    ),
+    "checked": (
+        {"checked": True},
+        [
+            lambda prediction: isinstance(prediction, results.FormExtraction)
+            and prediction.checked
+        ],
+    ),
+    "model, label, min_confidence, accepted": (
+        {
+            "model": results.ModelGroupType.DOCUMENT_EXTRACTION,
+            "label": "Last Name",
+            "min_confidence": 0.5,
+            "accepted": False,
+        },
+        [
+            lambda prediction: prediction.model.type
+            == results.ModelGroupType.DOCUMENT_EXTRACTION,
+            lambda prediction: prediction.label == "Last Name",
+            lambda prediction: prediction.confidence >= 0.5,
+            lambda prediction: isinstance(prediction, results.Extraction)
+            and not prediction.accepted,
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize("case", WHERE_CASES)
+def test_where(
+    mixed_predictions: "results.PredictionList[results.Prediction]", case: str
+) -> None:
+    """
+    Compare combined `where()` filters against chaining one filter per predicate for
+    common combinations of filters, both on new lists and on a list that's filtered
+    repeatedly and so uses its type index.
+    """
+    filters, predicates = WHERE_CASES[case]
+
+    def chained() -> "list[results.Prediction]":
+        return list(nfilter(predicates, mixed_predictions))
+
+    def combined() -> "list[results.Prediction]":
+        return results.PredictionList(mixed_predictions).where(**filters)
+
+    def indexed() -> "list[results.Prediction]":
+        return mixed_predictions.where(**filters)
+
+    expected = chained()
+    assert expected
+    assert combined() == expected
+    assert indexed() == expected
+    assert indexed() == expected
+    chained_time = min(timeit.repeat(chained, number=3, repeat=7)) / 3
+    combined_time = min(timeit.repeat(combined, number=3, repeat=7)) / 3
+    indexed_time = min(timeit.repeat(indexed, number=3, repeat=7)) / 3
+    print(
+        f"{case}: chained {chained_time * 1e3:.1f}ms, "
+        f"combined {combined_time * 1e3:.1f}ms, "
+        f"indexed {indexed_time * 1e3:.1f}ms"
+    )
+
+
+def test_prediction_memory() -> None:
+    """
+    Measure the memory retained per prediction when loading many result files, as
+    analytics jobs do, and check that predictions are slotted and share labels.
+    """
+    result_texts = [
+        result_file.read_text() for result_file in sorted(data_folder.glob("*.json"))
+    ]
+    # Load each file once first so that caches filled on first use aren't measured.
+    [results.load(text) for text in result_texts]
+    gc.collect()
+    tracemalloc.start()
+    loaded = [results.load(text) for _ in range(200) for text in result_texts]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    predictions = [prediction for result in loaded for prediction in result.predictions]
+    object_size = sum(map(sys.getsizeof, predictions))
+    print(
+        f"{len(predictions)} predictions: {size / len(predictions):.0f}B/prediction "
+        f"retained, {object_size / len(predictions):.0f}B/prediction in objects"
+    )
+
+    # About 2,000B/prediction is retained on CPython 3.11, and 2,050-2,100B without
+    # slots.
+    assert size / len(predictions) < 2030
+    assert not any(hasattr(prediction, "__dict__") for prediction in predictions)
+    labels_by_value = {prediction.label: prediction.label for prediction in predictions}
+    assert all(
+        prediction.label is labels_by_value[prediction.label]
+        and all(
+            label is labels_by_value.get(label, label)
+            for label in prediction.confidences
+        )
+        for prediction in predictions
+    )
+
+
+@pytest.mark.parametrize("result_file", list(data_folder.glob("*.json")))
+def test_json_backend(result_file: Path) -> None:
+    """
+    Compare loading each result file with the standard library and the default
+    JSON backend.
+    """
+    text = result_file.read_text()
+    default = jsonbackend.backend
+
+    def load_time(backend: str) -> float:
+        jsonbackend.use(backend)
+
+        try:
+            return min(timeit.repeat(lambda: results.load(text), number=20, repeat=5))
+        finally:
+            jsonbackend.use(default)
+
+    stdlib_time = load_time("json")
+    default_time = load_time(default)
+    print(
+        f"{result_file.name}: json {stdlib_time / 20 * 1e6:.0f}µs, "
+        f"{default} {default_time / 20 * 1e6:.0f}µs"
+    )
+
+
+def test_to_v3_changes() -> None:
+    """
+    Create changes for a bundle of 1,000 documents. Check them against filtering the
+    predictions for each document on a bundle of 100 documents, which takes time
+    quadratic in the number of documents.
+    """
+    result = results.Result.from_v3_dict(_bundle(1000))
+    small_result = results.Result.from_v3_dict(_bundle(100))
+
+    def per_document(result: results.Result) -> "list[dict[str, object]]":
+        changes = []
+
+        for document in result.documents:
+            document_predictions = [
+                prediction
+                for prediction in result.predictions
+                if prediction.document == document
+            ]
+            model_results: "dict[str, list[object]]" = {
+                model_id: [] for model_id in sorted(document._model_sections)
+            }
+
+            for prediction in document_predictions:
+                model_results[str(prediction.model.id)].append(prediction.to_v3_dict())
+
+            changes.append(
+                {
+                    "submissionfile_id": document.id,
+                    "model_results": model_results,
+                    "component_results": {},
+                }
+            )
+
+        return changes
+
+    def single_pass() -> "list[dict[str, object]]":
+        return result.predictions.to_v3_changes(result.documents)
+
+    def serialized() -> str:
+        return result.predictions.to_v3_changes(result.documents, serialize=True)
+
+    assert small_result.predictions.to_v3_changes(
+        small_result.documents
+    ) == per_document(small_result)
+    assert jsonbackend.loads(serialized()) == single_pass()
+    per_document_time = min(
+        timeit.repeat(lambda: per_document(small_result), number=1, repeat=1)
+    )
+    single_pass_time = min(timeit.repeat(single_pass, number=1, repeat=3))
+    serialized_time = min(timeit.repeat(serialized, number=1, repeat=3))
+    dumps_time = min(
+        timeit.repeat(lambda: jsonbackend.dumps(single_pass()), number=1, repeat=3)
+    )
+    print(
+        f"{len(result.predictions)} predictions: single pass {single_pass_time:.3f}s, "
+        f"serialized {serialized_time:.3f}s (vs {dumps_time:.3f}s); "
+        f"{len(small_result.predictions)} predictions: per document "
+        f"{per_document_time:.3f}s"
+    )
+
+
+def test_load_many(tmp_path: Path) -> None:
+    """
+    Load 100 result files in a process pool and compare against loading them one at a
+    time.
+    """
+    result_json = json.dumps(_bundle(20))
+    result_files = [tmp_path / f"{index}.json" for index in range(100)]
+
+    for result_file in result_files:
+        result_file.write_text(result_json)
+
+    def serial() -> "list[tuple[object, object]]":
+        return list(results.load_many(result_files, reader=Path.read_text))
+
+    def parallel() -> "list[tuple[object, object]]":
+        return list(results.load_many(result_files, reader=Path.read_text, workers=4))
+
+    assert parallel() == serial()
+    serial_time = min(timeit.repeat(serial, number=1, repeat=3))
+    parallel_time = min(timeit.repeat(parallel, number=1, repeat=3))
+    print(
+        f"{os.cpu_count()} cores: serial {serial_time:.2f}s, "
+        f"4 workers {parallel_time:.2f}s"
+    )
+
+
+def test_to_frame(
+    mixed_predictions: "results.PredictionList[results.Prediction]",
+) -> None:
+    """
+    Create a frame from about 50,000 predictions of every type and compare against
+    reading attributes into a list of dicts.
+    """
+    pandas = pytest.importorskip("pandas")
+
+    def row(prediction: results.Prediction) -> "dict[str, object]":
+        extraction = isinstance(prediction, results.Extraction)
+        form_extraction = isinstance(prediction, results.FormExtraction)
+        span = box = None
+
+        if form_extraction and prediction.box != results.NULL_BOX:
+            box = prediction.box
+        elif extraction and not form_extraction and prediction.span:
+            span = prediction.span
+
+        return {
+            "document_id": prediction.document.id,
+            "document_name": prediction.document.name,
+            "model_id": prediction.model.id,
+            "model_name": prediction.model.name,
+            "model_type": prediction.model.type.value,
+            "review_id": prediction.review.id if prediction.review else None,
+            "review_type": (
+                prediction.review.type.value if prediction.review else None
+            ),
+            "prediction_type": type(prediction).__name__,
+            "label": prediction.label,
+            "confidence": prediction.confidence,
+            "text": prediction.text if extraction else None,
+            "accepted": prediction.accepted if extraction else None,
+            "rejected": prediction.rejected if extraction else None,
+            "page": (span or box).page if span or box else None,
+            "pages": (
+                prediction.pages if isinstance(prediction, results.Unbundling) else None
+            ),
+            "start": span.start if span else None,
+            "end": span.end if span else None,
+            "top": box.top if box else None,
+            "left": box.left if box else None,
+            "right": box.right if box else None,
+            "bottom": box.bottom if box else None,
+            "form_type": prediction.type.value if form_extraction else None,
+            "checked": prediction.checked if form_extraction else None,
+            "signed": prediction.signed if form_extraction else None,
+        }
+
+    def loop() -> "pandas.DataFrame":
+        return pandas.DataFrame(list(map(row, mixed_predictions)))
+
+    def columnar() -> "pandas.DataFrame":
+        return mixed_predictions.to_frame()
+
+    assert (
+        columnar()
+        .astype(object)
+        .where(columnar().notna(), None)
+        .equals(loop().astype(object).where(loop().notna(), None))
+    )
+    loop_time = min(timeit.repeat(loop, number=1, repeat=3))
+    columnar_time = min(timeit.repeat(columnar, number=1, repeat=3))
+    print(
+        f"{len(mixed_predictions)} predictions: loop {loop_time:.3f}s, "
+        f"columnar {columnar_time:.3f}s"
+    )
+
+
+def test_apply_thresholds() -> None:
+    """
+    Apply per-label thresholds to a bundle with about 46,000 predictions and compare
+    against filtering by each label and against a loop over the predictions.
+    """
+    predictions = results.Result.from_v3_dict(_bundle(2000)).predictions
+    labels = sorted({prediction.label for prediction in predictions.extractions})
+    accept = {
+        label: 0.5 + index / (2 * len(labels)) for index, label in enumerate(labels)
+    }
+    reject = {label: threshold - 0.3 for label, threshold in accept.items()}
+
+    def flags() -> "list[tuple[bool, bool]]":
+        return [
+            (extraction.accepted, extraction.rejected)
+            for extraction in predictions.extractions
+        ]
+
+    def loop() -> None:
+        for prediction in predictions:
+            if isinstance(prediction, results.Extraction):
+                if prediction.label in accept and (
+                    prediction.confidence >= accept[prediction.label]
+                ):
+                    prediction.accept()
+                elif prediction.label in reject and (
+                    prediction.confidence < reject[prediction.label]
+                ):
+                    prediction.reject()
+
+    def where() -> None:
+        for label in labels:
+            predictions.where(label=label, min_confidence=accept[label]).accept()
+            predictions.where(
+                label=label,
+                predicate=lambda prediction: prediction.confidence < reject[label],
+            ).reject()
+
+    def apply_thresholds() -> None:
+        predictions.apply_thresholds(accept=accept, reject=reject)
+
+    predictions.unaccept().unreject()
+    loop()
+    expected = flags()
+    predictions.unaccept().unreject()
+    apply_thresholds()
+    assert flags() == expected
+    assert any(accepted for accepted, _ in expected)
+    assert any(rejected for _, rejected in expected)
+
+    loop_time = min(timeit.repeat(loop, number=1, repeat=5))
+    where_time = min(timeit.repeat(where, number=1, repeat=5))
+    apply_thresholds_time = min(timeit.repeat(apply_thresholds, number=1, repeat=5))
+    print(
+        f"{len(predictions)} predictions: loop {loop_time * 1e3:.1f}ms, "
+        f"where {where_time * 1e3:.1f}ms, "
+        f"apply_thresholds {apply_thresholds_time * 1e3:.1f}ms"
+    )
+
+
+def test_review_diff() -> None:
+    """
+    Diff predictions before and after review for bundles of 100 and 1,000 documents,
+    check that the time per prediction stays roughly constant, and compare against
+    matching predictions with nested loops.
+    """
+    times_per_prediction = {}
+
+    for document_count in (100, 1000):
+        result = results.Result.from_v3_dict(_bundle(document_count))
+        review_diff_time = min(timeit.repeat(result.review_diff, number=1, repeat=3))
+        times_per_prediction[document_count] = review_diff_time / len(
+            result.predictions
+        )
+
+    pre_review, final = result.pre_review[:2000], result.final[:2000]
+
+    def nested_loops() -> "tuple[int, int, int]":
+        unmatched = list(pre_review)
+        changed = unchanged = 0
+
+        for after in final:
+            for before in unmatched:
+                if results.review_key(before) == results.review_key(after) and (
+                    results.review_location(before) == results.review_location(after)
+                ):
+                    unmatched.remove(before)
+
+                    if results.review_value(before) == results.review_value(after):
+                        unchanged += 1
+                    else:
+                        changed += 1
+
+                    break
+
+        return len(unmatched), changed, unchanged
+
+    def diff() -> "tuple[int, int, int]":
+        diff = pre_review.diff(final)
+        return len(diff.removed), len(diff.changed), len(diff.unchanged)
+
+    assert diff() == nested_loops()
+    nested_loops_time = min(timeit.repeat(nested_loops, number=1, repeat=1))
+    diff_time = min(timeit.repeat(diff, number=1, repeat=3))
+    print(
+        ", ".join(
+            f"{document_count} documents: {time_per_prediction * 1e6:.1f}µs/prediction"
+            for document_count, time_per_prediction in times_per_prediction.items()
+        )
+        + f"; 2,000 predictions: nested loops {nested_loops_time:.3f}s, "
+        f"diff {diff_time:.3f}s"
+    )
+
+    assert times_per_prediction[1000] < times_per_prediction[100] * 3
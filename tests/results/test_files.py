@@ -1,8 +1,12 @@
+import asyncio
+import copy
+import json
 from pathlib import Path
 
 import pytest
 
-from indico_toolkit import results
+from indico_toolkit import jsonbackend, results
+from indico_toolkit.results.frames import COLUMNS, prediction_columns
 
 data_folder = Path(__file__).parent.parent / "data" / "results"
 
@@ -10,5 +14,238 @@ data_folder = Path(__file__).parent.parent / "data" / "results"
 @pytest.mark.parametrize("result_file", list(data_folder.glob("*.json")))
 def test_file_load(result_file: Path) -> None:
     result = results.load(result_file, reader=Path.read_text)
-    result.pre_review.to_changes(result)
+    changes = result.pre_review.to_changes(result)
+    serialized = result.pre_review.to_changes(result, serialize=True)
     assert result.version
+    assert jsonbackend.loads(serialized) == changes
+
+
+@pytest.mark.parametrize("result_file", list(data_folder.glob("*.json")))
+def test_file_load_does_not_modify(result_file: Path) -> None:
+    result_dict = json.loads(result_file.read_text())
+    original = copy.deepcopy(result_dict)
+
+    first = results.load(result_dict)
+    second = results.load(result_dict)
+    first.predictions.to_changes(first)
+    assert first == second
+
+    for extraction in first.predictions.extractions:
+        extraction.text = "changed"
+
+    for form_extraction in first.predictions.form_extractions:
+        form_extraction.checked = not form_extraction.checked
+        form_extraction.signed = not form_extraction.signed
+
+    first.predictions.to_changes(first)
+    assert result_dict == original
+    assert second == results.load(original)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many(workers: int, tmp_path: Path) -> None:
+    result_files = sorted(data_folder.glob("*.json"))
+    unsupported_file = tmp_path / "unsupported.json"
+    unsupported_file.write_text("{}")
+    sources = [*result_files, data_folder / "missing.json", unsupported_file]
+    expected = [results.load(file, reader=Path.read_text) for file in result_files]
+
+    loaded = list(results.load_many(sources, reader=Path.read_text, workers=workers))
+    assert [source for source, _ in loaded] == sources
+    assert [result for _, result in loaded[:-2]] == expected
+    assert isinstance(loaded[-2][1], FileNotFoundError)
+    assert isinstance(loaded[-1][1], results.ResultError)
+
+    unordered = results.load_many(
+        result_files, reader=Path.read_text, workers=workers, ordered=False
+    )
+    assert sorted(unordered) == sorted(zip(result_files, expected))
+
+
+def test_load_many_workers() -> None:
+    with pytest.raises(ValueError):
+        results.load_many([], workers=0)
+
+
+@pytest.mark.asyncio
+async def test_load_many_async() -> None:
+    result_files = sorted(data_folder.glob("*.json"))
+    sources = [*result_files, data_folder / "missing.json"]
+    expected = [results.load(file, reader=Path.read_text) for file in result_files]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def read_text_async(path: Path) -> str:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return path.read_text()
+
+    loaded = [
+        pair
+        async for pair in results.load_many_async(
+            sources, reader=read_text_async, max_concurrency=3
+        )
+    ]
+    assert [source for source, _ in loaded] == sources
+    assert [result for _, result in loaded[:-1]] == expected
+    assert isinstance(loaded[-1][1], FileNotFoundError)
+    assert max_in_flight == 3
+
+    unordered = [
+        pair
+        async for pair in results.load_many_async(
+            result_files, reader=read_text_async, ordered=False
+        )
+    ]
+    assert sorted(unordered) == sorted(zip(result_files, expected))
+
+    async def read_first_text(path: Path) -> str:
+        if path != result_files[0]:
+            await asyncio.sleep(60)
+
+        return path.read_text()
+
+    # Closing the generator early cancels and waits for the reads still in flight.
+    pairs = results.load_many_async(result_files, reader=read_first_text)
+    await pairs.__anext__()
+    await pairs.aclose()
+    assert all(
+        task.done()
+        for task in asyncio.all_tasks()
+        if task is not asyncio.current_task()
+    )
+
+
+def _expected_row(prediction: results.Prediction) -> "dict[str, object]":
+    row: "dict[str, object]" = dict.fromkeys(COLUMNS)
+    row.update(
+        document_id=prediction.document.id,
+        document_name=prediction.document.name,
+        model_id=prediction.model.id,
+        model_name=prediction.model.name,
+        model_type=prediction.model.type.value,
+        review_id=prediction.review.id if prediction.review else None,
+        review_type=prediction.review.type.value if prediction.review else None,
+        prediction_type=type(prediction).__name__,
+        label=prediction.label,
+        confidence=prediction.confidence,
+    )
+
+    if isinstance(prediction, results.Extraction):
+        row.update(
+            text=prediction.text,
+            accepted=prediction.accepted,
+            rejected=prediction.rejected,
+        )
+
+    if isinstance(prediction, results.FormExtraction):
+        row.update(
+            form_type=prediction.type.value,
+            checked=prediction.checked,
+            signed=prediction.signed,
+        )
+
+        if prediction.box != results.NULL_BOX:
+            row.update(
+                page=prediction.box.page,
+                top=prediction.box.top,
+                left=prediction.box.left,
+                right=prediction.box.right,
+                bottom=prediction.box.bottom,
+            )
+    elif isinstance(prediction, results.Extraction):
+        if prediction.span != results.NULL_SPAN:
+            row.update(
+                page=prediction.span.page,
+                start=prediction.span.start,
+                end=prediction.span.end,
+            )
+    elif isinstance(prediction, results.Unbundling):
+        row.update(pages=prediction.pages)
+
+    return row
+
+
+@pytest.mark.parametrize("result_file", list(data_folder.glob("*.json")))
+def test_prediction_columns(result_file: Path) -> None:
+    result = results.load(result_file, reader=Path.read_text)
+    columns = prediction_columns(result.predictions)
+
+    assert list(columns) == list(COLUMNS)
+    assert [dict(zip(columns, row)) for row in zip(*columns.values())] == list(
+        map(_expected_row, result.predictions)
+    )
+
+
+def test_to_frame() -> None:
+    pandas = pytest.importorskip("pandas")
+    loaded = [
+        results.load(result_file, reader=Path.read_text)
+        for result_file in sorted(data_folder.glob("*.json"))
+    ]
+    frame = results.to_frame(loaded)
+
+    assert list(frame.columns) == ["submission_id", *COLUMNS]
+    assert len(frame) == sum(len(result.predictions) for result in loaded)
+    assert frame["submission_id"].tolist() == [
+        result.submission_id for result in loaded for _ in result.predictions
+    ]
+    pandas.testing.assert_frame_equal(
+        frame.drop(columns="submission_id"),
+        pandas.concat([result.predictions.to_frame() for result in loaded]).reset_index(
+            drop=True
+        ),
+    )
+    assert str(frame["confidence"].dtype) == "float64"
+    assert str(frame["start"].dtype) == "Int64"
+
+
+def test_to_arrow() -> None:
+    pytest.importorskip("pyarrow")
+    result = results.load(data_folder / "2914_v3_accepted.json", reader=Path.read_text)
+    table = result.predictions.to_arrow()
+
+    assert table.column_names == list(COLUMNS)
+    assert table.to_pydict() == prediction_columns(result.predictions)
+    assert results.to_arrow([result]).column("submission_id").to_pylist() == [
+        result.submission_id
+    ] * len(result.predictions)
+
+
+def test_review_diff() -> None:
+    loaded = [
+        results.load(result_file, reader=Path.read_text)
+        for result_file in sorted(data_folder.glob("*.json"))
+    ]
+
+    for result in loaded:
+        diff = result.review_diff()
+        assert len(diff.removed) + len(diff.changed) + len(diff.unchanged) == len(
+            result.pre_review
+        )
+        assert len(diff.added) + len(diff.changed) + len(diff.unchanged) == len(
+            result.final
+        )
+
+    genai = results.load(data_folder / "96127_v3_genai.json", reader=Path.read_text)
+    (change,) = genai.review_diff().changed
+    before, after = change
+
+    # Reviewed summarizations have no citations, so they're matched by label.
+    assert before.label == after.label == "Purchase Order Number"
+    assert (before.text, after.text) == ("29111525 [1]", "29111525")
+    assert before.citations and not after.citations
+
+    counts = results.review_diff_counts(loaded)
+    assert counts["Purchase Order Number"] == {
+        "added": 0,
+        "removed": 0,
+        "changed": 1,
+        "unchanged": 0,
+    }
+    assert sum(label_counts["removed"] for label_counts in counts.values()) == sum(
+        len(result.review_diff().removed) for result in loaded
+    )
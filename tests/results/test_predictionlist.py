@@ -1,3 +1,4 @@
+from dataclasses import replace
 from operator import attrgetter
 
 import pytest
@@ -11,9 +12,11 @@ from indico_toolkit.results import (
     ModelGroupType,
     Prediction,
     PredictionList,
+    Result,
     Review,
     ReviewType,
     Span,
+    Unbundling,
 )
 
 
@@ -279,3 +282,189 @@ def test_where_rejected(predictions: "PredictionList[Prediction]") -> None:
 
     assert predictions.where(rejected=False) == []
     assert predictions.where(rejected=True) == [first_name, last_name]
+
+
+def test_apply_thresholds(predictions: "PredictionList[Prediction]") -> None:
+    first_name, last_name = predictions.extractions
+
+    counts = predictions.apply_thresholds(
+        accept={"First Name": 0.9, "Last Name": 0.9, "1040": 0.5},
+        reject={"First Name": 0.85},
+    )
+
+    assert counts == {
+        "First Name": {"accepted": 0, "rejected": 1},
+        "Last Name": {"accepted": 1, "rejected": 0},
+        "1040": {"accepted": 0, "rejected": 0},
+    }
+    assert first_name.rejected and not first_name.accepted
+    assert last_name.accepted and not last_name.rejected
+
+    counts = predictions.apply_thresholds(accept={"First Name": 0.8})
+
+    assert counts == {"First Name": {"accepted": 1, "rejected": 0}}
+    assert first_name.accepted and not first_name.rejected
+    assert predictions.apply_thresholds() == {}
+
+
+def test_diff(predictions: "PredictionList[Prediction]", document: Document) -> None:
+    classification, first_name, last_name = predictions
+    moved_first_name = replace(
+        first_name, spans=[Span(page=0, start=350, end=354)], text="Jon"
+    )
+    moved_document = replace(document, id=2923)
+    added = replace(last_name, document=moved_document)
+    reviewed = PredictionList([last_name, moved_first_name, added])
+
+    diff = predictions.diff(reviewed)
+
+    assert diff.added == [added]
+    assert diff.removed == [classification]
+    assert diff.changed == [(first_name, moved_first_name)]
+    assert diff.unchanged == [(last_name, last_name)]
+    assert diff.counts() == {
+        "1040": {"added": 0, "removed": 1, "changed": 0, "unchanged": 0},
+        "First Name": {"added": 0, "removed": 0, "changed": 1, "unchanged": 0},
+        "Last Name": {"added": 1, "removed": 0, "changed": 0, "unchanged": 1},
+    }
+
+    # Predictions at the same location are matched before others with the same key.
+    duplicate = replace(first_name, spans=[Span(page=0, start=340, end=344)])
+    diff = PredictionList([duplicate, first_name]).diff(PredictionList([first_name]))
+
+    assert diff.unchanged == [(first_name, first_name)]
+    assert diff.removed == [duplicate]
+
+    # Predictions with the same value are matched before the rest in order, so
+    # deleting one extraction doesn't pair the next with it when its spans are lost.
+    alice = replace(first_name, text="Alice", spans=[Span(page=0, start=10, end=15)])
+    bob = replace(first_name, text="Bob", spans=[Span(page=0, start=20, end=23)])
+    reviewed_bob = replace(bob, spans=[])
+    diff = PredictionList([alice, bob]).diff(PredictionList([reviewed_bob]))
+
+    assert diff.removed == [alice]
+    assert diff.unchanged == [(bob, reviewed_bob)]
+    assert not diff.added and not diff.changed
+
+
+def test_indexed_filters(
+    predictions: "PredictionList[Prediction]",
+    document: Document,
+    extraction_model: ModelGroup,
+    auto_review: Review,
+) -> None:
+    classification, first_name, last_name = predictions
+
+    # Indexes are built the second time they're needed.
+    for _ in range(2):
+        assert predictions.where(document=document) == predictions
+        assert predictions.where(model=extraction_model) == [first_name, last_name]
+        assert predictions.where(model="Tax Classification") == [classification]
+        assert predictions.where(review=None) == [classification]
+        assert predictions.where(review_in={auto_review, ReviewType.MANUAL}) == [
+            first_name,
+            last_name,
+        ]
+        assert predictions.where(
+            model=ModelGroupType.DOCUMENT_EXTRACTION, review=ReviewType.AUTO
+        ) == [first_name]
+        assert predictions.oftype(DocumentExtraction) == [first_name, last_name]
+        assert predictions.groupby(attrgetter("review")) == {
+            None: [classification],
+            auto_review: [first_name],
+            last_name.review: [last_name],
+        }
+
+
+def test_indexes_are_invalidated(
+    predictions: "PredictionList[Prediction]", document: Document
+) -> None:
+    classification, first_name, last_name = predictions
+
+    for _ in range(2):
+        assert predictions.where(review=None) == [classification]
+
+    predictions.append(
+        Classification(
+            document=document,
+            model=classification.model,
+            review=None,
+            label="W2",
+            confidences={"W2": 0.6},
+            extras={},
+        )
+    )
+    assert predictions.where(review=None) == [classification, predictions[-1]]
+
+    del predictions[0]
+    assert predictions.where(review=None) == [predictions[-1]]
+    assert predictions.where(model=classification.model) == [predictions[-1]]
+
+    predictions.reverse()
+    assert predictions.oftype(DocumentExtraction) == [last_name, first_name]
+    assert predictions.oftype(DocumentExtraction) == [last_name, first_name]
+
+
+def test_result_review_lists(
+    predictions: "PredictionList[Prediction]",
+    document: Document,
+    classification_model: ModelGroup,
+    extraction_model: ModelGroup,
+    auto_review: Review,
+    manual_review: Review,
+) -> None:
+    classification, first_name, last_name = predictions
+    result = Result(
+        version=3,
+        submission_id=1,
+        documents=(document,),
+        models=(classification_model, extraction_model),
+        predictions=predictions,
+        reviews=(auto_review, manual_review),
+    )
+
+    # Each access returns a new list that can be modified without affecting the next.
+    final = result.final
+    assert final == [last_name]
+    assert final is not result.final
+    final.clear()
+    assert result.final == [last_name]
+    assert result.final.where(document=document) == [last_name]
+    assert result.final.where(document=document) == [last_name]
+    assert result.pre_review == [classification]
+    assert result.auto_review == [first_name]
+    assert result.manual_review == [last_name]
+    assert result.admin_review == []
+
+    # Modifying the result's predictions discards the lists built from them.
+    predictions.remove(last_name)
+    assert result.final == []
+    assert result.final.where(document=document) == []
+
+
+def test_where_type_specific_filters(
+    predictions: "PredictionList[Prediction]",
+    document: Document,
+    classification_model: ModelGroup,
+) -> None:
+    classification, first_name, last_name = predictions
+    unbundling = Unbundling(
+        document=document,
+        model=classification_model,
+        review=None,
+        label="1040",
+        confidences={"1040": 0.7},
+        extras={},
+        pages=[1, 2],
+    )
+    predictions.append(unbundling)
+
+    # Filters that only apply to some types exclude every other type.
+    for _ in range(2):
+        assert predictions.where(page=1) == [last_name, unbundling]
+        assert predictions.where(page_in={0, 2}) == [first_name, unbundling]
+        assert predictions.where(accepted=False, page=0) == [first_name]
+        assert predictions.where(checked=False) == []
+        assert predictions.where(
+            lambda prediction: prediction.label == "1040", page_in=(2,)
+        ) == [unbundling]
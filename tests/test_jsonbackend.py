@@ -0,0 +1,86 @@
+import importlib.util
+import io
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from indico_toolkit import jsonbackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+data_folder = Path(__file__).parent / "data" / "results"
+installed_backends = [
+    backend
+    for backend in jsonbackend.BACKENDS
+    if backend == "json" or importlib.util.find_spec(backend)
+]
+
+
+@pytest.fixture(params=installed_backends)
+def backend(request: pytest.FixtureRequest) -> "Iterator[str]":
+    default = jsonbackend.backend
+    jsonbackend.use(request.param)
+    yield request.param
+    jsonbackend.use(default)
+
+
+def test_default_backend() -> None:
+    assert jsonbackend.backend == installed_backends[0]
+
+
+@pytest.mark.parametrize("result_file", list(data_folder.glob("*.json")))
+def test_round_trip(backend: str, result_file: Path) -> None:
+    text = result_file.read_text()
+    value = json.loads(text)
+
+    assert jsonbackend.loads(text) == value
+    assert jsonbackend.loads(text.encode()) == value
+    assert jsonbackend.loads(memoryview(text.encode())) == value
+    assert jsonbackend.load(io.BytesIO(text.encode())) == value
+    assert json.loads(jsonbackend.dumps(value)) == value
+    assert json.loads(jsonbackend.dumpb(value)) == value
+
+
+def test_unsupported_values(backend: str) -> None:
+    value = {"big": 2**70, "text": "naïve/€"}
+
+    assert json.loads(jsonbackend.dumps(value)) == value
+
+    with pytest.raises(ValueError):
+        jsonbackend.loads("{")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": NaN}',
+        "[Infinity, -Infinity, 1e400]",
+        "123456789012345678901234567890",
+        '{"id": -98765432109876543210, "ids": [18446744073709551616]}',
+        '["12345678901234567890123", 0.123456789012345678901234]',
+    ],
+)
+def test_stdlib_values(backend: str, text: str) -> None:
+    value = json.loads(text)
+
+    for data in (text, text.encode(), memoryview(text.encode())):
+        assert repr(jsonbackend.loads(data)) == repr(value)
+
+
+def test_non_finite_floats(backend: str) -> None:
+    for value in (
+        float("nan"),
+        [float("inf"), None],
+        {"confidence": float("-inf"), "text": None},
+    ):
+        assert jsonbackend.dumps(value).replace(" ", "") == json.dumps(value).replace(
+            " ", ""
+        )
+
+
+def test_unsupported_backend() -> None:
+    with pytest.raises(ValueError):
+        jsonbackend.use("simplejson")